@@ -0,0 +1,169 @@
+"""
+Benchmark cases of the materials, failures and CLT hot paths.
+
+Every case is a function of its parameters returning the benchmarked callable
+and the number of items (materials, plies, stress states, load cases) it
+processes per call, so throughput is comparable across sizes.
+"""
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure, VonMisesFailure
+from pymaterial.combis.clt import Ply, Stackup
+
+CASES: List[Tuple[str, Callable, dict]] = []
+
+PLY_COUNTS = [1, 10, 100, 1000]
+LOAD_COUNTS = [1, 100, 10**4, 10**6]
+STRESS_COUNTS = [1, 10**3, 10**6]
+
+
+def register(name: str, **grid: List):
+    """
+    Register a case for every value of its single parameter.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if not grid:
+            CASES.append((name, function, dict()))
+        for key, values in grid.items():
+            for value in values:
+                CASES.append((f"{name}[{key}={value}]", function, {key: value}))
+        return function
+
+    return decorator
+
+
+def get_material(failures=True) -> TransverselyIsotropicMaterial:
+    return TransverselyIsotropicMaterial(
+        E_l=141000.0,
+        E_t=9340.0,
+        nu_lt=0.35,
+        G_lt=4500.0,
+        density=1.7e-9,
+        failures=get_failures() if failures else None,
+    )
+
+
+def get_failures() -> list:
+    return [
+        MaxStressFailure([1500.0, 50.0, 70.0]),
+        VonMisesFailure(100.0),
+        CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+    ]
+
+
+def get_stackup(n_plies: int) -> Stackup:
+    material = get_material()
+    angles = np.resize([0.0, 45.0, -45.0, 90.0], n_plies)
+    return Stackup([Ply(material, 0.125, angle, degree=True) for angle in angles])
+
+
+def get_loads(n_loads: int) -> np.ndarray:
+    return np.random.default_rng(0).normal(0.0, 50.0, size=(n_loads, 6))
+
+
+def get_stresses(n_stresses: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    stresses = rng.normal(0.0, 20.0, size=(n_stresses, 3))
+    strains = rng.normal(0.0, 1e-3, size=(n_stresses, 3))
+    return stresses, strains
+
+
+@register("material.construct")
+def material_construct(**_):
+    def run():
+        get_material(failures=False).get_plane_strain_stiffness()
+
+    return run, 1
+
+
+@register("ply.get_stiffness")
+def ply_stiffness(**_):
+    material = get_material()
+
+    def run():
+        Ply(material, 0.125, 0.3).get_stiffness()
+
+    return run, 1
+
+
+@register("stackup.get_abd", plies=PLY_COUNTS)
+def stackup_abd(plies: int):
+    material = get_material()
+    angles = np.resize([0.0, 45.0, -45.0, 90.0], plies)
+    layup = [Ply(material, 0.125, angle, degree=True) for angle in angles]
+
+    def run():
+        Stackup(layup).get_abd()
+
+    return run, plies
+
+
+for _failure in get_failures():
+    _key = type(_failure).__name__
+
+    def _scalar(failure=_failure, **_):
+        stresses, strains = get_stresses(1)
+
+        def run():
+            failure.get_failure(stresses[0], strains[0])
+
+        return run, 1
+
+    def _batch(stresses: int, failure=_failure):
+        values = get_stresses(stresses)
+
+        def run():
+            failure.get_batch_failure(*values)
+
+        return run, stresses
+
+    register(f"failure.{_key}.scalar")(_scalar)
+    register(f"failure.{_key}.batch", stresses=STRESS_COUNTS)(_batch)
+
+
+@register("chain.analyze", plies=PLY_COUNTS)
+def chain_plies(plies: int):
+    stackup = get_stackup(plies)
+    loads = get_loads(1000)
+
+    def run():
+        stackup.analyze(loads, failures_only=True)
+
+    return run, len(loads)
+
+
+@register("chain.envelope", loads=LOAD_COUNTS)
+def chain_loads(loads: int):
+    stackup = get_stackup(8)
+    cases = get_loads(loads)
+
+    def run():
+        stackup.get_envelope(cases, chunk_size=65536)
+
+    return run, loads
+
+
+@register("chain.scalar")
+def chain_scalar(**_):
+    stackup = get_stackup(8)
+    load = get_loads(1)[0]
+
+    def run():
+        strains = stackup.get_strains(stackup.apply_load(load))
+        stackup.get_failure(stackup.get_stresses(strains), strains)
+
+    return run, 1
+
+
+def get_cases(pattern: str = "", max_size: int = 0) -> Dict[str, Tuple]:
+    """
+    Cases whose name contains the pattern, optionally limited in size.
+    """
+    return {
+        name: (function, params)
+        for name, function, params in CASES
+        if pattern in name
+        and (max_size <= 0 or all(value <= max_size for value in params.values()))
+    }
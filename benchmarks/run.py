@@ -0,0 +1,193 @@
+"""
+Run the benchmark cases and compare them against a stored baseline.
+
+Examples
+--------
+Run everything and compare against the baseline (exit code 1 on regressions)::
+
+    python benchmarks/run.py
+
+Quick run of the CLT cases with at most 10^4 items, store as new baseline::
+
+    python benchmarks/run.py --filter chain --max-size 10000 --save
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from typing import Callable, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from cases import get_cases  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# cases evaluating failure criteria
+CRITERION_CASES = ("failure.", "chain.")
+
+
+def measure(run: Callable, min_time: float = 0.2, repeat: int = 3) -> dict:
+    """
+    Best time per call and peak traced memory of a benchmarked callable.
+    Parameters
+    ----------
+    run : Callable
+        benchmarked callable without arguments
+    min_time : float, optional
+        minimal duration of one timing loop in [s], default 0.2
+    repeat : int, optional
+        number of timing loops, the fastest counts, default 3
+    Returns
+    -------
+    dict
+        "time" per call in [s] and "peak_memory" in [B]
+    """
+    # calibrate the number of calls per loop, also warms up caches
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        duration = time.perf_counter() - start
+        if duration >= min_time or number >= 10**6:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+
+    times = [duration / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - start) / number)
+
+    # memory is traced separately, tracing slows the calls down
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(time=min(times), peak_memory=peak)
+
+
+def compare(
+    result: dict, baseline: Optional[dict], threshold: float
+) -> Optional[float]:
+    """
+    Relative slowdown against the baseline, None if the case has no baseline.
+    Notes
+    -----
+    Sets "regression" of the result if the time per call or the peak memory
+    grew by more than the threshold, "memory_change" holds the relative
+    change of the peak memory.
+    """
+    if baseline is None:
+        return None
+    change = result["time"] / baseline["time"] - 1.0
+    memory_change = 0.0
+    if baseline.get("peak_memory"):
+        memory_change = result["peak_memory"] / baseline["peak_memory"] - 1.0
+    result["memory_change"] = memory_change
+    result["regression"] = change > threshold or memory_change > threshold
+    return change
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", default="", help="only cases containing this")
+    parser.add_argument(
+        "--max-size", type=int, default=0, help="skip cases with more items"
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline json file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="flag cases slower or with more peak memory than the baseline by this "
+        "fraction (default 0.25)",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument("--output", help="additionally write the results as json")
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, dict] = dict()
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+    results = dict()
+    header = (
+        f"{'case':48} {'time/call':>12} {'items/s':>12} {'peak MiB':>9} {'change':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, (function, params) in get_cases(args.filter, args.max_size).items():
+        with warnings.catch_warnings():
+            if name.startswith(CRITERION_CASES):
+                # random loadings leave the valid range of some criteria (NaN values)
+                warnings.simplefilter("ignore", RuntimeWarning)
+            run, items = function(**params)
+            result = measure(run, args.min_time, args.repeat)
+        result["throughput"] = items / result["time"]
+        change = compare(result, baseline.get(name), args.threshold)
+        results[name] = result
+        flag = ""
+        if change is not None:
+            flag = f"{change:+8.1%}"
+            if result["regression"]:
+                flag += " REGRESSION"
+            if result["memory_change"] > args.threshold:
+                flag += f" (peak memory {result['memory_change']:+.1%})"
+        print(
+            f"{name:48} {result['time']:12.3e} {result['throughput']:12.3e} "
+            f"{result['peak_memory'] / 2**20:9.2f} {flag}"
+        )
+
+    report = dict(
+        meta=dict(
+            python=platform.python_version(),
+            numpy=np.__version__,
+            platform=platform.platform(),
+            processor=platform.processor() or platform.machine(),
+            date=time.strftime("%Y-%m-%d"),
+        ),
+        results=results,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    regressions = [name for name, result in results.items() if result.get("regression")]
+    if args.save:
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                stored = json.load(file)
+            stored["results"].update(results)
+            report["results"] = stored["results"]
+        report["results"] = {
+            name: {
+                key: value
+                for key, value in result.items()
+                if key not in ("regression", "memory_change")
+            }
+            for name, result in report["results"].items()
+        }
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  {name}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
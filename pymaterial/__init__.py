@@ -0,0 +1,3 @@
+from pymaterial.profiling import enable_from_environment
+
+enable_from_environment()
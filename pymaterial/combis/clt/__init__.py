@@ -1,2 +1,12 @@
 from .ply import Ply  # noqa
 from .stackup import Stackup  # noqa
+from .envelope import Envelope  # noqa
+from .critical import CriticalLocations  # noqa
+from .parallel import ParallelExecutor  # noqa
+from .lamination import LaminationParameters  # noqa
+from .index import DesignIndex  # noqa
+from .zones import ZonedLaminate  # noqa
+from .notation import StackingSequence  # noqa
+from .optimization import StackingOptimizer  # noqa
+from .server import EvaluationServer, EvaluationClient  # noqa
+from .store import ResultStore  # noqa
@@ -0,0 +1,175 @@
+from typing import Optional, Union
+import numpy as np
+from .envelope import _apply_defined, _get_rank
+
+_AXES = ["ply", "point"]
+
+
+class CriticalLocations:
+    def __init__(self, k: int = 100):
+        """
+        The k most critical locations per criterion over streamed results.
+        Parameters
+        ----------
+        k : int, optional
+            number of kept locations per criterion, default 100
+        Notes
+        -----
+        A location is a combination of element, ply, sample point and load case.
+        Every chunk is reduced by **numpy.argpartition** to its k largest values,
+        which are partitioned together with the kept ones, so memory is
+        proportional to k and independent of the number of results. Only
+        **get_result()** sorts. Stresses and strains are kept for the
+        k locations only.
+        In contrast, **Envelope** keeps the worst load cases of every ply and
+        sample point.
+        A NaN failure value (failed evaluation of an overloaded ply) ranks as
+        the most critical value. Plies without a criterion, see **update()**,
+        are never ranked.
+        Examples
+        --------
+        >>> critical = CriticalLocations(k=100)
+        >>> defined = stackup.get_criteria()
+        >>> for start, result in stackup.analyze_stream("loads.npy"):
+        ...     critical.update(
+        ...         result["failures"], start, stresses=result["stresses"],
+        ...         defined=defined,
+        ...     )
+        >>> critical.get_result()["cuntze"]["ply"]
+        """
+        if k < 1:
+            raise ValueError(f"K has to be greater 0! (recieved: {k})")
+        self.k = k
+        self.count = 0
+        self.buffers = dict()
+
+    def update(
+        self,
+        failures: dict,
+        start: Optional[int] = None,
+        elements: Optional[Union[int, np.ndarray]] = None,
+        stresses: Optional[np.ndarray] = None,
+        strains: Optional[np.ndarray] = None,
+        defined: Optional[dict] = None,
+    ):
+        """
+        Reduce a chunk of failure values.
+        Parameters
+        ----------
+        failures : dict
+            failure id and values, dim=(n, n_plies, n_points) of **Stackup.analyze()**
+            or dim=(n,) of **Material.get_batch_failure()**
+        start : int, optional
+            index of the first load case of the chunk,
+            default continues after the previous chunk
+        elements : int or array, optional
+            element of all rows or per row, dim=(n,), default -1 (no element)
+        stresses : array, optional
+            stresses belonging to the failure values, dim=(n, ..., 3)
+        strains : array, optional
+            strains belonging to the failure values, dim=(n, ..., 3)
+        defined : dict, optional
+            failure id and mask of the plies with the criterion, dim=(n_plies,)
+            or (n_plies, n_points),
+            see **Stackup.get_criteria()**, default every NaN is a failure
+        """
+        if start is None:
+            start = self.count
+        for key, values in failures.items():
+            values = np.asarray(values)
+            n = len(values)
+            if n == 0:
+                continue
+            if values.ndim - 1 > len(_AXES):
+                raise ValueError(
+                    f"Failure values require dim=(n, n_plies, n_points)! "
+                    f"(Got: {values.shape})"
+                )
+            self.count = max(self.count, start + n)
+            if defined is not None:
+                values = _apply_defined(values, defined[key])
+            flat = values.reshape(-1)
+            size = flat.size // n
+            index = _get_largest(flat, self.k)
+
+            rows = index // size
+            location = np.zeros((len(index), values.ndim - 1), dtype=np.int64)
+            if values.ndim > 1:
+                location[:] = np.transpose(
+                    np.unravel_index(index % size, values.shape[1:])
+                )
+            element = -1 if elements is None else elements
+            candidate = dict(
+                value=flat[index],
+                case=start + rows,
+                element=np.broadcast_to(element, (n,))[rows].astype(np.int64),
+                location=location,
+            )
+            for name, states in (("stresses", stresses), ("strains", strains)):
+                if states is not None:
+                    candidate[name] = np.asarray(states).reshape(-1, 3)[index]
+            self._reduce(key, candidate)
+
+    def merge(self, other: "CriticalLocations"):
+        """
+        Merge the locations of other results, e.g. from a parallel worker.
+        Parameters
+        ----------
+        other : CriticalLocations
+            tracker with load case indices of the same numbering
+        """
+        for key, buffer in other.buffers.items():
+            self._reduce(key, buffer)
+        self.count = max(self.count, other.count)
+
+    def get_result(self) -> dict:
+        """
+        Returns the ranked locations.
+        Returns
+        -------
+        dict
+            failure id and dict with, sorted by descending value
+            - "value": failure value, dim=(k,)
+            - "case": index of the load case
+            - "element": element (-1 if not given)
+            - "ply", "point": ply and sample point (for stackup results)
+            - "stresses", "strains": dim=(k, 3) (if given)
+        Notes
+        -----
+        NaN values rank first, plies without criterion rank last and are
+        reported as NaN.
+        """
+        result = dict()
+        for key, buffer in self.buffers.items():
+            order = np.argsort(-_get_rank(buffer["value"]), kind="stable")
+            values = {name: array[order] for name, array in buffer.items()}
+            values["value"] = np.where(
+                np.isneginf(values["value"]), np.nan, values["value"]
+            )
+            location = values.pop("location")
+            for axis, name in enumerate(_AXES[: location.shape[1]]):
+                values[name] = location[:, axis]
+            result[key] = values
+        return result
+
+    def _reduce(self, key: str, candidate: dict):
+        if key in self.buffers:
+            buffer = self.buffers[key]
+            if set(buffer.keys()) != set(candidate.keys()):
+                raise ValueError(
+                    f"Stresses and strains have to be given for every update of "
+                    f"'{key}'!"
+                )
+            candidate = {
+                name: np.concatenate([buffer[name], candidate[name]]) for name in buffer
+            }
+        index = _get_largest(candidate["value"], self.k)
+        self.buffers[key] = {name: array[index] for name, array in candidate.items()}
+
+
+def _get_largest(values: np.ndarray, k: int) -> np.ndarray:
+    # unordered indices of the k largest values, see _get_rank
+    if len(values) <= k:
+        return np.arange(len(values))
+    rank = _get_rank(values)
+    return np.argpartition(rank, len(rank) - k)[len(rank) - k :]
@@ -0,0 +1,154 @@
+from typing import Optional
+import numpy as np
+
+
+class Envelope:
+    def __init__(self, top_k: Optional[int] = None):
+        """
+        Worst case envelope of failure values over streamed load cases.
+        Parameters
+        ----------
+        top_k : int, optional
+            additionally keep the k largest values and their load cases
+        Notes
+        -----
+        Memory is proportional to n_plies * n_points * n_criteria (* top_k),
+        independent of the number of load cases.
+        A NaN failure value (failed evaluation of an overloaded ply) ranks as
+        the worst value. Plies without a criterion, see **update()**, are
+        ignored and reported as NaN.
+        Examples
+        --------
+        >>> envelope = Envelope(top_k=5)
+        >>> defined = stackup.get_criteria()
+        >>> stream = stackup.analyze_stream("loads.npy", failures_only=True)
+        >>> for start, result in stream:
+        ...     envelope.update(result["failures"], start, defined)
+        >>> envelope.get_result()["cuntze"]["max"]
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"Top k has to be greater 0! (recieved: {top_k})")
+        self.top_k = top_k
+        self.count = 0
+        self.max = dict()
+        self.case = dict()
+        self.top = dict()
+        self.top_case = dict()
+
+    def update(
+        self,
+        failures: dict,
+        start: Optional[int] = None,
+        defined: Optional[dict] = None,
+    ):
+        """
+        Reduce a chunk of failure values into the envelope.
+        Parameters
+        ----------
+        failures : dict
+            failure id and values, dim=(n_cases, n_plies, n_points)
+        start : int, optional
+            index of the first load case of the chunk,
+            default continues after the previous chunk
+        defined : dict, optional
+            failure id and mask of the plies with the criterion, dim=(n_plies,)
+            or (n_plies, n_points),
+            see **Stackup.get_criteria()**, default every NaN is a failure
+        """
+        if start is None:
+            start = self.count
+        for key, values in failures.items():
+            if len(values) == 0:
+                continue
+            self.count = max(self.count, start + len(values))
+            values = _apply_defined(values, None if defined is None else defined[key])
+            case = np.argmax(_get_rank(values), axis=0)
+            value = np.take_along_axis(values, case[None], axis=0)[0]
+            self._reduce(key, value, case + start)
+
+            if self.top_k is not None:
+                cases = np.broadcast_to(
+                    np.arange(start, start + len(values)).reshape(
+                        (-1,) + (1,) * (values.ndim - 1)
+                    ),
+                    values.shape,
+                )
+                self._reduce_top(key, values, cases)
+
+    def merge(self, other: "Envelope"):
+        """
+        Merge the envelope of other load cases, e.g. from a parallel worker.
+        Parameters
+        ----------
+        other : Envelope
+            envelope with load case indices of the same numbering
+        """
+        for key in other.max:
+            self._reduce(key, other.max[key], other.case[key])
+            if self.top_k is not None and key in other.top:
+                self._reduce_top(key, other.top[key], other.top_case[key])
+        self.count = max(self.count, other.count)
+
+    def get_result(self) -> dict:
+        """
+        Returns the envelope.
+        Returns
+        -------
+        dict
+            failure id and dict with
+            - "max": largest value, dim=(n_plies, n_points)
+            - "case": index of the load case of the largest value
+            - "top": k largest values (descending), dim=(k, n_plies, n_points)
+            - "top_case": indices of the load cases of the k largest values
+        """
+        result = dict()
+        for key in self.max:
+            result[key] = dict(
+                max=np.where(np.isneginf(self.max[key]), np.nan, self.max[key]),
+                case=self.case[key],
+            )
+            if self.top_k is not None:
+                top = self.top[key]
+                result[key]["top"] = np.where(np.isneginf(top), np.nan, top)
+                result[key]["top_case"] = self.top_case[key]
+        return result
+
+    def _reduce(self, key: str, value: np.ndarray, case: np.ndarray):
+        if key not in self.max:
+            self.max[key] = value
+            self.case[key] = case
+            return
+        better = _get_rank(value) > _get_rank(self.max[key])
+        self.max[key] = np.where(better, value, self.max[key])
+        self.case[key] = np.where(better, case, self.case[key])
+
+    def _reduce_top(self, key: str, values: np.ndarray, cases: np.ndarray):
+        if key in self.top:
+            values = np.concatenate([self.top[key], values])
+            cases = np.concatenate([self.top_case[key], cases])
+        k = min(self.top_k, len(values))
+        rank = _get_rank(values)
+        order = np.argpartition(-rank, k - 1, axis=0)[:k]
+        top = np.take_along_axis(rank, order, axis=0)
+        order = np.take_along_axis(
+            order, np.argsort(-top, axis=0, kind="stable"), axis=0
+        )
+        self.top[key] = np.take_along_axis(values, order, axis=0)
+        self.top_case[key] = np.take_along_axis(cases, order, axis=0)
+
+
+def _apply_defined(values: np.ndarray, defined: Optional[np.ndarray]) -> np.ndarray:
+    # -inf for plies without the criterion, they never rank
+    values = np.asarray(values)
+    if defined is None:
+        return values
+    defined = np.asarray(defined, dtype=bool)
+    defined = defined.reshape(defined.shape + (1,) * (values.ndim - 1 - defined.ndim))
+    return np.where(defined, values, -np.inf).astype(values.dtype, copy=False)
+
+
+def _get_rank(values: np.ndarray) -> np.ndarray:
+    # ranking key of failure values, NaN (failed evaluation) > inf > finite
+    rank = np.asarray(values, dtype=float)
+    rank = np.where(np.isposinf(rank), np.finfo(float).max, rank)
+    return np.where(np.isnan(rank), np.inf, rank)
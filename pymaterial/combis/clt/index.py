@@ -0,0 +1,401 @@
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .stackup import Stackup
+from .lamination import LaminationParameters
+
+KINDS = ["abd", "lamination"]
+
+# upper triangle of the 3x3 blocks A, B and D
+_ROWS, _COLUMNS = np.triu_indices(3)
+
+
+def get_abd_vector(abd: np.ndarray, thickness: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Thickness normalized ABD-Matrix as vector.
+    Parameters
+    ----------
+    abd : array
+        ABD-Matrices, dim=(..., 6, 6)
+    thickness : float or array
+        laminate thickness, dim=(...)
+    Notes
+    -----
+    :math:`A^* = A / h`, :math:`B^* = 4 B / h^2` and :math:`D^* = 12 D / h^3`
+    share the unit of the ply stiffness, so laminates of different thickness
+    are compared by their stiffness distribution, equal to the lamination
+    parameters.
+    Returns
+    -------
+    array
+        upper triangles of :math:`A^*`, :math:`B^*` and :math:`D^*`, dim=(..., 18)
+    """
+    abd = np.asarray(abd, dtype=float)
+    h = np.asarray(thickness, dtype=float)[..., None]
+    return np.concatenate(
+        [
+            abd[..., _ROWS, _COLUMNS] / h,
+            4 * abd[..., _ROWS, _COLUMNS + 3] / h**2,
+            12 * abd[..., _ROWS + 3, _COLUMNS + 3] / h**3,
+        ],
+        axis=-1,
+    )
+
+
+def get_vector(stackup: Stackup, kind: str = "abd") -> np.ndarray:
+    """
+    Design vector of a stackup.
+    Parameters
+    ----------
+    stackup : Stackup
+        stackup
+    kind : str, optional
+        "abd": **get_abd_vector()** (18 values) or
+        "lamination": lamination parameters (12 values, one material), default "abd"
+    Returns
+    -------
+    array
+        design vector
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind '{kind}'! (Possible: {KINDS})")
+    if kind == "abd":
+        return get_abd_vector(stackup.get_abd(truncate=False), stackup.get_thickness())
+    return LaminationParameters.from_stackup(stackup).get_parameters()
+
+
+class DesignIndex:
+    def __init__(
+        self,
+        kind: str = "abd",
+        weights: Optional[np.ndarray] = None,
+        leaf_size: int = 32,
+        buffer_size: int = 1024,
+    ):
+        """
+        Spatial index of laminate designs for nearest neighbor searches.
+        Parameters
+        ----------
+        kind : str, optional
+            design vector of added stackups, see **get_vector()**, default "abd"
+        weights : array, optional
+            factors of the vector components in the euclidean distance,
+            default 1.0
+        leaf_size : int, optional
+            maximal number of designs per leaf of the KD-tree, default 32
+        buffer_size : int, optional
+            number of inserted designs kept outside the tree, default 1024
+        Notes
+        -----
+        The designs are stored in a KD-tree of numpy arrays, split at the
+        median of the widest dimension of each node. Queries first scan the
+        leaf of the target, then descend level by level with all nodes of a
+        level evaluated at once, skipping nodes whose bounding box is farther
+        than the current k-th distance or the radius.
+        Inserted designs are appended to a buffer that is searched by brute
+        force, the tree is rebuilt once the buffer is full.
+        Examples
+        --------
+        >>> index = DesignIndex()
+        >>> index.add(approved_stackups, ids=database_ids)
+        >>> index.save("designs.npz")
+        >>> distances, ids = DesignIndex.load("designs.npz").query(target, k=5)
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}'! (Possible: {KINDS})")
+        if leaf_size < 1:
+            raise ValueError(f"Leaf size has to be greater 0! (recieved: {leaf_size})")
+        self.kind = kind
+        self.weights = None if weights is None else np.asarray(weights, dtype=float)
+        self.leaf_size = leaf_size
+        self.buffer_size = buffer_size
+        self.vectors = None
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.size = 0
+        self.tree = None
+
+    def _get_vectors(
+        self, designs: Union[Sequence[Stackup], Stackup, np.ndarray]
+    ) -> np.ndarray:
+        if isinstance(designs, Stackup):
+            designs = [designs]
+        if len(designs) > 0 and isinstance(designs[0], Stackup):
+            designs = [get_vector(stackup, self.kind) for stackup in designs]
+        vectors = np.atleast_2d(np.asarray(designs, dtype=float))
+        if self.weights is not None:
+            vectors = vectors * self.weights
+        if self.vectors is not None and vectors.shape[1:] != self.vectors.shape[1:]:
+            raise ValueError(
+                f"Designs require {self.vectors.shape[1]} values! "
+                f"(Got: {vectors.shape[1:]})"
+            )
+        return vectors
+
+    def add(
+        self,
+        designs: Union[Sequence[Stackup], np.ndarray],
+        ids: Optional[Sequence[int]] = None,
+    ):
+        """
+        Insert designs.
+        Parameters
+        ----------
+        designs : List[Stackup] or array
+            stackups or their design vectors, dim=(n, n_values)
+        ids : array, optional
+            ids of the designs, default consecutive numbers
+        """
+        vectors = self._get_vectors(designs)
+        if ids is None:
+            ids = np.arange(self.size, self.size + len(vectors))
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.shape != (len(vectors),):
+            raise ValueError(
+                f"Requires one id per design! (Got: {ids.shape} "
+                f"for {len(vectors)} designs)"
+            )
+        if self.vectors is None:
+            self.vectors = vectors
+        else:
+            self.vectors = np.concatenate([self.vectors, vectors])
+        self.ids = np.concatenate([self.ids, ids])
+        self.size = len(self.vectors)
+        indexed = 0 if self.tree is None else len(self.tree["order"])
+        if self.size - indexed > self.buffer_size:
+            self.build()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def build(self):
+        """
+        Rebuild the KD-tree of all designs.
+        """
+        vectors = self.vectors
+        order = np.arange(len(vectors))
+        nodes = []
+        stack = [(0, len(vectors), -1, 0)]
+        while stack:
+            start, stop, parent, side = stack.pop()
+            if parent >= 0:
+                nodes[parent]["children"][side] = len(nodes)
+            points = vectors[order[start:stop]]
+            node = dict(
+                start=start,
+                stop=stop,
+                lower=points.min(axis=0),
+                upper=points.max(axis=0),
+                children=[-1, -1],
+                dim=0,
+                split=0.0,
+            )
+            nodes.append(node)
+            if stop - start <= self.leaf_size:
+                continue
+            dim = np.argmax(node["upper"] - node["lower"])
+            middle = (stop - start) // 2
+            part = np.argpartition(points[:, dim], middle)
+            order[start:stop] = order[start:stop][part]
+            node["dim"] = dim
+            node["split"] = points[part[middle], dim]
+            stack.append((start + middle, stop, len(nodes) - 1, 1))
+            stack.append((start, start + middle, len(nodes) - 1, 0))
+        self.tree = {key: np.array([node[key] for node in nodes]) for key in nodes[0]}
+        self.tree["order"] = order
+
+    def _get_leaf_designs(self, leaves: np.ndarray) -> np.ndarray:
+        # indices of the designs of several leaves, without python loop
+        starts = self.tree["start"][leaves]
+        lengths = self.tree["stop"][leaves] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self.tree["order"][offsets + np.arange(np.sum(lengths))]
+
+    def _search(
+        self,
+        target: np.ndarray,
+        k: Optional[int],
+        radius: float = np.inf,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # buffered designs by brute force
+        start = 0 if self.tree is None else len(self.tree["order"])
+        indices = np.arange(start, self.size)
+        distances = np.sum((self.vectors[indices] - target) ** 2, axis=-1)
+        if k is not None:
+            indices, distances = _keep_smallest(indices, distances, k)
+        if self.tree is None:
+            return indices, distances
+        tree = self.tree
+
+        # the leaf of the target gives a first bound of the k-th distance
+        visited = -1
+        if k is not None:
+            visited = 0
+            while tree["children"][visited, 0] >= 0:
+                side = int(target[tree["dim"][visited]] >= tree["split"][visited])
+                visited = tree["children"][visited, side]
+            leaf = self._get_leaf_designs(np.array([visited]))
+            indices = np.concatenate([indices, leaf])
+            distances = np.concatenate(
+                [distances, np.sum((self.vectors[leaf] - target) ** 2, axis=-1)]
+            )
+            indices, distances = _keep_smallest(indices, distances, k)
+
+        # level by level, all nodes of a level at once
+        nodes = np.zeros(1, dtype=np.int64)
+        while len(nodes):
+            bound = radius**2
+            if k is not None and len(distances) == k:
+                bound = np.max(distances)
+            gap = np.maximum(tree["lower"][nodes] - target, 0.0)
+            gap += np.maximum(target - tree["upper"][nodes], 0.0)
+            nodes = nodes[(np.sum(gap**2, axis=-1) <= bound) & (nodes != visited)]
+            leaf = tree["children"][nodes, 0] < 0
+            designs = self._get_leaf_designs(nodes[leaf])
+            values = np.sum((self.vectors[designs] - target) ** 2, axis=-1)
+            indices = np.concatenate([indices, designs])
+            distances = np.concatenate([distances, values])
+            if k is not None:
+                indices, distances = _keep_smallest(indices, distances, k)
+            nodes = tree["children"][nodes[~leaf]].ravel()
+        return indices, distances
+
+    def _query_one(self, target: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        indices, distances = self._search(target, k)
+        order = np.argsort(distances, kind="stable")
+        return np.sqrt(distances[order]), self.ids[indices[order]]
+
+    def _query_radius_one(
+        self, target: np.ndarray, radius: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        indices, distances = self._search(target, None, radius)
+        inside = distances <= radius**2
+        indices, distances = indices[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return np.sqrt(distances[order]), self.ids[indices[order]]
+
+    def query(
+        self, targets: Union[Sequence[Stackup], Stackup, np.ndarray], k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The k nearest designs.
+        Parameters
+        ----------
+        targets : Stackup, List[Stackup] or array
+            stackups or design vectors, dim=(n_values,) or (n, n_values)
+        k : int, optional
+            number of neighbors, default 1
+        Returns
+        -------
+        Tuple[array, array]
+            distances and ids by ascending distance, dim=(k,) for a single
+            target, else dim=(n, k). Fewer if the index holds less than k designs.
+        """
+        if k < 1:
+            raise ValueError(f"K has to be greater 0! (recieved: {k})")
+        single = _is_single(targets)
+        if self.size == 0:
+            raise ValueError("The index contains no designs!")
+        results = [self._query_one(target, k) for target in self._get_vectors(targets)]
+        if single:
+            return results[0]
+        return np.stack([r[0] for r in results]), np.stack([r[1] for r in results])
+
+    def query_radius(
+        self, targets: Union[Sequence[Stackup], Stackup, np.ndarray], radius: float
+    ) -> Union[Tuple[np.ndarray, np.ndarray], List[Tuple[np.ndarray, np.ndarray]]]:
+        """
+        All designs within a distance.
+        Parameters
+        ----------
+        targets : Stackup, List[Stackup] or array
+            stackups or design vectors, dim=(n_values,) or (n, n_values)
+        radius : float
+            maximal (weighted) euclidean distance
+        Returns
+        -------
+        Tuple[array, array]
+            distances and ids by ascending distance, a list of them for
+            several targets
+        """
+        single = _is_single(targets)
+        if self.size == 0:
+            raise ValueError("The index contains no designs!")
+        results = [
+            self._query_radius_one(target, radius)
+            for target in self._get_vectors(targets)
+        ]
+        return results[0] if single else results
+
+    def save(self, path: str):
+        """
+        Save the designs as **.npz** file.
+        Parameters
+        ----------
+        path : str
+            path of the file
+        Notes
+        -----
+        The weighted vectors are stored together with the tree arrays,
+        so loading needs no rebuild.
+        """
+        arrays = dict(
+            kind=self.kind,
+            leaf_size=self.leaf_size,
+            buffer_size=self.buffer_size,
+            vectors=np.zeros((0, 0)) if self.vectors is None else self.vectors,
+            ids=self.ids,
+        )
+        if self.weights is not None:
+            arrays["weights"] = self.weights
+        if self.tree is not None:
+            arrays.update({f"tree_{key}": value for key, value in self.tree.items()})
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "DesignIndex":
+        """
+        Load designs saved by **save()**.
+        Parameters
+        ----------
+        path : str
+            path of the **.npz** file
+        Returns
+        -------
+        DesignIndex
+            the index
+        """
+        with np.load(path) as data:
+            index = cls(
+                str(data["kind"]),
+                data["weights"] if "weights" in data else None,
+                int(data["leaf_size"]),
+                int(data["buffer_size"]),
+            )
+            if len(data["ids"]):
+                index.vectors = data["vectors"]
+                index.ids = data["ids"]
+                index.size = len(index.ids)
+            tree = {
+                key[len("tree_") :]: data[key]
+                for key in data.files
+                if key.startswith("tree_")
+            }
+            index.tree = tree or None
+        return index
+
+
+def _is_single(targets: Union[Sequence[Stackup], Stackup, np.ndarray]) -> bool:
+    # a list of stackups is a batch, even though numpy sees a 1d object array
+    if isinstance(targets, Stackup):
+        return True
+    if len(targets) > 0 and isinstance(targets[0], Stackup):
+        return False
+    return np.ndim(np.asarray(targets, dtype=float)) == 1
+
+
+def _keep_smallest(
+    indices: np.ndarray, distances: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    if len(distances) <= k:
+        return indices, distances
+    keep = np.argpartition(distances, k - 1)[:k]
+    return indices[keep], distances[keep]
@@ -0,0 +1,191 @@
+from typing import Union
+import numpy as np
+from .stackup import Stackup, assemble_abd
+
+
+def get_invariants(stiffness: np.ndarray) -> np.ndarray:
+    """
+    Material invariants U1-U5 of orthotropic ply stiffnesses.
+    Parameters
+    ----------
+    stiffness : array
+        stiffness in ply coordinates, dim=(..., 3, 3)
+    Returns
+    -------
+    array
+        invariants U1, U2, U3, U4, U5, dim=(..., 5)
+    """
+    q11 = stiffness[..., 0, 0]
+    q22 = stiffness[..., 1, 1]
+    q12 = stiffness[..., 0, 1]
+    q66 = stiffness[..., 2, 2]
+    return np.stack(
+        [
+            (3 * q11 + 3 * q22 + 2 * q12 + 4 * q66) / 8,
+            (q11 - q22) / 2,
+            (q11 + q22 - 2 * q12 - 4 * q66) / 8,
+            (q11 + q22 + 6 * q12 - 4 * q66) / 8,
+            (q11 + q22 - 2 * q12 + 4 * q66) / 8,
+        ],
+        axis=-1,
+    )
+
+
+def get_invariant_matrices(invariants: np.ndarray) -> np.ndarray:
+    """
+    Rotated stiffness :math:`Q = G_0 + \\sum_i \\xi_i G_i` as matrices of the
+    invariants.
+    Parameters
+    ----------
+    invariants : array
+        invariants U1, U2, U3, U4, U5, dim=(..., 5)
+    Returns
+    -------
+    array
+        matrices G_0 to G_4 (for 1, cos 2t, cos 4t, sin 2t, sin 4t), dim=(..., 5, 3, 3)
+    """
+    u1, u2, u3, u4, u5 = np.moveaxis(invariants, -1, 0)
+    zero = np.zeros_like(u1)
+    h = u2 / 2
+    return np.stack(
+        [
+            [[u1, u4, zero], [u4, u1, zero], [zero, zero, u5]],
+            [[u2, zero, zero], [zero, -u2, zero], [zero, zero, zero]],
+            [[u3, -u3, zero], [-u3, u3, zero], [zero, zero, -u3]],
+            [[zero, zero, h], [zero, zero, h], [h, h, zero]],
+            [[zero, zero, u3], [zero, zero, -u3], [u3, -u3, zero]],
+        ]
+    ).transpose(tuple(range(3, 3 + np.ndim(u1))) + (0, 1, 2))
+
+
+class LaminationParameters:
+    def __init__(
+        self,
+        parameters: np.ndarray,
+        thickness: Union[float, np.ndarray],
+        stiffness: np.ndarray,
+    ):
+        """
+        Lamination parameters of laminates made of one material.
+        Parameters
+        ----------
+        parameters : array
+            lamination parameters
+            :math:`(\\xi^A_{1..4}, \\xi^B_{1..4}, \\xi^D_{1..4})`, dim=(..., 12)
+        thickness : float or array
+            laminate thickness, dim=(...)
+        stiffness : array
+            stiffness in ply coordinates, dim=(3, 3) or (..., 3, 3)
+        Notes
+        -----
+        The parameters are the thickness weighted averages of
+        :math:`(\\cos 2\\theta, \\cos 4\\theta, \\sin 2\\theta, \\sin 4\\theta)`,
+        the ABD-Matrix is linear in them and the invariants U1-U5,
+        so its cost is independent of the number of plies.
+        References
+        ----------
+        .. [1] S.W. Tsai and N.J. Pagano, "Invariant properties of composite
+           materials", Composite Materials Workshop, Technomic, pp. 233-253, 1968
+        Examples
+        --------
+        >>> stiffness = material.get_plane_strain_stiffness()
+        >>> parameters = np.random.uniform(-1, 1, (1000, 12))
+        >>> LaminationParameters(parameters, 2.0, stiffness).get_abd()  # (1000, 6, 6)
+        """
+        self.parameters = np.asarray(parameters, dtype=float)
+        if self.parameters.shape[-1] != 12:
+            raise ValueError(
+                f"Lamination parameters have to be of length 12! "
+                f"(Got: {self.parameters.shape[-1]})"
+            )
+        self.thickness = np.asarray(thickness, dtype=float)
+        self.stiffness = np.asarray(stiffness, dtype=float)
+
+    @classmethod
+    def from_stackup(cls, stackup: Stackup) -> "LaminationParameters":
+        """
+        Lamination parameters of a stackup.
+        Parameters
+        ----------
+        stackup : Stackup
+            stackup with plies of the same material
+        Notes
+        -----
+        Plies are compared by their local stiffness, so equal materials of
+        separate instances are accepted.
+        Returns
+        -------
+        LaminationParameters
+            parameters, thickness and ply stiffness of the stackup
+        """
+        plies = stackup.get_plies()
+        stiffness = plies[0].get_stiffness(local=True)
+        if any(
+            not np.allclose(ply.get_stiffness(local=True), stiffness) for ply in plies
+        ):
+            raise ValueError("Lamination parameters require plies of one material.")
+
+        h = stackup.get_thickness()
+        z = stackup.get_layers()["z"]
+        rotation = np.array([ply.get_rotation() for ply in plies])
+        trigonometry = np.stack(
+            [
+                np.cos(2 * rotation),
+                np.cos(4 * rotation),
+                np.sin(2 * rotation),
+                np.sin(4 * rotation),
+            ],
+            axis=-1,
+        )
+        weights = np.stack(
+            [
+                (z[:, 1] - z[:, 0]) / h,
+                2 * (z[:, 1] ** 2 - z[:, 0] ** 2) / h**2,
+                4 * (z[:, 1] ** 3 - z[:, 0] ** 3) / h**3,
+            ]
+        )
+        parameters = np.matmul(weights, trigonometry).ravel()
+        return cls(parameters, h, stiffness)
+
+    def get_parameters(self) -> np.ndarray:
+        """
+        Lamination parameters.
+        Returns
+        -------
+        array
+            :math:`(\\xi^A_{1..4}, \\xi^B_{1..4}, \\xi^D_{1..4})`, dim=(..., 12)
+        """
+        return self.parameters
+
+    def get_invariants(self) -> np.ndarray:
+        """
+        Material invariants of the ply stiffness.
+        Returns
+        -------
+        array
+            invariants U1, U2, U3, U4, U5, dim=(..., 5)
+        """
+        return get_invariants(self.stiffness)
+
+    def get_abd(self, dtype=np.float64) -> np.ndarray:
+        """
+        ABD-Matrices of the lamination parameters.
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            precision of the evaluation, default float64
+        Returns
+        -------
+        array
+            ABD-Matrices, dim=(..., 6, 6)
+        """
+        matrices = get_invariant_matrices(self.get_invariants().astype(dtype))
+        xi = self.parameters.astype(dtype).reshape(self.parameters.shape[:-1] + (3, 4))
+        h = self.thickness.astype(dtype)[..., None, None]
+
+        # G_1..G_4 are weighted by the parameters, G_0 only enters A and D
+        moments = np.einsum("...mi,...ijk->...mjk", xi, matrices[..., 1:, :, :])
+        scale = np.stack([h, h**2 / 4, h**3 / 12], axis=-3)
+        constant = np.array([1.0, 0.0, 1.0], dtype=dtype)[:, None, None]
+        moments = scale * (moments + constant * matrices[..., None, 0, :, :])
+        return assemble_abd(moments)
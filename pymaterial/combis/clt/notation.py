@@ -0,0 +1,215 @@
+import re
+from typing import Dict, List, Tuple
+import numpy as np
+from pymaterial.materials import Material
+from .ply import Ply
+from .stackup import Stackup, assemble_abd, get_moments, shift_moments
+
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+_ANGLE = re.compile(r"(±|∓|[+-]?)(\d+(?:\.\d*)?|\.\d+)")
+_COUNT = re.compile(r"_?(\d+)")
+
+
+class StackingSequence:
+    def __init__(self, notation: str):
+        """
+        Stacking sequence in laminate notation.
+        Parameters
+        ----------
+        notation : str
+            e.g. "[(0/±45/90)3]s", angles in [deg]
+        Notes
+        -----
+        - plies are separated by "/", from bottom to top
+        - "±45" and "∓45" (also "+-45", "-+45") are pairs of opposite plies
+        - "0_2" or "0₂" repeats a ply, "(...)n" and "[...]n" repeat a group
+        - a trailing "s" mirrors a group (symmetric), "T" (total) is ignored,
+          suffixes apply in order, so "[0/90]2s" is [0/90/0/90/90/0/90/0]
+        The parsed structure is kept as tree of tuples
+        ("ply", angle), ("sequence", children), ("repeat", child, n) and
+        ("symmetric", child), so **get_moments()** evaluates repeated
+        sublaminates once.
+        Examples
+        --------
+        >>> sequence = StackingSequence("[(0/±45/90)3]s")
+        >>> len(sequence.get_angles())
+        24
+        >>> stackup = sequence.get_stackup(material, 0.125)
+        """
+        self.notation = notation
+        text = re.sub(
+            "[₀-₉]+", lambda match: "_" + match.group().translate(_SUBSCRIPTS), notation
+        )
+        text = re.sub(r"\s+", "", text).replace("+-", "±").replace("-+", "∓")
+        self._text = text
+        self._position = 0
+        self.structure = self._parse_sequence()
+        if self._position != len(text):
+            self._raise("unexpected character")
+
+    def _raise(self, message: str):
+        raise ValueError(
+            f"Invalid stacking sequence '{self.notation}', {message} "
+            f"at position {self._position}!"
+        )
+
+    def _parse_sequence(self) -> tuple:
+        items = [self._parse_item()]
+        while self._text[self._position : self._position + 1] == "/":
+            self._position += 1
+            items.append(self._parse_item())
+        return items[0] if len(items) == 1 else ("sequence", tuple(items))
+
+    def _parse_item(self) -> tuple:
+        if self._text[self._position : self._position + 1] in ("[", "("):
+            return self._parse_group()
+        match = _ANGLE.match(self._text, self._position)
+        if match is None:
+            self._raise("expected an angle")
+        self._position = match.end()
+        sign, angle = match.group(1), float(match.group(2))
+        if sign == "-":
+            angle = -angle
+        if sign in ("±", "∓"):
+            first = angle if sign == "±" else -angle
+            item = ("sequence", (("ply", first), ("ply", -first)))
+        else:
+            item = ("ply", angle)
+        if self._text[self._position : self._position + 1] == "_":
+            item = ("repeat", item, self._parse_count())
+        return item
+
+    def _parse_count(self) -> int:
+        match = _COUNT.match(self._text, self._position)
+        if match is None:
+            self._raise("expected a number of repetitions")
+        self._position = match.end()
+        count = int(match.group(1))
+        if count < 1:
+            self._raise("repetitions have to be greater 0")
+        return count
+
+    def _parse_group(self) -> tuple:
+        closing = "]" if self._text[self._position] == "[" else ")"
+        self._position += 1
+        item = self._parse_sequence()
+        if self._text[self._position : self._position + 1] != closing:
+            self._raise(f"expected '{closing}'")
+        self._position += 1
+        while self._position < len(self._text):
+            char = self._text[self._position]
+            if char in "sS":
+                self._position += 1
+                item = ("symmetric", item)
+            elif char in "tT":
+                self._position += 1
+            elif char == "_" or char.isdigit():
+                item = ("repeat", item, self._parse_count())
+            else:
+                break
+        return item
+
+    def get_angles(self) -> List[float]:
+        """
+        Expanded ply angles.
+        Returns
+        -------
+        List[float]
+            angles in [deg], order is bottom to top
+        """
+        return _expand(self.structure)
+
+    def get_moments(self, stiffness: Dict[float, np.ndarray], thickness: float):
+        """
+        Stacked A, B and D matrices about the midplane.
+        Parameters
+        ----------
+        stiffness : dict
+            angle in [deg] and rotated ply stiffness, dim=(3, 3)
+        thickness : float
+            thickness of every ply
+        Notes
+        -----
+        Every node of the structure is evaluated about its own bottom plane.
+        A repeated sublaminate of thickness t is evaluated once and combined in
+        closed form with :math:`\\sum_j j = n(n-1)/2` and
+        :math:`\\sum_j j^2 = n(n-1)(2n-1)/6` of the shifts :math:`j t`, a
+        symmetric group adds its mirrored moments
+        :math:`(A, tA - B, t^2 A - 2tB + D)`. So the effort only depends on the
+        length of the notation, not on the number of plies.
+        Returns
+        -------
+        array
+            stacked A, B and D matrices, dim=(3, 3, 3)
+        """
+        moments, total = _get_moments(self.structure, stiffness, thickness)
+        return shift_moments(moments, total / 2)
+
+    def get_stackup(self, material: Material, thickness: float) -> Stackup:
+        """
+        Stackup of the sequence.
+        Parameters
+        ----------
+        material : Material
+            material of the plies
+        thickness : float
+            thickness of every ply
+        Notes
+        -----
+        Plies of equal angle share one **Ply**, so their rotated stiffness is
+        calculated once, and the ABD-Matrix of **get_moments()** is set as cache
+        of the stackup.
+        Returns
+        -------
+        Stackup
+            stackup with the precalculated ABD-Matrix
+        """
+        angles = self.get_angles()
+        plies = {
+            angle: Ply(material, thickness, angle, degree=True) for angle in set(angles)
+        }
+        stackup = Stackup([plies[angle] for angle in angles])
+        stiffness = {angle: ply.get_stiffness() for angle, ply in plies.items()}
+        abd = assemble_abd(self.get_moments(stiffness, thickness))
+        stackup.abd = stackup._apply_structure(abd)
+        return stackup
+
+    def __str__(self) -> str:
+        return self.notation
+
+
+def _expand(node: tuple) -> List[float]:
+    if node[0] == "ply":
+        return [node[1]]
+    if node[0] == "sequence":
+        return [angle for child in node[1] for angle in _expand(child)]
+    if node[0] == "repeat":
+        return _expand(node[1]) * node[2]
+    angles = _expand(node[1])
+    return angles + angles[::-1]
+
+
+def _get_moments(
+    node: tuple, stiffness: Dict[float, np.ndarray], thickness: float
+) -> Tuple[np.ndarray, float]:
+    # moments about the bottom of the node and its thickness
+    if node[0] == "ply":
+        return get_moments(stiffness[node[1]], 0.0, thickness), thickness
+    if node[0] == "sequence":
+        moments = np.zeros((3, 3, 3))
+        total = 0.0
+        for child in node[1]:
+            values, t = _get_moments(child, stiffness, thickness)
+            moments = moments + shift_moments(values, -total)
+            total += t
+        return moments, total
+
+    (A, B, D), t = _get_moments(node[1], stiffness, thickness)
+    if node[0] == "repeat":
+        n = node[2]
+        s1 = n * (n - 1) / 2
+        s2 = n * (n - 1) * (2 * n - 1) / 6
+        moments = [n * A, n * B + t * s1 * A, n * D + 2 * t * s1 * B + t**2 * s2 * A]
+        return np.stack(moments), n * t
+    mirrored = np.stack([A, t * A - B, t**2 * A - 2 * t * B + D])
+    return np.stack([A, B, D]) + shift_moments(mirrored, -t), 2 * t
@@ -0,0 +1,303 @@
+import os
+from typing import List, Optional
+import numpy as np
+from pymaterial.concurrency import map_batches
+from pymaterial.materials import Material
+from .ply import Ply
+from .stackup import Stackup, assemble_abd
+
+
+class StackingOptimizer:
+    def __init__(
+        self,
+        material: Material,
+        thickness: float,
+        n_plies: int,
+        loads: np.ndarray,
+        angles: Optional[List[float]] = None,
+        symmetric=True,
+        balanced=True,
+        max_contiguous: Optional[int] = 4,
+        population=50,
+        mutation=0.1,
+        penalty=10.0,
+        workers: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Genetic stacking-sequence optimization for first-ply-failure.
+        Parameters
+        ----------
+        material : Material
+            ply material with failure criteria
+        thickness : float
+            ply thickness
+        n_plies : int
+            number of plies of the laminate
+        loads : array
+            load cases :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})`, dim=(N, 6)
+        angles : List[float], optional
+            allowed ply rotations in [deg], default [0, 45, -45, 90]
+        symmetric : bool, optional
+            only create symmetric laminates (n_plies has to be even), default True
+        balanced : bool, optional
+            require a -theta ply for every off-axis +theta ply, default True
+        max_contiguous : int, optional
+            maximal number of neighbouring plies with equal rotation, default 4
+        population : int, optional
+            number of candidates per generation, default 50
+        mutation : float, optional
+            probability of a ply mutation, default 0.1
+        penalty : float, optional
+            added to the failure value per violated stacking rule, default 10.0
+        workers : int, optional
+            number of threads evaluating the population, None for the number
+            of CPUs, default 1
+        seed : int, optional
+            seed of the random number generator
+        Notes
+        -----
+        The fitness is the largest failure value over all plies, sample points
+        and load cases (smaller is better). A population is evaluated as batch:
+        ABD-Matrices, deformations, ply stresses and failure values are arrays
+        over candidates and load cases. Fitness values are cached by the
+        stacking sequence, so recurring candidates are not evaluated again.
+        Examples
+        --------
+        >>> optimizer = StackingOptimizer(material, 0.125, 16, loads, seed=0)
+        >>> result = optimizer.run(generations=100)
+        >>> result["angles"], result["failure"]
+        """
+        if symmetric and n_plies % 2:
+            raise ValueError(
+                f"Symmetric laminates need an even number of plies! (Got: {n_plies})"
+            )
+        if not material.get_failures():
+            raise ValueError("Material needs failure criteria for the optimization.")
+        if angles is None:
+            angles = [0.0, 45.0, -45.0, 90.0]
+        self.material = material
+        self.thickness = thickness
+        self.n_plies = n_plies
+        self.loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        self.angles = np.array(angles, dtype=float)
+        self.symmetric = symmetric
+        self.balanced = balanced
+        self.max_contiguous = max_contiguous
+        self.population = population
+        self.mutation = mutation
+        self.penalty = penalty
+        self.workers = workers
+        self.rng = np.random.default_rng(seed)
+        self.cache = dict()
+
+        # ply data per allowed rotation, shared by all candidates
+        plies = [Ply(material, thickness, angle, degree=True) for angle in angles]
+        self.stiffness = np.array([ply.get_stiffness() for ply in plies])
+        self.local_stiffness = plies[0].get_stiffness(local=True)
+        self.transformation = np.array(
+            [ply.get_strain_transformation() for ply in plies]
+        )
+        z = np.arange(n_plies + 1) * thickness - n_plies * thickness / 2
+        self.z = np.stack([z[:-1], z[1:]], axis=-1)
+        self.weights = np.stack(
+            [
+                z[1:] - z[:-1],
+                1 / 2.0 * (z[1:] ** 2 - z[:-1] ** 2),
+                1 / 3.0 * (z[1:] ** 3 - z[:-1] ** 3),
+            ],
+            axis=-1,
+        )
+
+        # pairs of rotations balancing each other, off-axis without partner
+        normalized = (self.angles + 90.0) % 180.0 - 90.0
+        self.pairs = []
+        self.unbalanced = []
+        for i, angle in enumerate(normalized):
+            if np.isclose(angle, 0.0) or np.isclose(angle, -90.0):
+                continue
+            partner = np.flatnonzero(np.isclose(normalized, -angle))
+            if len(partner) == 0:
+                self.unbalanced.append(i)
+            elif i < partner[0]:
+                self.pairs.append((i, partner[0]))
+
+    def expand(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Full stacking sequences of the genes.
+        Parameters
+        ----------
+        genes : array
+            indices of the rotations of the free plies, dim=(M, n_genes)
+        Returns
+        -------
+        array
+            indices of the rotations of all plies, bottom to top, dim=(M, n_plies)
+        """
+        if self.symmetric:
+            return np.concatenate([genes, genes[:, ::-1]], axis=1)
+        return genes
+
+    def get_violations(self, sequences: np.ndarray) -> np.ndarray:
+        """
+        Number of violated stacking rules.
+        Parameters
+        ----------
+        sequences : array
+            indices of the rotations of all plies, dim=(M, n_plies)
+        Returns
+        -------
+        array
+            number of violations per candidate, dim=(M,)
+        """
+        violations = np.zeros(len(sequences), dtype=int)
+        if self.balanced:
+            for i, j in self.pairs:
+                violations += np.abs(
+                    np.sum(sequences == i, axis=1) - np.sum(sequences == j, axis=1)
+                )
+            for i in self.unbalanced:
+                violations += np.sum(sequences == i, axis=1)
+        m = self.max_contiguous
+        if m is not None and m < sequences.shape[1]:
+            # windows of m equal neighbour pairs are runs longer than m
+            same = sequences[:, 1:] == sequences[:, :-1]
+            count = np.concatenate(
+                [np.zeros((len(sequences), 1), dtype=int), np.cumsum(same, axis=1)],
+                axis=1,
+            )
+            violations += np.sum(count[:, m:] - count[:, :-m] == m, axis=1)
+        return violations
+
+    def get_failure(self, sequences: np.ndarray) -> np.ndarray:
+        """
+        Largest failure value over plies, sample points and load cases.
+        Parameters
+        ----------
+        sequences : array
+            indices of the rotations of all plies, dim=(M, n_plies)
+        Returns
+        -------
+        array
+            first-ply-failure values, dim=(M,)
+        """
+        abd = assemble_abd(
+            np.einsum("pw,mpij->mwij", self.weights, self.stiffness[sequences])
+        )
+        deformations = np.swapaxes(np.linalg.solve(abd, self.loads.T), -1, -2)
+        strains = (
+            deformations[:, :, None, None, :3]
+            + self.z[None, None, :, :, None] * deformations[:, :, None, None, 3:]
+        )
+        strains = np.einsum(
+            "mpij,mnpkj->mnpki", self.transformation[sequences], strains
+        )
+        stresses = np.matmul(strains, self.local_stiffness.T)
+        failures = self.material.get_batch_failure(stresses, strains)
+        return np.max(
+            [np.max(value, axis=(1, 2, 3)) for value in failures.values()], axis=0
+        )
+
+    def evaluate(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Fitness of candidates, using and filling the cache.
+        Parameters
+        ----------
+        genes : array
+            indices of the rotations of the free plies, dim=(M, n_genes)
+        Returns
+        -------
+        array
+            failure value plus penalties, smaller is better, dim=(M,)
+        """
+        sequences = np.asarray(self.expand(genes), dtype=np.int64)
+        # canonical keys, independent of dtype and memory layout
+        keys = [tuple(sequence.tolist()) for sequence in sequences]
+        missing = {}
+        for key, sequence in zip(keys, sequences):
+            if key not in self.cache and key not in missing:
+                missing[key] = sequence
+        if missing:
+            candidates = np.array(list(missing.values()))
+            workers = self.workers or os.cpu_count() or 1
+            fitness = map_batches(
+                lambda s: self.get_failure(s) + self.penalty * self.get_violations(s),
+                candidates,
+                workers=workers,
+                chunk_size=max(1, -(-len(candidates) // workers)),
+            )
+            self.cache.update(zip(missing.keys(), fitness))
+        return np.array([self.cache[key] for key in keys])
+
+    def run(self, generations=100, elite=2, tournament=3) -> dict:
+        """
+        Run the genetic algorithm.
+        Parameters
+        ----------
+        generations : int, optional
+            number of generations, default 100
+        elite : int, optional
+            number of best candidates kept unchanged, default 2
+        tournament : int, optional
+            number of candidates per selection tournament, default 3
+        Returns
+        -------
+        dict
+            - "angles": best stacking sequence in [deg], bottom to top
+            - "failure": its first-ply-failure value
+            - "feasible": True if it fulfils all stacking rules
+            - "history": best fitness per generation
+            - "stackup": Stackup of the best sequence
+        """
+        n_genes = self.n_plies // 2 if self.symmetric else self.n_plies
+        n_angles = len(self.angles)
+        genes = self.rng.integers(n_angles, size=(self.population, n_genes))
+        fitness = self.evaluate(genes)
+        history = []
+        for _ in range(generations):
+            order = np.argsort(fitness, kind="stable")
+            history.append(float(fitness[order[0]]))
+            n_children = self.population - elite
+
+            # tournament selection of two parents per child
+            contestants = self.rng.integers(
+                self.population, size=(2, n_children, tournament)
+            )
+            winners = np.argmin(fitness[contestants], axis=-1)
+            parents = np.take_along_axis(contestants, winners[..., None], -1)[..., 0]
+
+            # one-point crossover
+            cut = self.rng.integers(1, max(n_genes, 2), size=(n_children, 1))
+            children = np.where(
+                np.arange(n_genes) < cut, genes[parents[0]], genes[parents[1]]
+            )
+
+            # mutation: new rotation or swap of two plies
+            mutate = self.rng.random(children.shape) < self.mutation
+            children = np.where(
+                mutate, self.rng.integers(n_angles, size=children.shape), children
+            )
+            swap = np.flatnonzero(self.rng.random(n_children) < self.mutation)
+            if len(swap) and n_genes > 1:
+                i, j = self.rng.integers(n_genes, size=(2, len(swap)))
+                children[swap, i], children[swap, j] = (
+                    children[swap, j],
+                    children[swap, i],
+                )
+
+            genes = np.concatenate([genes[order[:elite]], children])
+            fitness = self.evaluate(genes)
+
+        best = int(np.argmin(fitness))
+        history.append(float(fitness[best]))
+        sequence = self.expand(genes[best : best + 1])
+        angles = self.angles[sequence[0]].tolist()
+        return dict(
+            angles=angles,
+            failure=float(self.get_failure(sequence)[0]),
+            feasible=bool(self.get_violations(sequence)[0] == 0),
+            history=history,
+            stackup=Stackup(
+                [Ply(self.material, self.thickness, a, degree=True) for a in angles]
+            ),
+        )
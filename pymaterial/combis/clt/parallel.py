@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+import numpy as np
+from .stackup import Stackup
+
+_worker = dict()
+
+
+def _init_worker(stackups: List[Stackup], loads: tuple, results: tuple):
+    # attach the shared memory once per worker process
+    _worker["stackups"] = stackups
+    _worker["loads"] = _attach(*loads)
+    _worker["results"] = _attach(*results)
+
+
+def _attach(name: str, shape: tuple):
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=float, buffer=memory.buf)
+
+
+def _run(index: int, start: int, stop: int, layout: dict):
+    loads = _worker["loads"][1][start:stop]
+    results = _worker["results"][1]
+    failures = _worker["stackups"][index].analyze(loads, failures_only=True)
+    for key, values in failures["failures"].items():
+        offset, shape = layout[key]
+        view = results[offset : offset + int(np.prod(shape))].reshape(shape)
+        view[start:stop] = values
+
+
+class ParallelExecutor:
+    def __init__(
+        self, workers: Optional[int] = None, chunk_size=16384, min_cases=100000
+    ):
+        """
+        Process pool evaluation of many stackups and load cases.
+        Parameters
+        ----------
+        workers : int, optional
+            number of worker processes, default is the number of CPUs
+        chunk_size : int, optional
+            number of load cases per work item, default 16384
+        min_cases : int, optional
+            jobs with less stackups * load cases are evaluated serially,
+            default 100000
+        Notes
+        -----
+        Load cases and results are exchanged through shared memory,
+        only the stackups are pickled once per worker.
+        The results equal the serial evaluation, independent of the scheduling.
+        Examples
+        --------
+        >>> executor = ParallelExecutor(workers=8)
+        >>> failures = executor.analyze([stackup_a, stackup_b], loads)
+        >>> failures[1]["cuntze"]  # dim=(n_cases, n_plies, 2)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"Workers has to be greater 0! (recieved: {workers})")
+        if chunk_size < 1:
+            raise ValueError(
+                f"Chunk size has to be greater 0! (recieved: {chunk_size})"
+            )
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.min_cases = min_cases
+
+    def analyze(self, stackups: List[Stackup], loads: np.ndarray) -> List[dict]:
+        """
+        Failure values of every stackup for all load cases.
+        Parameters
+        ----------
+        stackups : List[Stackup]
+            stackups to evaluate
+        loads : array
+            load cases applied to every stackup, dim=(N, 6)
+        Returns
+        -------
+        List[dict]
+            per stackup (same order): failure id and values, dim=(N, n_plies, 2)
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        n_cases = len(loads)
+        if (
+            self.workers == 1
+            or n_cases == 0
+            or len(stackups) * n_cases < self.min_cases
+        ):
+            return [
+                stackup.analyze(loads, failures_only=True)["failures"]
+                for stackup in stackups
+            ]
+
+        # the failure ids of every stackup define the layout of the result memory
+        layouts = []
+        size = 0
+        for stackup in stackups:
+            layout = dict()
+            for key in stackup.analyze(loads[:1], failures_only=True)["failures"]:
+                shape = (n_cases, len(stackup.get_plies()), 2)
+                layout[key] = (size, shape)
+                size += int(np.prod(shape))
+            layouts.append(layout)
+
+        shared_loads = shared_memory.SharedMemory(create=True, size=loads.nbytes)
+        shared_results = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+        try:
+            np.ndarray(loads.shape, dtype=float, buffer=shared_loads.buf)[:] = loads
+            results = np.ndarray((size,), dtype=float, buffer=shared_results.buf)
+            results[:] = np.nan
+
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    stackups,
+                    (shared_loads.name, loads.shape),
+                    (shared_results.name, (size,)),
+                ),
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _run, i, start, min(start + self.chunk_size, n_cases), layout
+                    )
+                    for i, layout in enumerate(layouts)
+                    for start in range(0, n_cases, self.chunk_size)
+                ]
+                for future in futures:
+                    future.result()
+
+            failures = []
+            for layout in layouts:
+                failures.append(
+                    {
+                        key: results[offset : offset + int(np.prod(shape))]
+                        .reshape(shape)
+                        .copy()
+                        for key, (offset, shape) in layout.items()
+                    }
+                )
+            return failures
+        finally:
+            results = None  # release the buffer before closing the shared memory
+            shared_loads.close()
+            shared_loads.unlink()
+            shared_results.close()
+            shared_results.unlink()
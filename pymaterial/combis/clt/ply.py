@@ -1,4 +1,5 @@
 import numpy as np
+from pymaterial.concurrency import cached
 from pymaterial.materials import Material
 
 
@@ -29,6 +30,7 @@ class Ply:
             rotation = rotation * np.pi / 180.0
         self.rotation = rotation
         self.plane_strain = self.material.get_plane_strain_stiffness()
+        self.stiffness = None
 
     def rotate(self, rad, degree=False) -> "Ply":
         """
@@ -68,7 +70,21 @@ class Ply:
             the stiffness tensor in rotated or local coordinate system
         """
         if local:
-            return self.plane_strain
+            return self.plane_strain.copy()
+        return cached(self, "stiffness", self.calc_stiffness).copy()
+
+    def calc_stiffness(self) -> np.ndarray:
+        """
+        Calculate the rotated Stiffness or Q-Tensor (always 3x3)
+        Notes
+        -----
+        **Calculation** means that that the result will allways computated again.
+        If you dont want this use **get_stiffness()** instead!
+        Returns
+        -------
+        array:
+            the stiffness tensor in rotated coordinate system
+        """
         c = np.cos(self.rotation)
         s = np.sin(self.rotation)
         t_sigma = np.array(
@@ -89,6 +105,69 @@ class Ply:
         stiffness_rot = np.matmul(t_sigma, np.matmul(self.plane_strain, t_sigma_t))
         return stiffness_rot
 
+    def get_stiffness_derivative(self) -> np.ndarray:
+        """
+        Derivative of the rotated Stiffness or Q-Tensor w.r.t. the rotation.
+        Returns
+        -------
+        array:
+            derivative of the stiffness tensor (3x3) in [1/rad]
+        """
+        c = np.cos(self.rotation)
+        s = np.sin(self.rotation)
+        t_sigma = np.array(
+            [
+                [c**2, s**2, -2 * s * c],
+                [s**2, c**2, 2 * s * c],
+                [s * c, -s * c, c**2 - s**2],
+            ]
+        )
+        d_t_sigma = np.array(
+            [
+                [-2 * s * c, 2 * s * c, -2 * (c**2 - s**2)],
+                [2 * s * c, -2 * s * c, 2 * (c**2 - s**2)],
+                [c**2 - s**2, -(c**2 - s**2), -4 * s * c],
+            ]
+        )
+        # Q = T Q_local T^T, both factors depend on the rotation
+        d_stiffness = np.matmul(d_t_sigma, np.matmul(self.plane_strain, t_sigma.T))
+        return d_stiffness + d_stiffness.T
+
+    def get_thermal_expansion(self, local=False) -> np.ndarray:
+        """
+        Plane coefficients of thermal expansion.
+        Parameters
+        ----------
+        local : bool, optional
+            when true return the coefficients in the local coordinate system
+        Returns
+        -------
+        array
+            free thermal strains per unit temperature change in Voigt notation (3,)
+        """
+        return self._get_expansion(self.material.get_thermal_expansion(), local)
+
+    def get_hygral_expansion(self, local=False) -> np.ndarray:
+        """
+        Plane coefficients of moisture expansion.
+        Parameters
+        ----------
+        local : bool, optional
+            when true return the coefficients in the local coordinate system
+        Returns
+        -------
+        array
+            free moisture strains per unit moisture change in Voigt notation (3,)
+        """
+        return self._get_expansion(self.material.get_hygral_expansion(), local)
+
+    def _get_expansion(self, expansion: np.ndarray, local: bool) -> np.ndarray:
+        elems = [0, 1, 5]  # plane components
+        expansion = np.asarray(expansion, dtype=float)[elems]
+        if local:
+            return expansion
+        return np.linalg.solve(self.get_strain_transformation(), expansion)
+
     def get_material(self) -> Material:
         """
         Material of the ply
@@ -162,14 +241,42 @@ class Ply:
         array
             2d strain tensor in Voigt notation
         """
+        return np.ravel(self.get_strain_transformation().dot(strain))
+
+    def get_strain_transformation(self) -> np.ndarray:
+        """
+        Transformation of strains into the ply coordinate system.
+        Returns
+        -------
+        array
+            transformation matrix (3x3) of strains in Voigt notation
+        """
         angle = self.rotation
         c = np.cos(angle)
         s = np.sin(angle)
-        t_epsilon_inv = np.array(
+        return np.array(
             [
                 [c**2, s**2, c * s],
                 [s**2, c**2, -c * s],
                 [-2 * c * s, 2 * c * s, c**2 - s**2],
             ]
         )
-        return np.ravel(t_epsilon_inv.dot(strain))
+
+    def get_strain_transformation_derivative(self) -> np.ndarray:
+        """
+        Derivative of the strain transformation w.r.t. the rotation.
+        Returns
+        -------
+        array
+            derivative of the transformation matrix (3x3) in [1/rad]
+        """
+        angle = self.rotation
+        c = np.cos(angle)
+        s = np.sin(angle)
+        return np.array(
+            [
+                [-2 * c * s, 2 * c * s, c**2 - s**2],
+                [2 * c * s, -2 * c * s, -(c**2 - s**2)],
+                [-2 * (c**2 - s**2), 2 * (c**2 - s**2), -4 * c * s],
+            ]
+        )
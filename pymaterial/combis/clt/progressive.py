@@ -0,0 +1,148 @@
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+from .stackup import Stackup, assemble_abd, get_moments
+
+
+def _get_degradation(degradation) -> Dict[Optional[str], np.ndarray]:
+    # None holds the factors of all failure ids
+    if not isinstance(degradation, dict):
+        degradation = {None: degradation}
+    factors = dict()
+    for key, value in degradation.items():
+        value = np.asarray(value, dtype=float)
+        if value.shape != (3,) or np.any(value < 0) or np.any(value > 1):
+            raise ValueError(
+                f"Degradation has to be 3 factors in [0, 1]! (Got: {value.tolist()})"
+            )
+        factors[key] = value
+    return factors
+
+
+def get_progressive_failure(
+    stackup: Stackup,
+    loads: Union[List[List[float]], np.ndarray],
+    degradation: Union[Sequence[float], Dict[str, Sequence[float]]] = (
+        0.01,
+        0.01,
+        0.01,
+    ),
+    steps=100,
+    iterations=10,
+) -> dict:
+    """
+    Progressive failure of many load directions with ply degradation.
+    Parameters
+    ----------
+    stackup : Stackup
+        intact stackup
+    loads : array
+        final loads :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})` of each load
+        direction, dim=(K, 6)
+    degradation : List[float] or dict, optional
+        factors for the ply stiffness in fiber, transverse and shear direction
+        after a failure, either for all failure ids or as dict of failure id and
+        factors, default (0.01, 0.01, 0.01)
+    steps : int, optional
+        number of equal load increments up to the final loads, default 100
+    iterations : int, optional
+        maximal number of re-evaluations per increment after degradations,
+        default 10
+    Notes
+    -----
+    The loads are ramped with the load factor in (0, 1]. At each increment the
+    ply failures of all load directions are evaluated batched, plies with a
+    failure value of at least 1 are degraded once per failure id and the
+    increment is evaluated again, until no further ply fails. A degradation
+    only adds the stiffness change of the ply to the ABD-Matrix of its load
+    direction, the stackup itself is left untouched.
+    The local stiffness is degraded by :math:`Q_{ij} \\sqrt{d_i d_j}`, so it stays
+    symmetric. Failure ids missing in a degradation dict mark a ply as failed
+    without changing its stiffness. Plies whose material lacks a failure
+    criterion never fail, so their stackups have no last ply failure.
+    The load factors are exact up to the increment size.
+    Returns
+    -------
+    dict
+        - "first_ply": load factor of the first ply failure, dim=(K,)
+        - "last_ply": load factor when all plies have failed, dim=(K,)
+        - "failed": load factor of the first failure of each ply, dim=(K, n_plies)
+        - "degradation": final stiffness factors of the plies, dim=(K, n_plies, 3)
+        load factors not reached are NaN
+    Examples
+    --------
+    >>> result = get_progressive_failure(stackup, directions, steps=200)
+    >>> result["first_ply"] * directions[:, 0]  # N_x at first ply failure
+    """
+    if steps < 1:
+        raise ValueError(f"Requires at least one load increment! (Got: {steps})")
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    layers = stackup.get_layers()
+    n_plies = len(stackup.get_plies())
+    n_loads = len(loads)
+    z = layers["z"]
+    transformation = layers["strain_transformation"]
+    local_stiffness = layers["stiffness"]
+    factors = _get_degradation(degradation)
+
+    abd = np.repeat(stackup.calc_abd()[None], n_loads, axis=0)
+    state = np.ones((n_loads, n_plies, 3))
+    failed = dict()
+    result_failed = np.full((n_loads, n_plies), np.nan)
+
+    def get_stiffness(state):
+        # degraded stiffness in local and global ply coordinates, dim=(K, P, 3, 3)
+        scale = np.sqrt(state[..., :, None] * state[..., None, :])
+        local = local_stiffness[None] * scale
+        return local, np.einsum(
+            "pji,kpjl,plm->kpim", transformation, local, transformation
+        )
+
+    local, stiffness = get_stiffness(state)
+    for factor in np.arange(1, steps + 1) / steps:
+        for _ in range(max(iterations, 1)):
+            deformations = np.linalg.solve(abd, factor * loads[..., None])[..., 0]
+            strains = (
+                deformations[:, None, None, :3]
+                + z[None, :, :, None] * deformations[:, None, None, 3:]
+            )
+            strains = np.einsum("pij,kpsj->kpsi", transformation, strains)
+            stresses = np.einsum("kpij,kpsj->kpsi", local, strains)
+
+            new_state = state.copy()
+            for material, ids in layers["groups"]:
+                values = material.get_batch_failure(stresses[:, ids], strains[:, ids])
+                for key, value in values.items():
+                    if key not in failed:
+                        failed[key] = np.zeros((n_loads, n_plies), dtype=bool)
+                    new = (np.max(value, axis=-1) >= 1.0) & ~failed[key][:, ids]
+                    if not np.any(new):
+                        continue
+                    failed[key][:, ids] |= new
+                    factor_key = key if key in factors else None
+                    if factor_key in factors:
+                        k, p = np.nonzero(new)
+                        new_state[k, ids[p]] *= factors[factor_key]
+            for value in failed.values():
+                result_failed[np.isnan(result_failed) & value] = factor
+            if np.array_equal(new_state, state):
+                break
+
+            # incremental ABD update by the stiffness change of the degraded plies
+            new_local, new_stiffness = get_stiffness(new_state)
+            moments = get_moments(new_stiffness - stiffness, z[:, 0], z[:, 1])
+            abd += assemble_abd(np.sum(moments, axis=1))
+            state, local, stiffness = new_state, new_local, new_stiffness
+
+        if not np.any(np.isnan(result_failed)):
+            break
+
+    reached = ~np.isnan(result_failed)
+    first_ply = np.min(np.where(reached, result_failed, np.inf), axis=1)
+    first_ply[np.isinf(first_ply)] = np.nan
+    last_ply = np.where(np.all(reached, axis=1), np.max(result_failed, axis=1), np.nan)
+    return dict(
+        first_ply=first_ply,
+        last_ply=last_ply,
+        failed=result_failed,
+        degradation=state,
+    )
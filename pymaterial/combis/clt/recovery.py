@@ -0,0 +1,102 @@
+from typing import Dict, Optional, Union
+import numpy as np
+from .stackup import Stackup
+
+
+def recover_elements(
+    deformations: np.ndarray,
+    property_ids: np.ndarray,
+    properties: Dict[int, Stackup],
+    failures_only=True,
+    chunk_size: Optional[int] = 65536,
+    delta_t: Optional[Union[float, np.ndarray]] = None,
+    delta_m: Optional[Union[float, np.ndarray]] = None,
+    dtype=np.float64,
+) -> dict:
+    """
+    Ply recovery of shell elements of a FE-model sharing stackups by property ID.
+    Parameters
+    ----------
+    deformations : array
+        midplane strains and curvatures of the elements, dim=(E, 6)
+    property_ids : array
+        property ID of each element, dim=(E,)
+    properties : dict
+        property ID and stackup
+    failures_only : bool, optional
+        when true: only return the failures to save memory, default True
+    chunk_size : int, optional
+        maximal number of elements evaluated at once, default 65536
+    delta_t : float or array, optional
+        temperature change per element, dim=(E,)
+    delta_m : float or array, optional
+        moisture change per element, dim=(E,)
+    dtype : numpy.dtype, optional
+        precision of the results, default float64
+    Notes
+    -----
+    The elements are sorted by property ID (stable argsort), so each stackup
+    is evaluated by **Stackup.recover()** on contiguous blocks of elements with
+    its cached ply data. The results are scattered back in element order and
+    padded with NaN beyond the number of plies of a stackup.
+    Returns
+    -------
+    dict
+        - "strains": ply strains, dim=(E, max_plies, 2, 3) (unless failures_only)
+        - "stresses": ply stresses, dim=(E, max_plies, 2, 3) (unless failures_only)
+        - "failures": dict of failure id and values, dim=(E, max_plies, 2)
+    Examples
+    --------
+    >>> result = recover_elements(deformations, pids, {1: skin, 2: spar})
+    >>> np.nanmax(result["failures"]["cuntze"], axis=(1, 2))  # per element
+    """
+    deformations = np.atleast_2d(np.asarray(deformations, dtype=float))
+    property_ids = np.asarray(property_ids)
+    n_elements = len(deformations)
+    if property_ids.shape != (n_elements,):
+        raise ValueError(
+            f"Requires one property ID per element! "
+            f"(Got: {property_ids.shape} for {n_elements} elements)"
+        )
+    deltas = [
+        None if delta is None else np.broadcast_to(delta, (n_elements,))
+        for delta in (delta_t, delta_m)
+    ]
+
+    order = np.argsort(property_ids, kind="stable")
+    ids, starts = np.unique(property_ids[order], return_index=True)
+    missing = [pid for pid in ids.tolist() if pid not in properties]
+    if missing:
+        raise ValueError(f"Missing stackups of property IDs {missing}!")
+    stops = np.append(starts[1:], n_elements)
+    max_plies = max(
+        [len(properties[pid].get_plies()) for pid in ids.tolist()], default=0
+    )
+
+    shape = (n_elements, max_plies, 2)
+    result = dict()
+    if not failures_only:
+        result["strains"] = np.full(shape + (3,), np.nan, dtype=dtype)
+        result["stresses"] = np.full(shape + (3,), np.nan, dtype=dtype)
+    failures = dict()
+    for pid, start, stop in zip(ids.tolist(), starts, stops):
+        stackup = properties[pid]
+        n_plies = len(stackup.get_plies())
+        step = chunk_size or stop - start
+        for begin in range(start, stop, step):
+            elements = order[begin : min(begin + step, stop)]
+            values = stackup.recover(
+                deformations[elements],
+                failures_only,
+                *[None if delta is None else delta[elements] for delta in deltas],
+                dtype=dtype,
+            )
+            if not failures_only:
+                result["strains"][elements, :n_plies] = values["strains"]
+                result["stresses"][elements, :n_plies] = values["stresses"]
+            for key, value in values["failures"].items():
+                if key not in failures:
+                    failures[key] = np.full(shape, np.nan, dtype=dtype)
+                failures[key][elements, :n_plies] = value
+    result["failures"] = failures
+    return result
@@ -0,0 +1,171 @@
+from typing import List, Union
+import numpy as np
+from .stackup import Stackup, assemble_abd, get_moments
+
+
+def get_abd_sensitivities(stackup: Stackup) -> dict:
+    """
+    Analytic derivatives of the ABD-Matrix w.r.t. the ply rotations and thicknesses.
+    Parameters
+    ----------
+    stackup : Stackup
+        stackup to differentiate
+    Notes
+    -----
+    The derivatives refer to the untruncated ABD-Matrix (**calc_abd()**).
+    A thickness change moves the midplane, so it affects the z-coordinates
+    of all plies, the derivatives account for that.
+    Returns
+    -------
+    dict
+        - "rotation": derivatives w.r.t. the rotations in [1/rad], dim=(n_plies, 6, 6)
+        - "thickness": derivatives w.r.t. the thicknesses, dim=(n_plies, 6, 6)
+    """
+    plies = stackup.get_plies()
+    z = stackup.get_layers()["z"]
+    z_bot = z[:, 0, None, None]
+    z_top = z[:, 1, None, None]
+    stiffness = np.array([ply.get_stiffness() for ply in plies])
+    d_stiffness = np.array([ply.get_stiffness_derivative() for ply in plies])
+
+    # dz_top_i / dt_k = [k <= i] - 1/2 and dz_bot_i / dt_k = [k < i] - 1/2
+    def suffix(values):
+        return np.cumsum(values[::-1], axis=0)[::-1]
+
+    A = np.sum(stiffness * (z_top - z_bot), axis=0)
+    B = np.sum(stiffness * (z_top**2 - z_bot**2), axis=0) / 2
+    d_A = stiffness
+    d_B = (
+        suffix(stiffness * z_top)
+        - suffix(stiffness * z_bot)
+        + stiffness * z_bot
+        - A / 2
+    )
+    d_D = (
+        suffix(stiffness * z_top**2)
+        - suffix(stiffness * z_bot**2)
+        + stiffness * z_bot**2
+        - B
+    )
+    return dict(
+        rotation=assemble_abd(get_moments(d_stiffness, z[:, 0], z[:, 1])),
+        thickness=assemble_abd(np.stack([d_A, d_B, d_D], axis=-3)),
+    )
+
+
+def get_sensitivities(
+    stackup: Stackup,
+    loads: Union[List[List[float]], np.ndarray],
+    failures_only=False,
+) -> dict:
+    """
+    Analytic derivatives of the load to failure chain of **Stackup.analyze()**.
+    Parameters
+    ----------
+    stackup : Stackup
+        stackup to differentiate
+    loads : array
+        load cases :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})`, dim=(N, 6)
+    failures_only : bool, optional
+        when true: only return the derivatives of the failures, default False
+    Notes
+    -----
+    The derivative w.r.t. the rotation or thickness of ply k is stored at [..., k].
+    The failure derivatives chain the ply stress and strain derivatives with
+    **get_batch_failure_gradient()** of the ply materials.
+    Like **get_abd_sensitivities()**, the chain uses the untruncated
+    ABD-Matrix, so the values can differ from **Stackup.analyze()** by the
+    truncation of values smaller 1e-6.
+    Returns
+    -------
+    dict
+        each with "rotation" and "thickness" derivatives:
+        - "abd": dim=(n_plies, 6, 6)
+        - "deformations": dim=(N, 6, n_plies)
+        - "strains": in ply coordinates, dim=(N, n_plies, 2, 3, n_plies)
+        - "stresses": in ply coordinates, dim=(N, n_plies, 2, 3, n_plies)
+        - "failures": dict of failure id and derivatives, dim=(N, n_plies, 2, n_plies)
+    Examples
+    --------
+    >>> gradient = get_sensitivities(stackup, loads, failures_only=True)
+    >>> gradient["failures"]["cuntze"]["rotation"][n, i, j]  # d f / d theta
+    """
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    plies = stackup.get_plies()
+    layers = stackup.get_layers()
+    n_plies = len(plies)
+    z = layers["z"]
+    transformation = layers["strain_transformation"]
+    d_transformation = np.array(
+        [ply.get_strain_transformation_derivative() for ply in plies]
+    )
+
+    # the ABD derivatives refer to the untruncated ABD-Matrix
+    abd_inv = np.linalg.inv(stackup.get_abd(truncate=False))
+    deformations = np.matmul(loads, abd_inv.T)
+    strains_global = (
+        deformations[:, None, None, :3]
+        + z[None, :, :, None] * deformations[:, None, None, 3:]
+    )
+    strains = np.einsum("pij,npkj->npki", transformation, strains_global)
+    stresses = np.einsum("pij,npkj->npki", layers["stiffness"], strains)
+
+    # d z_ij / d t_k, ply i, sample point j (bottom, top)
+    ids = np.arange(n_plies)
+    d_z = (
+        np.stack([ids[None, :] < ids[:, None], ids[None, :] <= ids[:, None]], axis=1)
+        - 0.5
+    )
+
+    gradients = [
+        (
+            group,
+            material.get_batch_failure_gradient(stresses[:, group], strains[:, group]),
+        )
+        for material, group in layers["groups"]
+    ]
+
+    result = dict(abd=get_abd_sensitivities(stackup))
+    if not failures_only:
+        for key in ["deformations", "strains", "stresses"]:
+            result[key] = dict()
+    failures = dict()
+    for parameter, d_abd in result["abd"].items():
+        # d (ABD^-1 N) = -ABD^-1 dABD ABD^-1 N
+        d_deformations = -np.einsum("ab,kbc,nc->nak", abd_inv, d_abd, deformations)
+        d_strains = (
+            d_deformations[:, None, None, :3]
+            + z[None, :, :, None, None] * d_deformations[:, None, None, 3:]
+        )
+        if parameter == "thickness":
+            d_strains = (
+                d_strains
+                + d_z[None, :, :, None, :] * deformations[:, None, None, 3:, None]
+            )
+        d_strains = np.einsum("pij,npkjl->npkil", transformation, d_strains)
+        if parameter == "rotation":
+            d_strains[:, ids, :, :, ids] += np.einsum(
+                "pij,npkj->pnki", d_transformation, strains_global
+            )
+        d_stresses = np.einsum("pij,npkjl->npkil", layers["stiffness"], d_strains)
+
+        if not failures_only:
+            result["deformations"][parameter] = d_deformations
+            result["strains"][parameter] = d_strains
+            result["stresses"][parameter] = d_stresses
+
+        for group, gradient in gradients:
+            for key, (d_stress, d_strain) in gradient.items():
+                if key not in failures:
+                    failures[key] = dict()
+                if parameter not in failures[key]:
+                    shape = (len(loads), n_plies, 2, n_plies)
+                    failures[key][parameter] = np.full(shape, np.nan)
+                value = np.einsum("npki,npkil->npkl", d_stress, d_stresses[:, group])
+                if d_strain is not None:
+                    value += np.einsum(
+                        "npki,npkil->npkl", d_strain, d_strains[:, group]
+                    )
+                failures[key][parameter][:, group] = value
+    result["failures"] = failures
+    return result
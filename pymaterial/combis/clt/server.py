@@ -0,0 +1,525 @@
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from pymaterial import failures as _failures
+from pymaterial import materials as _materials
+from pymaterial.materials import Material
+from .ply import Ply
+from .stackup import Stackup
+
+# newline delimited json messages, long lines for large batches of load cases
+_LIMIT = 2**26
+
+
+def get_hash(definition: dict) -> str:
+    """
+    Hash of a stackup or material definition.
+    Parameters
+    ----------
+    definition : dict
+        json serializable definition
+    Returns
+    -------
+    str
+        sha256 of the canonical json of the definition
+    """
+    text = json.dumps(definition, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _get_class(module, name: str, base: type) -> type:
+    cls = getattr(module, str(name), None)
+    if not isinstance(cls, type) or not issubclass(cls, base):
+        raise ValueError(f"Unknown {base.__name__} type '{name}'!")
+    return cls
+
+
+def build_material(definition: dict) -> Material:
+    """
+    Material of a json definition.
+    Parameters
+    ----------
+    definition : dict
+        - "type": class name of **pymaterial.materials**
+        - "args": keyword arguments of the constructor
+        - "failures": optional list of failure definitions, each with "type"
+          (class name of **pymaterial.failures**) and "args"
+    Returns
+    -------
+    Material
+        the material
+    Examples
+    --------
+    >>> build_material(dict(
+    ...     type="IsotropicMaterial",
+    ...     args=dict(Em=210000.0, nu=0.3, density=7.85e-9),
+    ...     failures=[dict(type="VonMisesFailure", args=dict(yield_stress=355.0))],
+    ... ))
+    """
+    cls = _get_class(_materials, definition.get("type"), Material)
+    args = dict(definition.get("args", dict()))
+    if "failures" in definition:
+        args["failures"] = [
+            _get_class(_failures, failure.get("type"), _failures.IFailure)(
+                **failure.get("args", dict())
+            )
+            for failure in definition["failures"]
+        ]
+    return cls(**args)
+
+
+def build_stackup(definition: dict) -> Stackup:
+    """
+    Stackup of a json definition.
+    Parameters
+    ----------
+    definition : dict
+        - "materials": list of material definitions, see **build_material()**
+        - "plies": list of plies from bottom to top, each with "material"
+          (index in "materials"), "thickness" and "rotation" in [deg]
+    Notes
+    -----
+    Plies referencing the same material share one material object, so they
+    are evaluated together by **Stackup.analyze()**.
+    Returns
+    -------
+    Stackup
+        the stackup
+    """
+    materials = [build_material(material) for material in definition["materials"]]
+    return Stackup(
+        [
+            Ply(
+                materials[ply["material"]],
+                ply["thickness"],
+                ply.get("rotation", 0.0),
+                degree=True,
+            )
+            for ply in definition["plies"]
+        ]
+    )
+
+
+class EvaluationServer:
+    def __init__(
+        self,
+        window: float = 0.002,
+        max_batch: int = 65536,
+        cache_size: int = 256,
+    ):
+        """
+        Local asyncio service evaluating stackups and materials for many clients.
+        Parameters
+        ----------
+        window : float, optional
+            latency window in [s] in which requests of the same stackup or
+            material are collected into one batch, default 0.002
+        max_batch : int, optional
+            a batch is evaluated immediately once it holds this many load cases
+            or stress states, default 65536
+        cache_size : int, optional
+            number of built stackups and materials kept warm, default 256
+        Notes
+        -----
+        Clients send newline delimited json requests, each answered by one json line
+        with the same "id":
+
+        - {"id": 1, "stackup": definition, "loads": [[...6 values], ...]}
+          answered with {"id": 1, "hash": ..., "failures": {id: dim=(N, n_plies, 2)}}
+        - {"id": 2, "material": definition, "stresses": [[...3]], "strains": [[...3]]}
+          answered with {"id": 2, "hash": ..., "failures": {id: dim=(N,)}},
+          without "strains" they follow from the stresses and the plane
+          compliance of the material
+
+        Instead of the definition, the "hash" of a previous answer references the
+        cached stackup or material. Errors are answered with {"id": ..., "error": msg}.
+        Definitions are built by **build_stackup()** and **build_material()** and
+        cached least recently used by their hash, so caches like the
+        ABD-Matrix stay warm across requests.
+        Concurrent requests of the same stackup or material within the window
+        are concatenated and evaluated in one vectorized call in a worker
+        thread, then the results are split back per request.
+        Examples
+        --------
+        >>> server = EvaluationServer(window=0.001)
+        >>> asyncio.run(server.serve(path="/tmp/pymaterial.sock"))
+        """
+        if window < 0:
+            raise ValueError(f"Window has to be positive! (recieved: {window})")
+        if max_batch < 1:
+            raise ValueError(f"Max batch has to be greater 0! (recieved: {max_batch})")
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[str, Union[Stackup, Material]]" = OrderedDict()
+        self.pending: Dict[Tuple[str, str], List[tuple]] = dict()
+        self.timers: Dict[Tuple[str, str], asyncio.TimerHandle] = dict()
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.batches = 0
+
+    def get_cached(self, kind: str, request: dict) -> Tuple[str, object]:
+        """
+        Stackup or material of a request, built on a cache miss.
+        Parameters
+        ----------
+        kind : str
+            "stackup" or "material"
+        request : dict
+            request with the definition or its "hash"
+        Returns
+        -------
+        tuple
+            hash and the stackup or material
+        """
+        definition = request.get(kind)
+        key = request.get("hash") if definition is None else get_hash(definition)
+        value = self.cache.get(key)
+        if value is None:
+            if definition is None:
+                raise LookupError(f"Unknown {kind} hash '{key}'!")
+            value = (build_stackup if kind == "stackup" else build_material)(definition)
+            self.cache[key] = value
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        self.cache.move_to_end(key)
+        return key, value
+
+    async def evaluate(self, request: dict) -> dict:
+        """
+        Answer of a single request, batched with concurrent requests.
+        Parameters
+        ----------
+        request : dict
+            stackup or material request, see **EvaluationServer**
+        Returns
+        -------
+        dict
+            answer with "hash" and "failures" as arrays
+        """
+        kind = "stackup" if "loads" in request else "material"
+        key, value = self.get_cached(kind, request)
+        names = ("loads",) if kind == "stackup" else ("stresses", "strains")
+        size = 6 if kind == "stackup" else 3
+        arrays = tuple(
+            np.atleast_2d(np.asarray(request[name], dtype=float))
+            for name in names
+            if name in request or name != "strains"
+        )
+        for name, array in zip(names, arrays):
+            if array.ndim != 2 or array.shape[1] != size:
+                raise ValueError(
+                    f"{name.capitalize()} require dim=(N, {size})! "
+                    f"(Got: {array.shape})"
+                )
+        if kind == "material" and len(arrays) == 1:
+            elems = [0, 1, 5]  # plane stress components
+            compliance = value.get_compliance()[elems][:, elems]
+            arrays = (arrays[0], np.matmul(arrays[0], compliance.T))
+        if len(arrays) == 2 and arrays[0].shape != arrays[1].shape:
+            raise ValueError(
+                f"Stresses and strains have to match! "
+                f"(Got: {arrays[0].shape} and {arrays[1].shape})"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self.pending.setdefault((kind, key), [])
+        batch.append((arrays, future))
+        if len(batch) == 1:
+            self.timers[(kind, key)] = loop.call_later(
+                self.window, self._flush, kind, key, value
+            )
+        if sum(len(item[0][0]) for item in batch) >= self.max_batch:
+            self.timers[(kind, key)].cancel()
+            self._flush(kind, key, value)
+        return dict(hash=key, failures=await future)
+
+    def _flush(self, kind: str, key: str, value):
+        self.timers.pop((kind, key), None)
+        batch = self.pending.pop((kind, key), None)
+        if batch:
+            asyncio.ensure_future(self._run(kind, value, batch))
+
+    async def _run(self, kind: str, value, batch: List[tuple]):
+        self.batches += 1
+
+        def function() -> dict:
+            arrays = [
+                np.concatenate(item) for item in zip(*[item[0] for item in batch])
+            ]
+            if kind == "stackup":
+                return value.analyze(arrays[0], failures_only=True)["failures"]
+            return value.get_batch_failure(*arrays)
+
+        try:
+            failures = await asyncio.get_running_loop().run_in_executor(None, function)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        start = 0
+        for item, future in batch:
+            stop = start + len(item[0])
+            if not future.done():
+                future.set_result(
+                    {name: values[start:stop] for name, values in failures.items()}
+                )
+            start = stop
+
+    async def _handle(self, request: dict) -> dict:
+        try:
+            answer = await self.evaluate(request)
+            answer["failures"] = {
+                name: values.tolist() for name, values in answer["failures"].items()
+            }
+        except Exception as error:
+            answer = dict(error=f"{type(error).__name__}: {error}")
+        answer["id"] = request.get("id")
+        return answer
+
+    async def _serve_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        lock = asyncio.Lock()
+
+        async def answer(line: bytes):
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                result = dict(id=None, error=f"Invalid request: {error}")
+            else:
+                result = await self._handle(request)
+            async with lock:
+                writer.write(json.dumps(result).encode() + b"\n")
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # requests of one client are answered as soon as ready
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(
+        self, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening on a Unix socket or on localhost.
+        Parameters
+        ----------
+        path : str, optional
+            path of the Unix socket, when not given listen on host and port
+        host : str, optional
+            host to listen on, default "127.0.0.1"
+        port : int, optional
+            port to listen on, default 0 (any free port)
+        Returns
+        -------
+        asyncio.AbstractServer
+            the listening server, e.g. for **server.sockets[0].getsockname()**
+        """
+        if path is not None:
+            self.server = await asyncio.start_unix_server(
+                self._serve_client, path=path, limit=_LIMIT
+            )
+        else:
+            self.server = await asyncio.start_server(
+                self._serve_client, host=host, port=port, limit=_LIMIT
+            )
+        return self.server
+
+    async def serve(
+        self, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        """
+        Start listening, see **start()**, and serve until cancelled.
+        """
+        server = await self.start(path, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self):
+        """
+        Stop listening.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+
+class EvaluationClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Client of an **EvaluationServer**, use **connect()**.
+        Notes
+        -----
+        Requests of one client can be sent concurrently, the answers are
+        matched by their id. Definitions are only sent until the server knows
+        their hash.
+        Examples
+        --------
+        >>> client = await EvaluationClient.connect(path="/tmp/pymaterial.sock")
+        >>> failures = await client.analyze(definition, loads)
+        >>> await client.close()
+        """
+        self.reader = reader
+        self.writer = writer
+        self.futures: Dict[int, asyncio.Future] = dict()
+        self.known = set()
+        self.count = 0
+        self.listener = asyncio.ensure_future(self._listen())
+
+    @classmethod
+    async def connect(
+        cls, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0
+    ) -> "EvaluationClient":
+        """
+        Connect to a Unix socket or to host and port.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=_LIMIT)
+        return cls(reader, writer)
+
+    async def _listen(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                answer = json.loads(line)
+                future = self.futures.pop(answer.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(answer)
+        finally:
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Server closed connection!"))
+
+    async def request(self, kind: str, definition: dict, **arrays) -> dict:
+        """
+        Send a request, see **EvaluationServer**.
+        Parameters
+        ----------
+        kind : str
+            "stackup" or "material"
+        definition : dict
+            definition of the stackup or material
+        Returns
+        -------
+        dict
+            failure id and values as arrays
+        """
+        key = get_hash(definition)
+        answer = await self._send(kind, definition, key in self.known, arrays)
+        if answer.get("error", "").startswith("LookupError"):
+            # evicted from the cache of the server, resend the definition
+            answer = await self._send(kind, definition, False, arrays)
+        if "error" in answer:
+            raise ValueError(answer["error"])
+        self.known.add(answer["hash"])
+        return {
+            name: np.array(values, dtype=float)
+            for name, values in answer["failures"].items()
+        }
+
+    async def _send(self, kind: str, definition: dict, known: bool, arrays: dict):
+        self.count += 1
+        request = dict(id=self.count)
+        request.update(
+            {name: np.asarray(value).tolist() for name, value in arrays.items()}
+        )
+        if known:
+            request["hash"] = get_hash(definition)
+        else:
+            request[kind] = definition
+        future = asyncio.get_running_loop().create_future()
+        self.futures[self.count] = future
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def analyze(self, definition: dict, loads: np.ndarray) -> dict:
+        """
+        Failures of a stackup, equal to **Stackup.analyze(loads, True)["failures"]**.
+        Parameters
+        ----------
+        definition : dict
+            stackup definition, see **build_stackup()**
+        loads : array
+            load cases, dim=(N, 6)
+        Returns
+        -------
+        dict
+            failure id and values, dim=(N, n_plies, 2)
+        """
+        return await self.request("stackup", definition, loads=loads)
+
+    async def get_batch_failure(
+        self,
+        definition: dict,
+        stresses: np.ndarray,
+        strains: Optional[np.ndarray] = None,
+    ) -> dict:
+        """
+        Failures of a material, equal to **Material.get_batch_failure()**.
+        Parameters
+        ----------
+        definition : dict
+            material definition, see **build_material()**
+        stresses : array
+            plane stress states, dim=(N, 3)
+        strains : array, optional
+            plane strains, dim=(N, 3), default from the stresses and the plane
+            compliance of the material
+        Returns
+        -------
+        dict
+            failure id and values, dim=(N,)
+        """
+        arrays = dict(stresses=stresses)
+        if strains is not None:
+            arrays["strains"] = strains
+        return await self.request("material", definition, **arrays)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.listener
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="pyMaterial evaluation server")
+    parser.add_argument("--socket", help="path of the Unix socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window", type=float, default=0.002, help="in [s]")
+    parser.add_argument("--max-batch", type=int, default=65536)
+    parser.add_argument("--cache-size", type=int, default=256)
+    args = parser.parse_args(argv)
+    server = EvaluationServer(args.window, args.max_batch, args.cache_size)
+    try:
+        asyncio.run(server.serve(args.socket, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
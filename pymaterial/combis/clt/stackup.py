@@ -1,7 +1,151 @@
-from typing import List, Tuple
+import os
+from typing import Iterator, List, Optional, Tuple, Union
 import numpy as np
+from pymaterial.concurrency import cached
 from .ply import Ply
-from pymaterial.materials import TransverselyIsotropicMaterial
+from .streaming import iter_loads
+from .envelope import Envelope
+from .critical import CriticalLocations
+from pymaterial.materials import Material, TransverselyIsotropicMaterial
+
+
+def get_moments(
+    stiffness: np.ndarray, z_bot: np.ndarray, z_top: np.ndarray
+) -> np.ndarray:
+    """
+    Contributions of plies to the A, B and D matrix.
+    Parameters
+    ----------
+    stiffness : array
+        rotated stiffness of the plies, dim=(..., 3, 3)
+    z_bot : array
+        z-coordinates of the ply bottoms, dim=(...)
+    z_top : array
+        z-coordinates of the ply tops, dim=(...)
+    Returns
+    -------
+    array
+        stacked A, B and D contributions, dim=(..., 3, 3, 3)
+    """
+    z_bot = np.asarray(z_bot)[..., None, None]
+    z_top = np.asarray(z_top)[..., None, None]
+    return np.stack(
+        [
+            stiffness * (z_top - z_bot),
+            1 / 2.0 * stiffness * (z_top**2 - z_bot**2),
+            1 / 3.0 * stiffness * (z_top**3 - z_bot**3),
+        ],
+        axis=-3,
+    )
+
+
+def shift_moments(moments: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """
+    Move the reference plane of stacked A, B and D matrices (parallel axis theorem).
+    Parameters
+    ----------
+    moments : array
+        stacked A, B and D matrices, dim=(..., 3, 3, 3)
+    shift : array
+        z-coordinate of the new reference plane, dim=(...)
+    Returns
+    -------
+    array
+        stacked A, B and D matrices about the new reference plane
+    """
+    shift = np.asarray(shift)[..., None, None]
+    A = moments[..., 0, :, :]
+    B = moments[..., 1, :, :]
+    D = moments[..., 2, :, :]
+    return np.stack(
+        [A, B - shift * A, D - 2 * shift * B + shift**2 * A],
+        axis=-3,
+    )
+
+
+def assemble_abd(moments: np.ndarray) -> np.ndarray:
+    """
+    Compile ABD matrices from stacked A, B and D matrices.
+    Parameters
+    ----------
+    moments : array
+        stacked A, B and D matrices, dim=(..., 3, 3, 3)
+    Returns
+    -------
+    array
+        ABD matrices, dim=(..., 6, 6)
+    """
+    A = moments[..., 0, :, :]
+    B = moments[..., 1, :, :]
+    D = moments[..., 2, :, :]
+    return np.concatenate(
+        [np.concatenate([A, B], axis=-1), np.concatenate([B, D], axis=-1)], axis=-2
+    )
+
+
+def split_abd(abd: np.ndarray) -> np.ndarray:
+    """
+    Split ABD matrices into stacked A, B and D matrices.
+    Parameters
+    ----------
+    abd : array
+        ABD matrices, dim=(..., 6, 6)
+    Returns
+    -------
+    array
+        stacked A, B and D matrices, dim=(..., 3, 3, 3)
+    """
+    return np.stack(
+        [abd[..., :3, :3], abd[..., :3, 3:], abd[..., 3:, 3:]],
+        axis=-3,
+    )
+
+
+def _get_stiffness_key(ply: Ply) -> tuple:
+    # local stiffness rounded to 9 digits relative to its largest value
+    stiffness = ply.get_stiffness(local=True)
+    scale = float(np.max(np.abs(stiffness))) or 1.0
+    values = np.round(stiffness / scale, 9) + 0.0
+    return (float(f"{scale:.9g}"),) + tuple(values.ravel().tolist())
+
+
+def _get_ply_key(ply: Ply, stiffness: Optional[tuple] = None) -> tuple:
+    # compare plies by local stiffness, thickness and rotation in [deg]
+    # normalized to [-90, 90), so separate but equal materials match
+    if stiffness is None:
+        stiffness = _get_stiffness_key(ply)
+    angle = ply.get_rotation() * 180.0 / np.pi
+    angle = round(float((angle + 90.0) % 180.0 - 90.0), 6) + 0.0
+    return stiffness, ply.get_thickness(), angle
+
+
+def _get_ply_keys(plies: List[Ply]) -> List[tuple]:
+    # the stiffness key is calculated once per material
+    stiffness = dict()
+    keys = []
+    for ply in plies:
+        material = id(ply.get_material())
+        if material not in stiffness:
+            stiffness[material] = _get_stiffness_key(ply)
+        keys.append(_get_ply_key(ply, stiffness[material]))
+    return keys
+
+
+def _get_mirror_key(key: tuple) -> tuple:
+    # key of the ply with opposite rotation
+    return key[0], key[1], -key[2] + 0.0
+
+
+def _update_balance(tracking: dict, key: tuple):
+    # off-axis plies and their counterparts of opposite rotation are counted
+    if key[2] in (0.0, -90.0):
+        return
+    mirror = _get_mirror_key(key)
+    counts = tracking["counts"]
+    if counts.get(key, 0) != counts.get(mirror, 0):
+        tracking["unbalanced"].update((key, mirror))
+    else:
+        tracking["unbalanced"].difference_update((key, mirror))
 
 
 class Stackup:
@@ -24,7 +168,14 @@ class Stackup:
             self.plies = plies
         self.thickness = self.calc_thickness()
         self.density = self.calc_density()
+        self.symmetric = self.calc_symmetric()
+        self.balanced = self.calc_balanced()
         self.abd = None
+        self.abd_truncated = None
+        self.abd_inv = None
+        self.layers = None
+        self.homogenized = None
+        self.tracking = None
 
     def get_plies(self, bot_to_top=True) -> List[Ply]:
         """
@@ -113,6 +264,66 @@ class Stackup:
         """
         return self.density
 
+    def calc_symmetric(self) -> bool:
+        """
+        Check if the ply sequence is symmetric about the midplane.
+        Notes
+        -----
+        The plies are compared by local stiffness, thickness and rotation,
+        not by the values of the ABD-Matrix, so separate but equal materials
+        match. For symmetric stackups the B-Matrix is exactly zero.
+        Returns
+        -------
+        bool
+            True if every ply equals its mirrored counterpart
+        """
+        keys = _get_ply_keys(self.plies)
+        n = len(keys)
+        return all(keys[i] == keys[n - 1 - i] for i in range(n // 2))
+
+    def calc_balanced(self) -> bool:
+        """
+        Check if the ply sequence is balanced.
+        Notes
+        -----
+        The plies are compared by local stiffness, thickness and rotation,
+        not by the values of the ABD-Matrix, so separate but equal materials
+        match.
+        For balanced stackups A_16 and A_26 are exactly zero.
+        Returns
+        -------
+        bool
+            True if every off-axis ply has a counterpart of opposite rotation
+        """
+        counts = dict()
+        for key in _get_ply_keys(self.plies):
+            counts[key] = counts.get(key, 0) + 1
+        for key, count in counts.items():
+            if key[2] not in (0.0, -90.0):
+                if count != counts.get(_get_mirror_key(key), 0):
+                    return False
+        return True
+
+    def is_symmetric(self) -> bool:
+        """
+        Returns if the stackup is symmetric, see **calc_symmetric()**.
+        Returns
+        -------
+        bool
+            True if the ply sequence is symmetric about the midplane
+        """
+        return self.symmetric
+
+    def is_balanced(self) -> bool:
+        """
+        Returns if the stackup is balanced, see **calc_balanced()**.
+        Returns
+        -------
+        bool
+            True if every off-axis ply has a counterpart of opposite rotation
+        """
+        return self.balanced
+
     def rotate(self, angle, degree=False) -> "Stackup":
         """
         Rotate Stackup
@@ -152,54 +363,198 @@ class Stackup:
         Returns
         -------
         array:
-            ABD-Matrix, dim=(6,6)
-        """
-        if self.abd is None:
-            h = self.thickness / 2
-
-            # Create empty matricces for A B en D.
-            A = np.zeros((3, 3))
-            B = np.zeros((3, 3))
-            D = np.zeros((3, 3))
-
-            # Loop over all plies
-            z_bot = -h
-            for ply in self.plies:
-                # Calculate the z coordinates of the top and bottom of the ply.
-                z_top = z_bot + ply.thickness
-
-                # Rotate the local stiffenss matrix.
-                Q_bar = ply.get_stiffness()
-
-                # Calculate the contribution to the A, B and D matrix of this layer.
-                Ai = Q_bar * (z_top - z_bot)
-                Bi = 1 / 2.0 * Q_bar * (z_top**2 - z_bot**2)
-                Di = 1 / 3.0 * Q_bar * (z_top**3 - z_bot**3)
-
-                # Summ this layer to the previous ones.
-                A = A + Ai
-                B = B + Bi
-                D = D + Di
-                z_bot = z_top
-
-            # Compile the entirety of the ABD matrix.
-            self.abd = np.array(
+            copy of the cached ABD-Matrix, dim=(6,6)
+        """
+        if truncate is True:
+            return self._get_abd_truncated().copy()
+        return cached(self, "abd", self.calc_abd).copy()
+
+    def _get_abd_truncated(self) -> np.ndarray:
+        # cached together with the ABD-Matrix, shared by the internal users
+        def truncate():
+            abd = cached(self, "abd", self.calc_abd)
+            # Truncate very small values.
+            return np.where(np.abs(abd) < np.max(abd) * 1e-6, 0, abd)
+
+        return cached(self, "abd_truncated", truncate)
+
+    def calc_abd(self) -> np.ndarray:
+        """
+        Calculate the ABD-Matrix of the stackup.
+        Notes
+        -----
+        **Calculation** means that that the result will allways computated again.
+        If you dont want this use **get_abd()** instead!
+        Returns
+        -------
+        array:
+            ABD-Matrix without truncation, dim=(6,6)
+        """
+        h = self.thickness / 2
+
+        # Create empty matricces for A B en D.
+        A = np.zeros((3, 3))
+        B = np.zeros((3, 3))
+        D = np.zeros((3, 3))
+
+        # Loop over all plies
+        z_bot = -h
+        for ply in self.plies:
+            # Calculate the z coordinates of the top and bottom of the ply.
+            z_top = z_bot + ply.thickness
+
+            # Rotate the local stiffenss matrix.
+            Q_bar = ply.get_stiffness()
+
+            # Calculate the contribution to the A, B and D matrix of this layer.
+            Ai = Q_bar * (z_top - z_bot)
+            Bi = 1 / 2.0 * Q_bar * (z_top**2 - z_bot**2)
+            Di = 1 / 3.0 * Q_bar * (z_top**3 - z_bot**3)
+
+            # Summ this layer to the previous ones.
+            A = A + Ai
+            B = B + Bi
+            D = D + Di
+            z_bot = z_top
+
+        # Compile the entirety of the ABD matrix.
+        abd = np.array(
+            [
+                [A[0, 0], A[0, 1], A[0, 2], B[0, 0], B[0, 1], B[0, 2]],
+                [A[1, 0], A[1, 1], A[1, 2], B[1, 0], B[1, 1], B[1, 2]],
+                [A[2, 0], A[2, 1], A[2, 2], B[2, 0], B[2, 1], B[2, 2]],
+                [B[0, 0], B[0, 1], B[0, 2], D[0, 0], D[0, 1], D[0, 2]],
+                [B[1, 0], B[1, 1], B[1, 2], D[1, 0], D[1, 1], D[1, 2]],
+                [B[2, 0], B[2, 1], B[2, 2], D[2, 0], D[2, 1], D[2, 2]],
+            ]
+        )
+        return self._apply_structure(abd)
+
+    def _apply_structure(self, abd: np.ndarray) -> np.ndarray:
+        # exact zeros instead of round-off for symmetric and balanced stackups
+        if self.symmetric:
+            abd[:3, 3:] = 0.0
+            abd[3:, :3] = 0.0
+        if self.balanced:
+            abd[[0, 1], 2] = 0.0
+            abd[2, [0, 1]] = 0.0
+        return abd
+
+    def get_abd_inv(self) -> np.ndarray:
+        """
+        Returns the inverse of the (truncated) ABD-Matrix.
+        Notes
+        -----
+        The inverse is calculated once and reused by all load applications.
+        Returns
+        -------
+        array:
+            inverse ABD-Matrix, dim=(6,6)
+        """
+        return cached(self, "abd_inv", self.calc_abd_inv)
+
+    def calc_abd_inv(self) -> np.ndarray:
+        """
+        Calculate the inverse of the (truncated) ABD-Matrix.
+        Notes
+        -----
+        Symmetric stackups are inverted as decoupled 3x3 A- and D-Matrices,
+        balanced ones additionally split A_66 from the A-Matrix.
+        Returns
+        -------
+        array:
+            inverse ABD-Matrix, dim=(6,6)
+        """
+        abd = self._get_abd_truncated()
+        if not self.symmetric:
+            return np.linalg.inv(abd)
+
+        abd_inv = np.zeros((6, 6))
+        if self.balanced:
+            abd_inv[:2, :2] = np.linalg.inv(abd[:2, :2])
+            abd_inv[2, 2] = 1.0 / abd[2, 2]
+        else:
+            abd_inv[:3, :3] = np.linalg.inv(abd[:3, :3])
+        abd_inv[3:, 3:] = np.linalg.inv(abd[3:, 3:])
+        return abd_inv
+
+    def get_layers(self) -> dict:
+        """
+        Returns the stacked ply data used by the vectorized analysis.
+        Returns
+        -------
+        dict
+            - "z": z-coordinates of the sample points (bottom, top), dim=(n_plies, 2)
+            - "strain_transformation": global to ply strains, dim=(n_plies, 3, 3)
+            - "stiffness": stiffness in ply coordinates, dim=(n_plies, 3, 3)
+            - "thermal_expansion": ply coefficients in ply coordinates, dim=(n_plies, 3)
+            - "hygral_expansion": ply coefficients in ply coordinates, dim=(n_plies, 3)
+            - "thermal_load": load of a unit temperature change, dim=(6,)
+            - "hygral_load": load of a unit moisture change, dim=(6,)
+            - "groups": list of (material, ply indices) sharing the same material
+        """
+        return cached(self, "layers", self.calc_layers)
+
+    def calc_layers(self) -> dict:
+        """
+        Calculate the stacked ply data, see **get_layers()**.
+        Returns
+        -------
+        dict
+            stacked ply data
+        """
+        thickness = np.array([ply.get_thickness() for ply in self.plies])
+        z_top = np.cumsum(thickness) - self.thickness / 2
+        groups = dict()
+        for i, ply in enumerate(self.plies):
+            material = ply.get_material()
+            groups.setdefault(id(material), (material, []))[1].append(i)
+        z = np.stack([z_top - thickness, z_top], axis=-1)
+        transformation = np.array(
+            [ply.get_strain_transformation() for ply in self.plies]
+        )
+        stiffness = np.array([ply.get_stiffness(local=True) for ply in self.plies])
+        layers = dict(
+            z=z,
+            strain_transformation=transformation,
+            stiffness=stiffness,
+            groups=[(m, np.array(ids)) for m, ids in groups.values()],
+        )
+        # free expansion loads: N = sum Qbar alpha dz, M = sum Qbar alpha z dz
+        weights = np.stack([z[:, 1] - z[:, 0], (z[:, 1] ** 2 - z[:, 0] ** 2) / 2])
+        for kind in ["thermal", "hygral"]:
+            expansion = np.array(
                 [
-                    [A[0, 0], A[0, 1], A[0, 2], B[0, 0], B[0, 1], B[0, 2]],
-                    [A[1, 0], A[1, 1], A[1, 2], B[1, 0], B[1, 1], B[1, 2]],
-                    [A[2, 0], A[2, 1], A[2, 2], B[2, 0], B[2, 1], B[2, 2]],
-                    [B[0, 0], B[0, 1], B[0, 2], D[0, 0], D[0, 1], D[0, 2]],
-                    [B[1, 0], B[1, 1], B[1, 2], D[1, 0], D[1, 1], D[1, 2]],
-                    [B[2, 0], B[2, 1], B[2, 2], D[2, 0], D[2, 1], D[2, 2]],
+                    getattr(ply, f"get_{kind}_expansion")(local=True)
+                    for ply in self.plies
                 ]
             )
+            # Qbar alpha_global = T^T Q alpha_local
+            stress = np.einsum("pji,pjk,pk->pi", transformation, stiffness, expansion)
+            layers[f"{kind}_expansion"] = expansion
+            layers[f"{kind}_load"] = np.matmul(weights, stress).ravel()
+        return layers
 
-        # Truncate very small values.
-        if truncate is True:
-            return np.array(
-                np.where(np.abs(self.abd) < np.max(self.abd) * 1e-6, 0, self.abd)
-            )
-        return self.abd
+    def get_criteria(self) -> dict:
+        """
+        Plies evaluated by each failure criterion.
+        Notes
+        -----
+        The failure ids are taken from one evaluation of every material at zero
+        loading. Plies without a criterion get NaN values in **analyze()**.
+        Returns
+        -------
+        dict
+            failure id and mask of the plies with the criterion, dim=(n_plies,)
+        """
+        criteria = dict()
+        for material, ids in self.get_layers()["groups"]:
+            zeros = np.zeros((1, 3))
+            for key in material.get_batch_failure(zeros, zeros):
+                if key not in criteria:
+                    criteria[key] = np.zeros(len(self.plies), dtype=bool)
+                criteria[key][ids] = True
+        return criteria
 
     def calc_homogenized(self) -> TransverselyIsotropicMaterial:
         """
@@ -210,15 +565,205 @@ class Stackup:
             Homogenized Stackup
         """
         scale = 1.0 / self.get_thickness()
-        e_1 = scale * (
-            self.get_abd()[0, 0] - (self.get_abd()[0, 1]) ** 2 / self.get_abd()[1, 1]
+        abd = self._get_abd_truncated()
+        e_1 = scale * (abd[0, 0] - abd[0, 1] ** 2 / abd[1, 1])
+        e_2 = scale * (abd[1, 1] - abd[0, 1] ** 2 / abd[0, 0])
+        g_12 = scale * abd[2, 2]
+        nu_12 = abd[0, 1] / abd[1, 1]
+        return TransverselyIsotropicMaterial(e_1, e_2, nu_12, g_12, self.get_density())
+
+    def get_homogenized(self) -> TransverselyIsotropicMaterial:
+        """
+        Returns the homogenized Stackup, see **calc_homogenized()**.
+        Notes
+        -----
+        The material is calculated once and cached.
+        Returns
+        -------
+        TransverselyIsotropicMaterial
+            Homogenized Stackup
+        """
+        return cached(self, "homogenized", self.calc_homogenized)
+
+    def set_ply(self, index: int, ply: Ply):
+        """
+        Replace a ply and update the cached data incrementally.
+        Parameters
+        ----------
+        index : int
+            index of the ply, order is bottom to top
+        ply : Ply
+            new ply
+        Notes
+        -----
+        - A ply with the same thickness is replaced in O(1),
+          a new thickness shifts the plies above it, O(plies above).
+        - The first edit takes O(plies): it copies the ply list and tracks
+          the ply z-coordinates and the pairs of symmetric and balanced plies,
+          so later edits update **is_symmetric()** and **is_balanced()**
+          locally.
+        - Only the ABD-Matrix is updated. Its inverse, the homogenized material
+          and the layers are deliberately dropped and recalculated lazily on
+          their next use: a 6x6 inverse costs as much as a rank-6 update of
+          it, and edits in a row should not pay for unused data.
+        - The stackup is changed in place,
+          edits are not synchronized with concurrent readers.
+        Examples
+        --------
+        >>> stackup.set_ply(2, Ply(material, 0.25, 45.0, degree=True))
+        """
+        index = range(len(self.plies))[index]
+        old = self.plies[index]
+        density = ply.get_material().get_density()
+        if density is None:
+            raise ValueError(f"Density is not defined for Material in Layer {index}.")
+
+        tracking = self._get_tracking()
+        z_bot = tracking["z_bot"]
+        abd = self.abd
+        if abd is not None:
+            abd = self._update_abd(abd, index, ply, z_bot[index])
+
+        mass = self.density * self.thickness
+        mass += (
+            ply.thickness * density - old.thickness * old.get_material().get_density()
         )
-        e_2 = scale * (
-            self.get_abd()[1, 1] - (self.get_abd()[0, 1]) ** 2 / self.get_abd()[0, 0]
+        self.plies[index] = ply
+        self.thickness = self.thickness + ply.thickness - old.thickness
+        self.density = mass / self.thickness
+        if ply.thickness != old.thickness:
+            z_bot[index + 1 :] += ply.thickness - old.thickness
+        self._update_structure(tracking, index, _get_ply_key(ply))
+
+        self.abd = None if abd is None else self._apply_structure(abd)
+        self.abd_truncated = None
+        self.abd_inv = None
+        self.layers = None
+        self.homogenized = None
+
+    def set_rotation(self, index: int, rotation: float, degree=False):
+        """
+        Change the rotation of a ply in O(1), see **set_ply()**.
+        Parameters
+        ----------
+        index : int
+            index of the ply, order is bottom to top
+        rotation : float
+            new rotation of the ply in [rad] or [deg] when degree is set True
+        degree : bool, optional
+            changes the measurement system of rotation, default is False
+        """
+        ply = self.plies[index]
+        self.set_ply(
+            index, Ply(ply.get_material(), ply.get_thickness(), rotation, degree)
         )
-        g_12 = scale * self.get_abd()[2, 2]
-        nu_12 = self.get_abd()[0, 1] / self.get_abd()[1, 1]
-        return TransverselyIsotropicMaterial(e_1, e_2, nu_12, g_12, self.get_density())
+
+    def set_thickness(self, index: int, thickness: float):
+        """
+        Change the thickness of a ply in O(plies above), see **set_ply()**.
+        Parameters
+        ----------
+        index : int
+            index of the ply, order is bottom to top
+        thickness : float
+            new thickness of the ply
+        """
+        ply = self.plies[index]
+        self.set_ply(index, Ply(ply.get_material(), thickness, ply.get_rotation()))
+
+    def set_material(self, index: int, material: Material):
+        """
+        Change the material of a ply in O(1), see **set_ply()**.
+        Parameters
+        ----------
+        index : int
+            index of the ply, order is bottom to top
+        material : Material
+            new material of the ply
+        """
+        ply = self.plies[index]
+        self.set_ply(index, Ply(material, ply.get_thickness(), ply.get_rotation()))
+
+    def _get_tracking(self) -> dict:
+        # state of the incremental edits, rebuilt if the ply list was replaced
+        tracking = self.tracking
+        if tracking is not None and tracking["plies"] is self.plies:
+            return tracking
+        self.plies = list(self.plies)
+        thickness = np.array([ply.thickness for ply in self.plies], dtype=float)
+        keys = _get_ply_keys(self.plies)
+        n = len(keys)
+        tracking = dict(
+            plies=self.plies,
+            z_bot=np.cumsum(thickness) - thickness,
+            keys=keys,
+            counts=dict(),
+            asymmetric=sum(keys[i] != keys[n - 1 - i] for i in range(n // 2)),
+            unbalanced=set(),
+        )
+        for key in keys:
+            tracking["counts"][key] = tracking["counts"].get(key, 0) + 1
+        for key in tracking["counts"]:
+            _update_balance(tracking, key)
+        self.tracking = tracking
+        return tracking
+
+    def _update_structure(self, tracking: dict, index: int, key: tuple):
+        keys = tracking["keys"]
+        old = keys[index]
+        mirror = len(keys) - 1 - index
+        if mirror != index:
+            tracking["asymmetric"] += int(key != keys[mirror]) - int(
+                old != keys[mirror]
+            )
+        keys[index] = key
+
+        counts = tracking["counts"]
+        counts[old] -= 1
+        if counts[old] == 0:
+            del counts[old]
+        counts[key] = counts.get(key, 0) + 1
+        _update_balance(tracking, old)
+        _update_balance(tracking, key)
+
+        self.symmetric = tracking["asymmetric"] == 0
+        self.balanced = len(tracking["unbalanced"]) == 0
+
+    def _update_abd(
+        self, abd: np.ndarray, index: int, ply: Ply, z_bot: float
+    ) -> np.ndarray:
+        # moments about the bottom of the stackup
+        h = self.thickness / 2
+        moments = shift_moments(split_abd(abd), -h)
+
+        old = self.plies[index]
+        moments = (
+            moments
+            + get_moments(ply.get_stiffness(), z_bot, z_bot + ply.thickness)
+            - get_moments(old.get_stiffness(), z_bot, z_bot + old.thickness)
+        )
+
+        # plies above are shifted by the change of thickness
+        delta = ply.thickness - old.thickness
+        if delta != 0.0 and index + 1 < len(self.plies):
+            above = self.plies[index + 1 :]
+            thickness = np.array([p.thickness for p in above])
+            z_top = z_bot + old.thickness + np.cumsum(thickness)
+            above = get_moments(
+                np.array([p.get_stiffness() for p in above]),
+                z_top - thickness,
+                z_top,
+            ).sum(axis=0)
+            moments = moments + np.stack(
+                [
+                    np.zeros((3, 3)),
+                    delta * above[0],
+                    2 * delta * above[1] + delta**2 * above[0],
+                ]
+            )
+
+        h_new = h + delta / 2
+        return assemble_abd(shift_moments(moments, h_new))
 
     def apply_load(self, mech_load: np.ndarray) -> np.ndarray:
         """
@@ -235,7 +780,39 @@ class Stackup:
             This deformation consists of :math:`(varepsilon_x, varepsilon_y
             varepsilon_{xy},kappa_x, kappa_y, kappa_{xy})^T`
         """
-        return np.ravel(np.linalg.inv(self.get_abd()).dot(mech_load))
+        return np.ravel(self.get_abd_inv().dot(mech_load))
+
+    def get_thermal_load(self, delta_t: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Force and moment resultants of free thermal expansion.
+        Parameters
+        ----------
+        delta_t : float or array
+            temperature changes, dim=(N,)
+        Returns
+        -------
+        array
+            :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})` per temperature change,
+            dim=(N, 6)
+        """
+        delta_t = np.atleast_1d(np.asarray(delta_t, dtype=float))
+        return delta_t[:, None] * self.get_layers()["thermal_load"]
+
+    def get_hygral_load(self, delta_m: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Force and moment resultants of free moisture expansion.
+        Parameters
+        ----------
+        delta_m : float or array
+            moisture changes, dim=(N,)
+        Returns
+        -------
+        array
+            :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})` per moisture change,
+            dim=(N, 6)
+        """
+        delta_m = np.atleast_1d(np.asarray(delta_m, dtype=float))
+        return delta_m[:, None] * self.get_layers()["hygral_load"]
 
     def apply_deformation(self, deformation: np.ndarray) -> np.ndarray:
         """
@@ -252,7 +829,7 @@ class Stackup:
             The load vector consits of are
             :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})^T`
         """
-        return np.ravel(self.get_abd().dot(deformation))
+        return np.ravel(self._get_abd_truncated().dot(deformation))
 
     def get_strains(
         self, deformation: np.ndarray
@@ -372,3 +949,257 @@ class Stackup:
                 )
             )
         return failures
+
+    def analyze(
+        self,
+        loads: Union[List[List[float]], np.ndarray],
+        failures_only=False,
+        delta_t: Optional[Union[float, np.ndarray]] = None,
+        delta_m: Optional[Union[float, np.ndarray]] = None,
+        dtype=np.float64,
+    ) -> dict:
+        """
+        Vectorized load to failure chain of many load cases.
+        Parameters
+        ----------
+        loads : array
+            load cases :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})`, dim=(N, 6)
+        failures_only : bool, optional
+            when true: only return the failures to save memory, default False
+        delta_t : float or array, optional
+            temperature change per load case, dim=(N,)
+        delta_m : float or array, optional
+            moisture change per load case, dim=(N,)
+        dtype : numpy.dtype, optional
+            precision of the ply strains, stresses and failures, default float64
+        Returns
+        -------
+        dict
+            - "deformations": midplane strains and curvatures, dim=(N, 6)
+            - "strains": mechanical strains in ply coordinates, dim=(N, n_plies, 2, 3)
+            - "stresses": stresses in ply coordinates, dim=(N, n_plies, 2, 3)
+            - "failures": dict of failure id and values, dim=(N, n_plies, 2)
+        Notes
+        -----
+        The sample points are the bottom (0) and top (1) of each ply,
+        equal to **get_strains()**, **get_stresses()** and **get_failure()**.
+        Plies whose material lacks a failure criterion are set to NaN.
+        Temperature and moisture changes add their resultants
+        (**get_thermal_load()**, **get_hygral_load()**) to the loads, the
+        mechanical strains are the total strains minus the free expansion.
+        The ABD-Matrix inversion and the deformations always use float64,
+        with dtype=float32 the ply results have a relative accuracy of about 1e-6
+        at half the memory. Failure values close to a singularity of their
+        criterion (e.g. Cuntze with a vanishing shear denominator) can lose more.
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        if delta_t is not None:
+            loads = loads + self.get_thermal_load(delta_t)
+        if delta_m is not None:
+            loads = loads + self.get_hygral_load(delta_m)
+        abd_inv = self.get_abd_inv()
+        if self.symmetric:
+            # B = 0, membrane and bending deformations decouple
+            deformations = np.concatenate(
+                [
+                    np.matmul(loads[:, :3], abd_inv[:3, :3].T),
+                    np.matmul(loads[:, 3:], abd_inv[3:, 3:].T),
+                ],
+                axis=1,
+            )
+        else:
+            deformations = np.matmul(loads, abd_inv.T)
+        return self.recover(deformations, failures_only, delta_t, delta_m, dtype)
+
+    def recover(
+        self,
+        deformations: Union[List[List[float]], np.ndarray],
+        failures_only=False,
+        delta_t: Optional[Union[float, np.ndarray]] = None,
+        delta_m: Optional[Union[float, np.ndarray]] = None,
+        dtype=np.float64,
+    ) -> dict:
+        """
+        Vectorized ply strains, stresses and failures of given deformations.
+        Parameters
+        ----------
+        deformations : array
+            midplane strains and curvatures, e.g. of shell elements, dim=(N, 6)
+        failures_only : bool, optional
+            when true: only return the failures to save memory, default False
+        delta_t : float or array, optional
+            temperature change per deformation, dim=(N,)
+        delta_m : float or array, optional
+            moisture change per deformation, dim=(N,)
+        dtype : numpy.dtype, optional
+            precision of the ply strains, stresses and failures, default float64
+        Returns
+        -------
+        dict
+            same as **analyze()**
+        """
+        deformations = np.atleast_2d(np.asarray(deformations, dtype=float))
+        layers = self.get_layers()
+        expansions = []
+        for kind, delta in [("thermal", delta_t), ("hygral", delta_m)]:
+            if delta is not None:
+                delta = np.atleast_1d(np.asarray(delta, dtype=float))
+                expansions.append((layers[f"{kind}_expansion"], delta))
+        if expansions:
+            n_cases = max([len(deformations)] + [len(d) for _, d in expansions])
+            deformations = np.broadcast_to(deformations, (n_cases, 6))
+
+        n_cases = len(deformations)
+        shape = (n_cases, len(self.plies), 2)
+        result = dict()
+        if not failures_only:
+            result["deformations"] = deformations
+            result["strains"] = np.empty(shape + (3,), dtype=dtype)
+            result["stresses"] = np.empty(shape + (3,), dtype=dtype)
+
+        deformations = deformations.astype(dtype, copy=False)
+        failures = dict()
+        for material, ids in layers["groups"]:
+            # strains at the sample points in global and ply coordinates
+            z = layers["z"][ids].astype(dtype)
+            strains = (
+                deformations[:, None, None, :3]
+                + z[None, :, :, None] * deformations[:, None, None, 3:]
+            )
+            transformation = layers["strain_transformation"][ids].astype(dtype)
+            strains = np.matmul(strains, np.swapaxes(transformation, -1, -2))
+            for expansion, delta in expansions:
+                expansion = expansion[ids, None].astype(dtype)
+                strains = strains - delta[:, None, None, None].astype(dtype) * expansion
+            stiffness = layers["stiffness"][ids].astype(dtype)
+            stresses = np.matmul(strains, np.swapaxes(stiffness, -1, -2))
+            if not failures_only:
+                result["strains"][:, ids] = strains
+                result["stresses"][:, ids] = stresses
+
+            for key, value in material.get_batch_failure(stresses, strains).items():
+                if key not in failures:
+                    failures[key] = np.full(shape, np.nan, dtype=dtype)
+                failures[key][:, ids] = value
+        result["failures"] = failures
+        return result
+
+    def analyze_stream(
+        self,
+        source: Union[str, os.PathLike, np.ndarray],
+        chunk_size=65536,
+        failures_only=False,
+        delimiter=",",
+        dtype=np.float64,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Chunked version of **analyze()** for load sets exceeding the memory.
+        Parameters
+        ----------
+        source : str, path-like or array
+            array of load cases, path of a **.npy** file or of a text (CSV) file
+        chunk_size : int, optional
+            maximal number of load cases per chunk, default 65536
+        failures_only : bool, optional
+            when true: only return the failures to save memory, default False
+        delimiter : str, optional
+            delimiter of the text file, default ","
+        dtype : numpy.dtype, optional
+            precision of the ply results, default float64
+        Returns
+        -------
+        Iterator[Tuple[int, dict]]
+            index of the first load case of the chunk and the result of **analyze()**
+        Examples
+        --------
+        >>> for start, result in stackup.analyze_stream("loads.npy", 10000):
+        ...     output[start : start + 10000] = result["failures"]["cuntze"]
+        """
+        start = 0
+        for loads in iter_loads(source, chunk_size, delimiter):
+            yield start, self.analyze(loads, failures_only=failures_only, dtype=dtype)
+            start += len(loads)
+
+    def get_envelope(
+        self,
+        source: Union[str, os.PathLike, np.ndarray],
+        chunk_size=65536,
+        top_k: Optional[int] = None,
+        delimiter=",",
+        dtype=np.float64,
+    ) -> Envelope:
+        """
+        Worst case failure values per ply and sample point over all load cases.
+        Parameters
+        ----------
+        source : str, path-like or array
+            array of load cases, path of a **.npy** file or of a text (CSV) file
+        chunk_size : int, optional
+            maximal number of load cases per chunk, default 65536
+        top_k : int, optional
+            additionally keep the k largest values and their load cases
+        delimiter : str, optional
+            delimiter of the text file, default ","
+        dtype : numpy.dtype, optional
+            precision of the ply results, default float64
+        Returns
+        -------
+        Envelope
+            running maximum and load case index per criterion, ply and sample point
+        """
+        envelope = Envelope(top_k)
+        defined = self.get_criteria()
+        for start, result in self.analyze_stream(
+            source, chunk_size, failures_only=True, delimiter=delimiter, dtype=dtype
+        ):
+            envelope.update(result["failures"], start, defined)
+        return envelope
+
+    def get_critical(
+        self,
+        source: Union[str, os.PathLike, np.ndarray],
+        k=100,
+        chunk_size=65536,
+        element: Optional[int] = None,
+        delimiter=",",
+        dtype=np.float64,
+    ) -> CriticalLocations:
+        """
+        The k most critical plies, sample points and load cases per criterion.
+        Parameters
+        ----------
+        source : str, path-like or array
+            array of load cases, path of a **.npy** file or of a text (CSV) file
+        k : int, optional
+            number of kept locations per criterion, default 100
+        chunk_size : int, optional
+            maximal number of load cases per chunk, default 65536
+        element : int, optional
+            element of the stackup, to merge the trackers of several elements
+        delimiter : str, optional
+            delimiter of the text file, default ","
+        dtype : numpy.dtype, optional
+            precision of the ply results, default float64
+        Returns
+        -------
+        CriticalLocations
+            ranked locations with their stresses and strains
+        Examples
+        --------
+        >>> critical = stackup.get_critical("loads.npy", k=100)
+        >>> critical.get_result()["cuntze"]["case"][0]  # most critical load case
+        """
+        critical = CriticalLocations(k)
+        defined = self.get_criteria()
+        for start, result in self.analyze_stream(
+            source, chunk_size, delimiter=delimiter, dtype=dtype
+        ):
+            critical.update(
+                result["failures"],
+                start,
+                element,
+                result["stresses"],
+                result["strains"],
+                defined,
+            )
+        return critical
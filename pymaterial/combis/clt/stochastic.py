@@ -0,0 +1,289 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.materials.micromechanics import get_plane_stiffness
+from .stackup import Stackup, assemble_abd, get_moments
+
+MATERIAL_SCATTER = ["E_l", "E_t", "nu_lt", "G_lt"]
+SCATTER = MATERIAL_SCATTER + ["thickness", "rotation"]
+
+# standard normal quantiles of 90 % content and 95 % confidence (B-basis)
+_Z_CONTENT = 1.2815515655446004
+_Z_CONFIDENCE = 1.6448536269514722
+
+
+class Statistics:
+    def __init__(self):
+        """
+        Streaming statistics of sampled values.
+        Notes
+        -----
+        Chunks are combined with the parallel variant of Welford's algorithm
+        (Chan et al.), so memory is independent of the number of samples and
+        partial statistics of several workers can be merged.
+        Examples
+        --------
+        >>> statistics = Statistics()
+        >>> for chunk in chunks:
+        ...     statistics.update(chunk)
+        >>> statistics.get_result()["mean"]
+        """
+        self.count = 0
+        self.mean = None
+        self.m2 = None
+        self.min = None
+        self.max = None
+
+    def update(self, values: np.ndarray):
+        """
+        Add a chunk of samples.
+        Parameters
+        ----------
+        values : array
+            samples along the first axis, dim=(n_samples, ...)
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        other = Statistics()
+        other.count = len(values)
+        other.mean = np.mean(values, axis=0)
+        other.m2 = np.sum((values - other.mean) ** 2, axis=0)
+        other.min = np.min(values, axis=0)
+        other.max = np.max(values, axis=0)
+        self.merge(other)
+
+    def merge(self, other: "Statistics"):
+        """
+        Combine with the statistics of other samples.
+        Parameters
+        ----------
+        other : Statistics
+            statistics to merge into this one
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean
+            self.m2 = other.m2
+            self.min = other.min
+            self.max = other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.count = count
+
+    def get_b_basis_factor(self) -> float:
+        """
+        One-sided tolerance factor of a normal distribution for the B-basis.
+        Notes
+        -----
+        Uses the approximation of Natrella for 90 % content at 95 % confidence,
+        NaN for less than three samples.
+        Returns
+        -------
+        float
+            factor k of the tolerance bound :math:`\\mu \\pm k \\sigma`
+        """
+        n = self.count
+        if n < 3:
+            return np.nan
+        a = 1.0 - _Z_CONFIDENCE**2 / (2.0 * (n - 1))
+        b = _Z_CONTENT**2 - _Z_CONFIDENCE**2 / n
+        return (_Z_CONTENT + np.sqrt(_Z_CONTENT**2 - a * b)) / a
+
+    def get_result(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            "count", "mean", "std" (sample standard deviation), "min", "max"
+            and "b_basis", the upper B-basis bound :math:`\\mu + k \\sigma`
+        """
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        return dict(
+            count=self.count,
+            mean=self.mean,
+            std=std,
+            min=self.min,
+            max=self.max,
+            b_basis=self.mean + self.get_b_basis_factor() * std,
+        )
+
+
+def _get_scatter(stackup: Stackup, scatter: dict) -> dict:
+    for key, value in scatter.items():
+        if key not in SCATTER:
+            raise ValueError(f"Unknown scatter '{key}'! (Possible: {SCATTER})")
+        if value < 0:
+            raise ValueError(f"Scatter of '{key}' has to be positive! (Got: {value})")
+    if any(key in scatter for key in MATERIAL_SCATTER):
+        for material, _ in stackup.get_layers()["groups"]:
+            if not isinstance(material, TransverselyIsotropicMaterial):
+                raise ValueError(
+                    "Scatter of material constants requires "
+                    "TransverselyIsotropicMaterial plies."
+                )
+    return scatter
+
+
+def _run_chunk(
+    stackup: Stackup,
+    loads: np.ndarray,
+    scatter: dict,
+    n_samples: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, Statistics]:
+    plies = stackup.get_plies()
+    layers = stackup.get_layers()
+    n_plies = len(plies)
+    material_rng, thickness_rng, rotation_rng = [
+        np.random.default_rng(s) for s in seed.spawn(3)
+    ]
+
+    # local ply stiffness, material constants scatter per material and sample
+    stiffness = np.broadcast_to(layers["stiffness"], (n_samples, n_plies, 3, 3))
+    if any(key in scatter for key in MATERIAL_SCATTER):
+        stiffness = stiffness.copy()
+        noise = material_rng.standard_normal(
+            (len(layers["groups"]), len(MATERIAL_SCATTER), n_samples)
+        )
+        for (material, ids), values in zip(layers["groups"], noise):
+            constants = {
+                key: getattr(material, key) * (1.0 + scatter.get(key, 0.0) * value)
+                for key, value in zip(MATERIAL_SCATTER, values)
+            }
+            stiffness[:, ids] = get_plane_stiffness(constants)[:, None]
+
+    thickness = np.array([ply.get_thickness() for ply in plies])
+    thickness = thickness * (
+        1.0
+        + scatter.get("thickness", 0.0)
+        * thickness_rng.standard_normal((n_samples, n_plies))
+    )
+    rotation = np.array([ply.get_rotation() for ply in plies])
+    rotation = rotation + scatter.get("rotation", 0.0) * rotation_rng.standard_normal(
+        (n_samples, n_plies)
+    )
+
+    # batched ABD-Matrices, dim=(n, 6, 6)
+    c = np.cos(rotation)
+    s = np.sin(rotation)
+    transformation = np.stack(
+        [
+            np.stack([c**2, s**2, c * s], axis=-1),
+            np.stack([s**2, c**2, -c * s], axis=-1),
+            np.stack([-2 * c * s, 2 * c * s, c**2 - s**2], axis=-1),
+        ],
+        axis=-2,
+    )
+    rotated = np.einsum(
+        "npji,npjk,npkl->npil", transformation, stiffness, transformation
+    )
+    z_top = np.cumsum(thickness, axis=1) - np.sum(thickness, axis=1, keepdims=True) / 2
+    z = np.stack([z_top - thickness, z_top], axis=-1)
+    abd = assemble_abd(np.sum(get_moments(rotated, z[..., 0], z[..., 1]), axis=1))
+
+    # strain and stress recovery, dim=(n, n_loads, n_plies, 2, 3)
+    deformations = np.swapaxes(np.linalg.solve(abd, loads.T), -1, -2)
+    strains = (
+        deformations[:, :, None, None, :3]
+        + z[:, None, :, :, None] * deformations[:, :, None, None, 3:]
+    )
+    strains = np.einsum("npij,nlpkj->nlpki", transformation, strains)
+    stresses = np.einsum("npij,nlpkj->nlpki", stiffness, strains)
+
+    result = dict(deformations=Statistics())
+    result["deformations"].update(deformations)
+    failures = dict()
+    for material, ids in layers["groups"]:
+        values = material.get_batch_failure(stresses[:, :, ids], strains[:, :, ids])
+        for key, value in values.items():
+            value = np.max(value, axis=(2, 3))
+            failures[key] = np.fmax(failures[key], value) if key in failures else value
+    for key, value in failures.items():
+        result[key] = Statistics()
+        result[key].update(value)
+    return result
+
+
+def get_monte_carlo(
+    stackup: Stackup,
+    loads: Union[List[List[float]], np.ndarray],
+    samples: int,
+    scatter: Dict[str, float],
+    seed: Optional[int] = None,
+    chunk_size=10000,
+    workers: Optional[int] = 1,
+) -> dict:
+    """
+    Monte Carlo propagation of material, thickness and rotation scatter.
+    Parameters
+    ----------
+    stackup : Stackup
+        nominal stackup
+    loads : array
+        load cases :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})`, dim=(N, 6)
+    samples : int
+        number of samples
+    scatter : dict
+        - "E_l", "E_t", "nu_lt", "G_lt": coefficients of variation of the
+          material constants, sampled per material
+        - "thickness": coefficient of variation of the ply thicknesses
+        - "rotation": standard deviation of the ply rotations in [rad]
+    seed : int, optional
+        seed of the random numbers
+    chunk_size : int, optional
+        number of samples evaluated at once, default 10000
+    workers : int, optional
+        number of worker processes, default 1 (serial)
+    Notes
+    -----
+    All variables are normally distributed. Every chunk gets its own random
+    streams, spawned from one **numpy.random.SeedSequence**, with independent
+    streams for the material constants, thicknesses and rotations. So the
+    results are reproducible for equal seed and chunk size, independent of
+    the number of workers.
+    Per chunk the ABD-Matrices, ply strains, stresses and failure values of all
+    samples are evaluated batched, only the streaming statistics are kept.
+    Returns
+    -------
+    dict
+        results of **Statistics.get_result()** for
+        - "deformations": midplane strains and curvatures, dim=(N, 6)
+        - failure ids: largest failure value of the stackup, dim=(N,)
+    Examples
+    --------
+    >>> scatter = dict(E_l=0.05, E_t=0.05, G_lt=0.05, thickness=0.03, rotation=0.02)
+    >>> result = get_monte_carlo(stackup, loads, 100000, scatter, seed=0)
+    >>> result["cuntze"]["b_basis"]
+    """
+    if samples < 1:
+        raise ValueError(f"Samples has to be greater 0! (recieved: {samples})")
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size has to be greater 0! (recieved: {chunk_size})")
+    scatter = _get_scatter(stackup, scatter)
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    sizes = [
+        min(chunk_size, samples - start) for start in range(0, samples, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(stackup, loads, scatter, size, s) for size, s in zip(sizes, seeds)]
+
+    if workers is None or workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            chunks = list(executor.map(_run_chunk, *zip(*jobs)))
+    else:
+        chunks = [_run_chunk(*job) for job in jobs]
+
+    statistics = dict()
+    for chunk in chunks:
+        for key, value in chunk.items():
+            statistics.setdefault(key, Statistics()).merge(value)
+    return {key: value.get_result() for key, value in statistics.items()}
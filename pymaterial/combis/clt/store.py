@@ -0,0 +1,244 @@
+import json
+import os
+import time
+import uuid
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+
+Selection = Optional[Union[int, slice, Sequence[int], np.ndarray]]
+
+_RESULTS = ["deformations", "strains", "stresses"]
+
+
+class ResultStore:
+    def __init__(self, path: str):
+        """
+        Chunked columnar on-disk store of **Stackup.analyze()** results.
+        Parameters
+        ----------
+        path : str
+            directory of the store, created if missing
+        Notes
+        -----
+        Every **append()** writes one shard: a directory with one **.npy** file
+        per column ("deformations", "strains", "stresses" and "failures.<id>")
+        and a small json file with its first element, number of elements,
+        column shapes and dtypes. The shard files are written under a temporary
+        name and renamed, the json file last, so readers only see complete
+        shards and several threads or processes can append without locks.
+        Reads memory-map the shards and copy only the requested elements,
+        plies and criteria.
+        Examples
+        --------
+        >>> store = ResultStore("results")
+        >>> for start, result in stackup.analyze_stream("loads.npy", 65536):
+        ...     store.append(result, start)
+        >>> store.read("stresses", elements=[10, 20000], plies=0)  # dim=(2, 2, 3)
+        >>> store.read_failures(["cuntze"], elements=slice(0, 100))
+        """
+        self.path = path
+        self.shards = os.path.join(path, "shards")
+        os.makedirs(self.shards, exist_ok=True)
+
+    def append(self, result: dict, start: Optional[int] = None) -> str:
+        """
+        Write the result of a chunk of elements (load cases) as one shard.
+        Parameters
+        ----------
+        result : dict
+            result of **Stackup.analyze()**, **Stackup.recover()** or
+            **recover_elements()**, every array with the elements along axis 0
+        start : int, optional
+            index of the first element of the chunk, e.g. from
+            **Stackup.analyze_stream()**. Without start, shards are ordered
+            by their creation.
+        Returns
+        -------
+        str
+            name of the shard
+        """
+        columns = {key: result[key] for key in _RESULTS if key in result}
+        for key, values in result.get("failures", dict()).items():
+            columns[f"failures.{key}"] = values
+        columns = {key: np.asarray(values) for key, values in columns.items()}
+        counts = {len(values) for values in columns.values()}
+        if len(counts) != 1:
+            raise ValueError(
+                f"All results require the same number of elements! (Got: {counts})"
+            )
+        if start is not None and start < 0:
+            raise ValueError(f"Start has to be positive! (recieved: {start})")
+
+        # sortable by creation, unique across threads and processes
+        name = f"{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        directory = os.path.join(self.shards, name)
+        temporary = os.path.join(self.shards, f".{name}")
+        os.makedirs(temporary)
+        for key, values in columns.items():
+            np.save(os.path.join(temporary, f"{key}.npy"), values)
+        os.rename(temporary, directory)
+
+        meta = dict(
+            name=name,
+            start=None if start is None else int(start),
+            count=counts.pop(),
+            columns={
+                key: dict(shape=list(values.shape[1:]), dtype=values.dtype.str)
+                for key, values in columns.items()
+            },
+        )
+        with open(os.path.join(self.shards, f".{name}.json"), "w") as file:
+            json.dump(meta, file)
+        os.replace(
+            os.path.join(self.shards, f".{name}.json"),
+            os.path.join(self.shards, f"{name}.json"),
+        )
+        return name
+
+    def get_index(self) -> List[dict]:
+        """
+        Index of the complete shards ordered by their first element.
+        Notes
+        -----
+        Shards either all have a start or none, overlapping shards are invalid.
+        Returns
+        -------
+        List[dict]
+            json meta of the shards with "name", "start", "count" and "columns"
+        """
+        index = []
+        for file_name in sorted(os.listdir(self.shards)):
+            if file_name.endswith(".json") and not file_name.startswith("."):
+                with open(os.path.join(self.shards, file_name)) as file:
+                    index.append(json.load(file))
+        explicit = [meta["start"] is not None for meta in index]
+        if any(explicit) and not all(explicit):
+            raise ValueError("Shards with and without start can not be combined!")
+        if not any(explicit):
+            start = 0
+            for meta in index:
+                meta["start"] = start
+                start += meta["count"]
+        index.sort(key=lambda meta: meta["start"])
+        for previous, meta in zip(index, index[1:]):
+            if previous["start"] + previous["count"] > meta["start"]:
+                raise ValueError(
+                    f"Shards {previous['name']} and {meta['name']} overlap!"
+                )
+        return index
+
+    def __len__(self) -> int:
+        index = self.get_index()
+        return index[-1]["start"] + index[-1]["count"] if index else 0
+
+    def get_columns(self) -> Dict[str, dict]:
+        """
+        Returns
+        -------
+        dict
+            column name and dict of "shape" per element and "dtype"
+        """
+        return _get_columns(self.get_index())
+
+    def read(self, column: str, elements: Selection = None, plies: Selection = None):
+        """
+        Read a subset of a column.
+        Parameters
+        ----------
+        column : str
+            "deformations", "strains", "stresses" or "failures.<id>"
+        elements : int, slice or array, optional
+            indices of the elements, default all
+        plies : int, slice or array, optional
+            indices of the plies (axis 1), not for "deformations", default all
+        Notes
+        -----
+        Only the shards containing requested elements are opened, memory-mapped.
+        Returns
+        -------
+        array
+            values, dim=(n_elements, ...) or (n_elements, n_plies, ...)
+        """
+        index = self.get_index()
+        columns = _get_columns(index)
+        if column not in columns:
+            raise ValueError(
+                f"Unknown column '{column}'! (Possible: {list(columns.keys())})"
+            )
+        if plies is not None and len(columns[column]["shape"]) < 2:
+            raise ValueError(f"Column '{column}' has no ply axis!")
+        index = [meta for meta in index if column in meta["columns"]]
+        total = index[-1]["start"] + index[-1]["count"] if index else 0
+        if elements is None:
+            elements = slice(None)
+        scalar = np.ndim(elements) == 0 and not isinstance(elements, slice)
+        if isinstance(elements, slice):
+            elements = np.arange(total)[elements]
+        elements = np.atleast_1d(np.asarray(elements, dtype=np.int64))
+        elements = np.where(elements < 0, elements + total, elements)
+
+        # shape of the selected plies per element
+        shape = np.empty((0,) + tuple(columns[column]["shape"]), dtype=bool)
+        if plies is not None:
+            shape = shape[:, plies]
+        values = np.empty(
+            (len(elements),) + shape.shape[1:], dtype=columns[column]["dtype"]
+        )
+        found = np.zeros(len(elements), dtype=bool)
+        for meta in index:
+            mask = (elements >= meta["start"]) & (
+                elements < meta["start"] + meta["count"]
+            )
+            if not np.any(mask):
+                continue
+            data = np.load(
+                os.path.join(self.shards, meta["name"], f"{column}.npy"),
+                mmap_mode="r",
+            )
+            part = data[elements[mask] - meta["start"]]
+            if plies is not None:
+                part = part[:, plies]
+            values[mask] = part
+            found |= mask
+        if not np.all(found):
+            raise ValueError(
+                f"Elements {elements[~found][:10].tolist()} are not in the store!"
+            )
+        return values[0] if scalar else values
+
+    def read_failures(
+        self,
+        criteria: Optional[List[str]] = None,
+        elements: Selection = None,
+        plies: Selection = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read a subset of the failure values.
+        Parameters
+        ----------
+        criteria : List[str], optional
+            failure ids, default all
+        elements : int, slice or array, optional
+            indices of the elements, default all
+        plies : int, slice or array, optional
+            indices of the plies, default all
+        Returns
+        -------
+        dict
+            failure id and values, dim=(n_elements, n_plies, 2)
+        """
+        if criteria is None:
+            criteria = [
+                key[len("failures.") :]
+                for key in self.get_columns()
+                if key.startswith("failures.")
+            ]
+        return {key: self.read(f"failures.{key}", elements, plies) for key in criteria}
+
+
+def _get_columns(index: List[dict]) -> Dict[str, dict]:
+    columns = dict()
+    for meta in index:
+        for key, column in meta["columns"].items():
+            columns.setdefault(key, column)
+    return columns
@@ -0,0 +1,51 @@
+import os
+from itertools import islice
+from typing import Iterator, Union
+import numpy as np
+
+
+def iter_loads(
+    source: Union[str, os.PathLike, np.ndarray], chunk_size=65536, delimiter=","
+) -> Iterator[np.ndarray]:
+    """
+    Read load cases chunk by chunk.
+    Parameters
+    ----------
+    source : str, path-like or array
+        array of load cases, path of a **.npy** file or of a text (CSV) file,
+        every row is :math:`(N_x, N_y, N_{xy}, M_x, M_y, M_{xy})`
+    chunk_size : int, optional
+        maximal number of load cases per chunk, default 65536
+    delimiter : str, optional
+        delimiter of the text file, default ","
+    Notes
+    -----
+    **.npy** files are memory-mapped and text files are read line by line,
+    so only one chunk is held in memory at once.
+    Lines starting with "#" are ignored.
+    Returns
+    -------
+    Iterator[np.ndarray]
+        load cases, dim=(chunk_size, 6), the last chunk might be smaller
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size has to be greater 0! (recieved: {chunk_size})")
+
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+    if isinstance(source, str) and not source.endswith(".npy"):
+        with open(source) as file:
+            while True:
+                lines = list(islice(file, chunk_size))
+                if not lines:
+                    return
+                lines = [line for line in lines if line.strip()[:1] not in ("", "#")]
+                if lines:
+                    yield np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+        return
+
+    if isinstance(source, str):
+        source = np.load(source, mmap_mode="r")
+    source = np.atleast_2d(source)
+    for start in range(0, len(source), chunk_size):
+        yield np.asarray(source[start : start + chunk_size], dtype=float)
@@ -0,0 +1,204 @@
+from typing import List, Union
+import numpy as np
+from .ply import Ply
+from .stackup import Stackup, assemble_abd, get_moments, shift_moments
+
+
+class ZonedLaminate:
+    def __init__(self, plies: List[Ply]):
+        """
+        Master stacking sequence with ply-drop zones.
+        Parameters
+        ----------
+        plies : List[Ply]
+            master plies, order is bottom to top
+        Notes
+        -----
+        The master plies are stored once as arrays with their rotated stiffness,
+        every zone is a subset of them given by a ply-inclusion mask.
+        Prefix sums of the ply contributions make contiguous sub-ranges O(1).
+        Examples
+        --------
+        >>> laminate = ZonedLaminate(master_plies)
+        >>> masks = np.ones((3, len(master_plies)), dtype=bool)
+        >>> masks[1, [4, 5]] = False  # zone 1 drops two plies
+        >>> laminate.get_abd(masks)  # dim=(3, 6, 6)
+        """
+        self.plies = plies
+        self.materials = []
+        material_index = []
+        for ply in plies:
+            material = ply.get_material()
+            ids = [i for i, m in enumerate(self.materials) if m is material]
+            if not ids:
+                self.materials.append(material)
+                ids = [len(self.materials) - 1]
+            material_index.append(ids[0])
+        self.material_index = np.array(material_index, dtype=int)
+        self.thickness = np.array([ply.get_thickness() for ply in plies])
+        self.rotation = np.array([ply.get_rotation() for ply in plies])
+        self.stiffness = np.array([ply.get_stiffness() for ply in plies])
+        densities = [m.get_density() for m in self.materials]
+        if any(density is None for density in densities):
+            raise ValueError("Density is not defined for every Material.")
+        self.density = np.array(densities, dtype=float)[self.material_index]
+
+        # prefix sums about the bottom of the master stackup
+        z = np.concatenate([[0.0], np.cumsum(self.thickness)])
+        moments = get_moments(self.stiffness, z[:-1], z[1:])
+        self.z = z
+        self.prefix_moments = np.concatenate(
+            [np.zeros((1, 3, 3, 3)), np.cumsum(moments, axis=0)]
+        )
+        self.prefix_mass = np.concatenate(
+            [[0.0], np.cumsum(self.thickness * self.density)]
+        )
+
+    def get_plies(self) -> List[Ply]:
+        """
+        Master plies.
+        Returns
+        -------
+        List[Ply]
+            master plies, order is bottom to top
+        """
+        return self.plies
+
+    def get_thickness(self, masks: np.ndarray) -> np.ndarray:
+        """
+        Thicknesses of zones.
+        Parameters
+        ----------
+        masks : array
+            ply-inclusion masks, dim=(n_zones, n_plies)
+        Returns
+        -------
+        array
+            zone thicknesses, dim=(n_zones,)
+        """
+        return np.matmul(np.asarray(masks, dtype=float), self.thickness)
+
+    def get_density(self, masks: np.ndarray) -> np.ndarray:
+        """
+        Densities of zones.
+        Parameters
+        ----------
+        masks : array
+            ply-inclusion masks, dim=(n_zones, n_plies)
+        Returns
+        -------
+        array
+            zone densities or thickness weighted means over the plies,
+            dim=(n_zones,)
+        """
+        masks = _get_masks(masks)
+        mass = np.matmul(masks, self.thickness * self.density)
+        return mass / self.get_thickness(masks)
+
+    def get_abd(self, masks: np.ndarray) -> np.ndarray:
+        """
+        ABD-Matrices of zones, the included plies are stacked without gaps.
+        Parameters
+        ----------
+        masks : array
+            ply-inclusion masks, dim=(n_zones, n_plies)
+        Returns
+        -------
+        array
+            ABD-Matrices, dim=(n_zones, 6, 6)
+        """
+        masks = _get_masks(masks)
+        thickness = masks * self.thickness
+        z_top = np.cumsum(thickness, axis=1) - thickness.sum(axis=1)[:, None] / 2
+        z_bot = z_top - thickness
+        weights = np.stack(
+            [
+                z_top - z_bot,
+                1 / 2.0 * (z_top**2 - z_bot**2),
+                1 / 3.0 * (z_top**3 - z_bot**3),
+            ],
+            axis=-1,
+        )
+        return assemble_abd(np.einsum("zpm,pij->zmij", weights, self.stiffness))
+
+    def get_range_abd(
+        self, start: Union[int, np.ndarray], stop: Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """
+        ABD-Matrices of contiguous sub-ranges of the master plies in O(1).
+        Parameters
+        ----------
+        start : int or array
+            index of the first ply
+        stop : int or array
+            index after the last ply
+        Returns
+        -------
+        array
+            ABD-Matrices about the midplane of the sub-ranges, dim=(..., 6, 6)
+        """
+        start = np.asarray(start)
+        stop = np.asarray(stop)
+        moments = self.prefix_moments[stop] - self.prefix_moments[start]
+        return assemble_abd(shift_moments(moments, (self.z[start] + self.z[stop]) / 2))
+
+    def get_range_thickness(
+        self, start: Union[int, np.ndarray], stop: Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Thicknesses of contiguous sub-ranges of the master plies in O(1).
+        Parameters
+        ----------
+        start : int or array
+            index of the first ply
+        stop : int or array
+            index after the last ply
+        Returns
+        -------
+        array
+            thicknesses of the sub-ranges
+        """
+        return self.z[np.asarray(stop)] - self.z[np.asarray(start)]
+
+    def get_range_density(
+        self, start: Union[int, np.ndarray], stop: Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Densities of contiguous sub-ranges of the master plies in O(1).
+        Parameters
+        ----------
+        start : int or array
+            index of the first ply
+        stop : int or array
+            index after the last ply
+        Returns
+        -------
+        array
+            densities of the sub-ranges
+        """
+        start = np.asarray(start)
+        stop = np.asarray(stop)
+        mass = self.prefix_mass[stop] - self.prefix_mass[start]
+        return mass / self.get_range_thickness(start, stop)
+
+    def get_stackup(self, mask: np.ndarray) -> Stackup:
+        """
+        Stackup of a zone for a detailed analysis.
+        Parameters
+        ----------
+        mask : array
+            ply-inclusion mask, dim=(n_plies,)
+        Returns
+        -------
+        Stackup
+            stackup of the included plies, sharing the master ply objects
+        """
+        return Stackup([ply for ply, used in zip(self.plies, mask) if used])
+
+
+def _get_masks(masks: np.ndarray) -> np.ndarray:
+    masks = np.asarray(masks, dtype=float)
+    empty = np.flatnonzero(~np.any(np.atleast_2d(masks) != 0.0, axis=-1))
+    if len(empty) > 0:
+        raise ValueError(f"Zones {empty[:10].tolist()} include no ply!")
+    return masks
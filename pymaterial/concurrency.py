@@ -0,0 +1,95 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Union
+import numpy as np
+
+# striped locks, only taken to publish a freshly calculated cache value
+_locks = [threading.Lock() for _ in range(64)]
+
+
+def cached(obj: object, name: str, calc: Callable):
+    """
+    Lazily calculated attribute, safe under concurrent access.
+    Parameters
+    ----------
+    obj : object
+        owner of the cache attribute
+    name : str
+        name of the cache attribute, None marks an empty cache
+    calc : Callable
+        calculates the value without arguments
+    Notes
+    -----
+    Reading a filled cache takes no lock.
+    On a miss the value is calculated without holding a lock,
+    so concurrent misses might calculate twice, but all of them return
+    the value that was published first.
+    Returns
+    -------
+    object
+        cached value
+    """
+    value = getattr(obj, name)
+    if value is None:
+        value = calc()
+        with _locks[id(obj) % len(_locks)]:
+            current = getattr(obj, name)
+            if current is None:
+                setattr(obj, name, value)
+            else:
+                value = current
+    return value
+
+
+def map_batches(
+    func: Callable,
+    *arrays: Optional[np.ndarray],
+    workers: Optional[int] = None,
+    chunk_size=65536,
+) -> Union[np.ndarray, dict]:
+    """
+    Evaluate a vectorized function chunk by chunk in a thread pool.
+    Parameters
+    ----------
+    func : Callable
+        vectorized function of the arrays, returning an array or dict of arrays
+    arrays : array or None
+        arguments split along the first axis, None is passed unchanged
+    workers : int, optional
+        number of threads, default is the number of CPUs
+    chunk_size : int, optional
+        number of rows per chunk, default 65536
+    Notes
+    -----
+    numpy releases the GIL in its kernels, so the chunks run concurrently.
+    Arrays with at most chunk_size rows are evaluated directly.
+    Returns
+    -------
+    array or dict
+        results of the chunks concatenated along the first axis
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Workers has to be greater 0! (recieved: {workers})")
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size has to be greater 0! (recieved: {chunk_size})")
+
+    length = max(len(array) for array in arrays if array is not None)
+    if workers == 1 or length <= chunk_size:
+        return func(*arrays)
+
+    def run(start: int):
+        return func(
+            *(None if a is None else a[start : start + chunk_size] for a in arrays)
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, range(0, length, chunk_size)))
+    if isinstance(results[0], dict):
+        return {
+            key: np.concatenate([result[key] for result in results])
+            for key in results[0]
+        }
+    return np.concatenate(results)
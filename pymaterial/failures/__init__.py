@@ -2,3 +2,5 @@ from .ifailure import IFailure  # noqa
 from .maxstress import MaxStressFailure  # noqa
 from .cuntze import CuntzeFailure  # noqa
 from .mises import VonMisesFailure  # noqa
+from .surrogate import SurrogateFailure  # noqa
+from .threaded import ThreadedFailure  # noqa
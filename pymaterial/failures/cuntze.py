@@ -1,3 +1,5 @@
+import numpy as np
+from numpy import ndarray
 from .ifailure import IFailure
 from typing import Optional, List
 
@@ -93,7 +95,46 @@ class CuntzeFailure(IFailure):
 
         eff_2sigma = sigma_yt / self.R_2t  # IFF1
         eff_2tau = abs(sigma_yc) / self.R_2c  # IFF2
-        eff_21 = abs(tau_yx) / (self.R_21 - self.my_21 * sigma_y)  # IFF2
+        denominator = self.R_21 - self.my_21 * sigma_y
+        if denominator > 0:
+            eff_21 = abs(tau_yx) / denominator  # IFF2
+        else:
+            # transverse tension beyond R_21 / my_21, any shear fails the ply
+            eff_21 = np.inf if tau_yx != 0 else 0.0
+
+        # total Reservefactor
+        eff_ges = (
+            eff_1sigma**m
+            + eff_1tau**m
+            + eff_2sigma**m
+            + eff_2tau**m
+            + eff_21**m
+        ) ** (1 / m)
+
+        return {"cuntze": eff_ges}
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        if stresses is None or strains is None:
+            raise ValueError("Requires a stress and strain tensor in Voigt notation!")
+        stresses = np.asarray(stresses)
+        strains = np.asarray(strains)
+        m = self.interaction
+
+        epsilon_x = strains[..., 0]
+        sigma_y = stresses[..., 1]
+        tau_yx = stresses[..., 2]
+
+        eff_1sigma = (np.maximum(epsilon_x, 0.0) * self.E1) / self.R_1t  # FF1
+        eff_1tau = (np.maximum(-epsilon_x, 0.0) * self.E1) / self.R_1c  # FF2
+
+        eff_2sigma = np.maximum(sigma_y, 0.0) / self.R_2t  # IFF1
+        eff_2tau = np.maximum(-sigma_y, 0.0) / self.R_2c  # IFF2
+        eff_21 = _get_eff_21(tau_yx, self._get_denominator(sigma_y))  # IFF2
 
         # total Reservefactor
         eff_ges = (
@@ -105,3 +146,59 @@ class CuntzeFailure(IFailure):
         ) ** (1 / m)
 
         return {"cuntze": eff_ges}
+
+    def get_batch_failure_gradient(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        stresses = np.asarray(stresses)
+        strains = np.asarray(strains)
+        m = self.interaction
+
+        epsilon_x = strains[..., 0]
+        sigma_y = stresses[..., 1]
+        tau_yx = stresses[..., 2]
+        denominator = self._get_denominator(sigma_y)
+
+        effs = [
+            (np.maximum(epsilon_x, 0.0) * self.E1) / self.R_1t,
+            (np.maximum(-epsilon_x, 0.0) * self.E1) / self.R_1c,
+            np.maximum(sigma_y, 0.0) / self.R_2t,
+            np.maximum(-sigma_y, 0.0) / self.R_2c,
+            _get_eff_21(tau_yx, denominator),
+        ]
+        eff_ges = sum(eff**m for eff in effs) ** (1 / m)
+
+        # d eff_ges / d eff = (eff / eff_ges)^(m - 1), zero for failed plies (inf)
+        valid = (eff_ges > 0) & np.isfinite(eff_ges)
+        weights = [
+            np.divide(eff, eff_ges, out=np.zeros(eff.shape), where=valid) ** (m - 1)
+            for eff in effs
+        ]
+        denominator = np.where(denominator > 0, denominator, 1.0)
+
+        d_stress = np.zeros(stresses.shape)
+        d_strain = np.zeros(strains.shape)
+        d_strain[..., 0] = (
+            weights[0] * (epsilon_x > 0) * self.E1 / self.R_1t
+            - weights[1] * (epsilon_x < 0) * self.E1 / self.R_1c
+        )
+        d_stress[..., 1] = (
+            weights[2] * (sigma_y > 0) / self.R_2t
+            - weights[3] * (sigma_y < 0) / self.R_2c
+            + weights[4] * np.abs(tau_yx) * self.my_21 / denominator**2
+        )
+        d_stress[..., 2] = weights[4] * np.sign(tau_yx) / denominator
+        return {"cuntze": (d_stress, d_strain)}
+
+    def _get_denominator(self, sigma_y: ndarray) -> ndarray:
+        return self.R_21 - self.my_21 * sigma_y
+
+
+def _get_eff_21(tau_yx: ndarray, denominator: ndarray) -> ndarray:
+    # transverse tension beyond R_21 / my_21 with shear is a failure (inf)
+    overloaded = denominator <= 0
+    eff_21 = np.abs(tau_yx) / np.where(overloaded, 1.0, denominator)
+    return np.where(overloaded & (tau_yx != 0), np.inf, eff_21)
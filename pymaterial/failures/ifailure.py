@@ -1,3 +1,5 @@
+import numpy as np
+from numpy import ndarray
 from typing import Optional, List
 
 
@@ -34,3 +36,113 @@ class IFailure:
             Values larger 1.0 a equivalent to a failure of the material.
         """
         raise NotImplementedError
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        """
+        Computes the loading dependent failure values of many loadings at once.
+        Parameters
+        ----------
+        stresses : array, optional
+            stress tensors in Voigt notation, shape (..., 3) or (..., 6)
+        strains : array, optional
+            strain tensors in Voigt notation, shape (..., 3) or (..., 6)
+        temperature: float, optional
+            Temperature in [K]
+        Notes
+        -----
+        The default implementation loops over **get_failure()**.
+        Criteria with a closed form should override it with a vectorized version.
+        Float32 loadings give float32 values, otherwise float64.
+        Returns
+        -------
+        dict
+            Dictionary of failure id and array of values,
+            the shape equals the leading shape of the loading (...).
+        """
+        reference = stresses if stresses is not None else strains
+        if reference is None:
+            return self.get_failure(stresses, strains, temperature)
+
+        shape = np.shape(reference)[:-1]
+        if stresses is not None:
+            stresses = np.reshape(stresses, (-1, np.shape(stresses)[-1]))
+        if strains is not None:
+            strains = np.reshape(strains, (-1, np.shape(strains)[-1]))
+
+        count = int(np.prod(shape, dtype=int))
+        dtype = np.result_type(np.asarray(reference).dtype, np.float32)
+        result = dict()
+        for i in range(count):
+            values = self.get_failure(
+                None if stresses is None else stresses[i],
+                None if strains is None else strains[i],
+                temperature,
+            )
+            for key, value in values.items():
+                if key not in result:
+                    result[key] = np.empty(count, dtype=dtype)
+                result[key][i] = value
+        return {key: value.reshape(shape) for key, value in result.items()}
+
+    def get_batch_failure_gradient(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+        step: float = 1e-6,
+    ) -> dict:
+        """
+        Derivatives of the failure values w.r.t. the stresses and strains.
+        Parameters
+        ----------
+        stresses : array, optional
+            stress tensors in Voigt notation, shape (..., 3) or (..., 6)
+        strains : array, optional
+            strain tensors in Voigt notation, shape (..., 3) or (..., 6)
+        temperature: float, optional
+            Temperature in [K]
+        step : float, optional
+            relative step of the central differences, default 1e-6
+        Notes
+        -----
+        The default implementation uses central differences of
+        **get_batch_failure()**, two batched evaluations per component.
+        Criteria with a closed form should override it with the analytic derivative.
+        Returns
+        -------
+        dict
+            Dictionary of failure id and tuple of the derivatives
+            w.r.t. the stresses and the strains (None if not given),
+            the shapes equal the shapes of the stresses and strains.
+        """
+        loadings = [stresses, strains]
+        for i in range(len(loadings)):
+            if loadings[i] is not None:
+                loadings[i] = np.asarray(loadings[i], dtype=float)
+
+        result = dict()
+        for i, loading in enumerate(loadings):
+            if loading is None:
+                continue
+            scale = np.max(np.abs(loading), initial=0.0)
+            h = step * (scale if scale > 0.0 else 1.0)
+            for j in range(loading.shape[-1]):
+                values = []
+                for sign in (1.0, -1.0):
+                    shifted = loading.copy()
+                    shifted[..., j] += sign * h
+                    args = list(loadings)
+                    args[i] = shifted
+                    values.append(self.get_batch_failure(*args, temperature))
+                for key in values[0]:
+                    if key not in result:
+                        result[key] = [
+                            None if x is None else np.zeros(x.shape) for x in loadings
+                        ]
+                    result[key][i][..., j] = (values[0][key] - values[1][key]) / (2 * h)
+        return {key: tuple(value) for key, value in result.items()}
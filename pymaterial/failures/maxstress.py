@@ -1,3 +1,5 @@
+import numpy as np
+from numpy import ndarray
 from .ifailure import IFailure
 from typing import Optional, List, Tuple, Union
 
@@ -84,3 +86,60 @@ class MaxStressFailure(IFailure):
             dist = (s_max - s_min) / 2
             factor.append(abs(load[i] - middle) / dist)
         return {"max-stress": max(factor)}
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        load = self._get_load(stresses)
+        # keep the precision of float32 stresses
+        strength = np.array(self.strength, dtype=np.result_type(load, np.float32))
+        middle = (strength[:, 1] + strength[:, 0]) / 2
+        dist = (strength[:, 1] - strength[:, 0]) / 2
+        return {"max-stress": np.max(np.abs(load - middle) / dist, axis=-1)}
+
+    def get_batch_failure_gradient(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        load = self._get_load(stresses)
+        stresses = np.asarray(stresses)
+        # keep the precision of float32 stresses
+        strength = np.array(self.strength, dtype=np.result_type(load, np.float32))
+        middle = (strength[:, 1] + strength[:, 0]) / 2
+        dist = (strength[:, 1] - strength[:, 0]) / 2
+        factor = np.abs(load - middle) / dist
+        critical = np.argmax(factor, axis=-1)[..., None]
+
+        # only the critical component contributes
+        d_load = np.zeros(load.shape)
+        np.put_along_axis(
+            d_load,
+            critical,
+            np.take_along_axis(np.sign(load - middle) / dist, critical, axis=-1),
+            axis=-1,
+        )
+        mapping = np.zeros((6, stresses.shape[-1]))
+        mapping[range(6), self.stress_mapping] = 1.0
+        d_stress = np.matmul(d_load, mapping)
+        d_strain = None if strains is None else np.zeros(np.shape(strains))
+        return {"max-stress": (d_stress, d_strain)}
+
+    def _get_load(self, stresses: Optional[ndarray]) -> ndarray:
+        # validated stress components of the strengths
+        if stresses is None:
+            raise ValueError("Need stress tensor in Voigt notation!")
+        stresses = np.asarray(stresses)
+        length = stresses.shape[-1]
+        allowed_length = max(self.stress_mapping) + 1
+        if length != allowed_length:
+            raise ValueError(
+                f"Stresses has to be of length  {allowed_length} "
+                f"({int(allowed_length / 3 + 1)}d stress), "
+                f"but got length {length}."
+            )
+        return stresses[..., self.stress_mapping]
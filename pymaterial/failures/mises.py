@@ -1,3 +1,5 @@
+import numpy as np
+from numpy import ndarray
 from .ifailure import IFailure
 from typing import Optional, List
 from math import sqrt
@@ -65,3 +67,76 @@ class VonMisesFailure(IFailure):
             )
 
         return {"mises": stress / self.strength}
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        if stresses is None:
+            raise ValueError("Requires a stress tensor in Voigt notation!")
+        stresses = np.asarray(stresses)
+        length = stresses.shape[-1]
+        allowed_length = [3, 6]
+        if length not in allowed_length:
+            raise ValueError(
+                f"Stresses has to be of length 3 (2D) or 6 (3d stress state). "
+                f"Recieved stress vector of length {length}."
+            )
+
+        s11 = stresses[..., 0]
+        s22 = stresses[..., 1]
+
+        if length == 3:
+            s12 = stresses[..., 2]
+            stress = np.sqrt(s11**2 - s11 * s22 + s22**2 + 3 * s12**2)
+        else:  # length == 6
+            s33 = stresses[..., 2]
+            s31 = stresses[..., 3]
+            s23 = stresses[..., 4]
+            s12 = stresses[..., 5]
+            stress = np.sqrt(
+                0.5 * ((s11 - s22) ** 2 + (s22 - s33) ** 2 + (s33 - s11) ** 2)
+                + 3.0 * (s12**2 + s23**2 + s31**2)
+            )
+
+        return {"mises": stress / self.strength}
+
+    def get_batch_failure_gradient(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ):
+        stresses = np.asarray(stresses)
+        stress = self.get_batch_failure(stresses)["mises"] * self.strength
+
+        s11 = stresses[..., 0]
+        s22 = stresses[..., 1]
+        if stresses.shape[-1] == 3:
+            s12 = stresses[..., 2]
+            d_stress = np.stack([2 * s11 - s22, 2 * s22 - s11, 6 * s12], axis=-1)
+        else:  # length == 6
+            s33 = stresses[..., 2]
+            d_stress = np.stack(
+                [
+                    2 * s11 - s22 - s33,
+                    2 * s22 - s11 - s33,
+                    2 * s33 - s11 - s22,
+                    6 * stresses[..., 3],
+                    6 * stresses[..., 4],
+                    6 * stresses[..., 5],
+                ],
+                axis=-1,
+            )
+        # d sqrt(q) = dq / (2 sqrt(q)), set to zero in the unloaded state
+        scale = 2 * stress * self.strength
+        d_stress = np.divide(
+            d_stress,
+            scale[..., None],
+            out=np.zeros(d_stress.shape),
+            where=scale[..., None] > 0,
+        )
+        d_strain = None if strains is None else np.zeros(np.shape(strains))
+        return {"mises": (d_stress, d_strain)}
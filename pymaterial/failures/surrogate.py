@@ -0,0 +1,319 @@
+import json
+import os
+from itertools import product
+import numpy as np
+from numpy import ndarray
+from .ifailure import IFailure
+from typing import Optional, List, Union
+
+# normalized loadings identifying the tabulated criterion and its parameters
+_PROBES = np.array(
+    [
+        [0.5, 0.0, 0.0],
+        [-0.5, 0.0, 0.0],
+        [0.0, 0.5, 0.0],
+        [0.0, -0.5, 0.0],
+        [0.0, 0.0, 0.5],
+        [0.3, -0.2, 0.4],
+    ]
+)
+
+
+class SurrogateFailure(IFailure):
+    def __init__(
+        self,
+        failure: IFailure,
+        scale: Union[List[float], ndarray],
+        limit: float = 1.5,
+        resolution: int = 33,
+        compliance: Optional[ndarray] = None,
+        path: Optional[str] = None,
+        samples: int = 1000,
+        seed: int = 0,
+    ):
+        """
+        Tabulated surrogate of an expensive plane stress failure criterion.
+        Parameters
+        ----------
+        failure : IFailure
+            exact failure criterion (or material) which is tabulated
+        scale : List[float]
+            normalizing stresses [sigma_11, sigma_22, sigma_12], e.g. strengths
+        limit : float, optional
+            the table covers [-limit, limit] in normalized stresses, default 1.5
+        resolution : int, optional
+            number of grid points per stress component, default 33
+        compliance : array, optional
+            plane compliance (3x3) to derive the strains for strain based criteria
+        path : str, optional
+            numpy file of the table, loaded memory-mapped if it exists and matches
+            (criterion, its values at probe loadings and the table description),
+            otherwise the table is build and saved there
+        samples : int, optional
+            number of random loadings to measure the maximum error, default 1000
+        seed : int, optional
+            seed of the random loadings, default 0
+        Notes
+        -----
+        - values inside the table are interpolated multilinearly,
+          loadings outside the table are evaluated exactly
+        - the table is build without temperature dependence
+        - **max_error** holds the measured maximum absolute error per failure id
+        Examples
+        --------
+        >>> surrogate = SurrogateFailure(CuntzeFailure(...), [2231.0, 29.0, 60.0],
+        ...     compliance=compliance, path="cfk_cuntze.npy")
+        >>> surrogate.get_batch_failure(stresses)  # interpolated
+        >>> surrogate.get_batch_failure(stresses, exact=True)  # exact criterion
+        """
+        scale = np.asarray(scale, dtype=float)
+        if scale.shape != (3,) or np.any(scale <= 0):
+            raise ValueError(
+                f"Scale has to be 3 positive stresses! (Got: {scale.tolist()})"
+            )
+        if resolution < 2:
+            raise ValueError(f"Resolution has to be at least 2! (Got: {resolution})")
+
+        self.failure = failure
+        self.scale = scale
+        self.limit = float(limit)
+        self.resolution = int(resolution)
+        self.compliance = compliance
+
+        if path is not None and self.load(path):
+            return
+        self.build(samples, seed)
+        if path is not None:
+            self.save(path)
+
+    @classmethod
+    def from_material(
+        cls, material: IFailure, scale: Union[List[float], ndarray], **kwargs
+    ) -> "SurrogateFailure":
+        """
+        Surrogate of all failure criteria of a material.
+        Parameters
+        ----------
+        material : Material
+            material with failure criteria and compliance
+        scale : List[float]
+            normalizing stresses [sigma_11, sigma_22, sigma_12], e.g. strengths
+        kwargs
+            see **SurrogateFailure**
+        Returns
+        -------
+        SurrogateFailure
+            surrogate using the plane compliance of the material for the strains
+        """
+        elems = [0, 1, 5]  # plane stress components
+        compliance = material.get_compliance()[elems][:, elems]
+        return cls(material, scale, compliance=compliance, **kwargs)
+
+    def get_meta(self) -> dict:
+        """
+        Description of the table.
+        Returns
+        -------
+        dict
+            scale, limit, resolution, class of the criterion, failure ids,
+            values at probe loadings, table shape and maximum errors
+        """
+        return dict(
+            scale=self.scale.tolist(),
+            limit=self.limit,
+            resolution=self.resolution,
+            failure=self._get_failure_name(),
+            keys=self.keys,
+            probes=self._get_probes(),
+            shape=list(self.table.shape),
+            max_error=self.max_error,
+        )
+
+    def build(self, samples: int = 1000, seed: int = 0):
+        """
+        Tabulate the exact criterion and measure the maximum error.
+        Parameters
+        ----------
+        samples : int, optional
+            number of random loadings to measure the maximum error, default 1000
+        seed : int, optional
+            seed of the random loadings, default 0
+        """
+        axis = np.linspace(-self.limit, self.limit, self.resolution)
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1)
+        exact = self._get_exact(grid * self.scale)
+        self.keys = list(exact.keys())
+        self.table = np.stack([exact[key] for key in self.keys])
+
+        rng = np.random.default_rng(seed)
+        normalized = rng.uniform(-self.limit, self.limit, size=(samples, 3))
+        exact = self._get_exact(normalized * self.scale)
+        approx = self._interpolate(normalized)
+        self.max_error = {
+            key: float(np.max(np.abs(approx[i] - exact[key]), initial=0.0))
+            for i, key in enumerate(self.keys)
+        }
+
+    def save(self, path: str):
+        """
+        Save the table as numpy file and its description as json next to it.
+        Parameters
+        ----------
+        path : str
+            numpy file of the table
+        """
+        np.save(path, self.table)
+        with open(path + ".json", "w") as file:
+            json.dump(self.get_meta(), file)
+
+    def load(self, path: str) -> bool:
+        """
+        Load a saved table memory-mapped.
+        Parameters
+        ----------
+        path : str
+            numpy file of the table
+        Returns
+        -------
+        bool
+            True if the table was loaded, False if it is missing or does not match
+        """
+        if not (os.path.exists(path) and os.path.exists(path + ".json")):
+            return False
+        with open(path + ".json") as file:
+            meta = json.load(file)
+        if (
+            not np.allclose(meta["scale"], self.scale)
+            or meta["limit"] != self.limit
+            or meta["resolution"] != self.resolution
+            or meta.get("failure") != self._get_failure_name()
+        ):
+            return False
+        probes = self._get_probes()
+        saved = meta.get("probes") or dict()
+        if list(probes.keys()) != meta["keys"] or any(
+            not np.allclose(saved.get(key, np.nan), values, equal_nan=True)
+            for key, values in probes.items()
+        ):
+            return False
+        table = np.load(path, mmap_mode="r")
+        shape = [len(meta["keys"])] + [self.resolution] * 3
+        if list(table.shape) != shape or meta.get("shape") != shape:
+            return False
+        self.keys = meta["keys"]
+        self.max_error = meta["max_error"]
+        self.table = table
+        return True
+
+    def get_failure(
+        self,
+        stresses: Optional[List[float]] = None,
+        strains: Optional[List[float]] = None,
+        temperature: Optional[float] = None,
+        exact: bool = False,
+    ) -> dict:
+        result = self.get_batch_failure(
+            None if stresses is None else np.asarray(stresses, dtype=float)[None],
+            None if strains is None else np.asarray(strains, dtype=float)[None],
+            temperature,
+            exact,
+        )
+        return {key: float(value[0]) for key, value in result.items()}
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+        exact: bool = False,
+    ) -> dict:
+        """
+        Failure values of many plane stress loadings.
+        Parameters
+        ----------
+        stresses : array
+            stress tensors in Voigt notation, shape (..., 3)
+        strains : array, optional
+            strain tensors, only used for the exact evaluation
+        temperature : float, optional
+            Temperature in [K], only used for the exact evaluation
+        exact : bool, optional
+            when true: evaluate the exact criterion, default False
+        Returns
+        -------
+        dict
+            Dictionary of failure id and array of values.
+        """
+        if stresses is None:
+            raise ValueError("Requires a stress tensor in Voigt notation!")
+        dtype = np.result_type(np.asarray(stresses).dtype, np.float32)
+        stresses = np.asarray(stresses, dtype=float)
+        if stresses.shape[-1] != 3:
+            raise ValueError(
+                f"Stresses has to be of length 3 (2D stress state). "
+                f"Recieved stress vector of length {stresses.shape[-1]}."
+            )
+        if exact:
+            return self._get_exact(stresses, strains, temperature)
+
+        shape = stresses.shape[:-1]
+        normalized = stresses.reshape(-1, 3) / self.scale
+        inside = np.all(np.abs(normalized) <= self.limit, axis=1)
+        values = np.empty((len(self.keys), len(normalized)))
+        values[:, inside] = self._interpolate(normalized[inside])
+        if not np.all(inside):
+            outside = ~inside
+            fallback = self._get_exact(
+                stresses.reshape(-1, 3)[outside],
+                None if strains is None else np.reshape(strains, (-1, 3))[outside],
+                temperature,
+            )
+            for i, key in enumerate(self.keys):
+                values[i, outside] = fallback[key]
+        return {
+            key: values[i].reshape(shape).astype(dtype, copy=False)
+            for i, key in enumerate(self.keys)
+        }
+
+    def _get_exact(
+        self,
+        stresses: ndarray,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        if strains is None and self.compliance is not None:
+            strains = np.matmul(stresses, np.transpose(self.compliance))
+        return self.failure.get_batch_failure(stresses, strains, temperature)
+
+    def _get_failure_name(self) -> str:
+        return f"{type(self.failure).__module__}.{type(self.failure).__qualname__}"
+
+    def _get_probes(self) -> dict:
+        values = self._get_exact(_PROBES * self.limit * self.scale)
+        return {
+            key: np.asarray(value, dtype=float).tolist()
+            for key, value in values.items()
+        }
+
+    def _interpolate(self, normalized: ndarray) -> ndarray:
+        step = 2.0 * self.limit / (self.resolution - 1)
+        position = (normalized + self.limit) / step
+        index = np.clip(np.floor(position).astype(int), 0, self.resolution - 2)
+        weight = position - index
+
+        values = np.zeros((len(self.keys), len(normalized)))
+        for corner in product((0, 1), repeat=3):
+            corner_weight = np.ones(len(normalized))
+            for axis in range(3):
+                if corner[axis]:
+                    corner_weight = corner_weight * weight[:, axis]
+                else:
+                    corner_weight = corner_weight * (1.0 - weight[:, axis])
+            corner_values = self.table[
+                :,
+                index[:, 0] + corner[0],
+                index[:, 1] + corner[1],
+                index[:, 2] + corner[2],
+            ]
+            values += corner_values * corner_weight
+        return values
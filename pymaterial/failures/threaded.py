@@ -0,0 +1,61 @@
+import numpy as np
+from numpy import ndarray
+from .ifailure import IFailure
+from pymaterial.concurrency import map_batches
+from typing import Optional, List
+
+
+class ThreadedFailure(IFailure):
+    def __init__(
+        self, failure: IFailure, workers: Optional[int] = None, chunk_size=65536
+    ):
+        """
+        Evaluates the batches of a failure criterion in a thread pool.
+        Parameters
+        ----------
+        failure : IFailure
+            failure criterion (or material) with vectorized batch evaluation
+        workers : int, optional
+            number of threads, default is the number of CPUs
+        chunk_size : int, optional
+            number of loadings per chunk, default 65536
+        Examples
+        --------
+        >>> criteria = ThreadedFailure(CuntzeFailure(...), workers=8)
+        >>> criteria.get_batch_failure(stresses, strains)
+        """
+        self.failure = failure
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def get_failure(
+        self,
+        stresses: Optional[List[float]] = None,
+        strains: Optional[List[float]] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        return self.failure.get_failure(stresses, strains, temperature)
+
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        reference = stresses if stresses is not None else strains
+        if reference is None:
+            return self.failure.get_batch_failure(stresses, strains, temperature)
+
+        shape = np.shape(reference)[:-1]
+        if stresses is not None:
+            stresses = np.reshape(stresses, (-1, np.shape(stresses)[-1]))
+        if strains is not None:
+            strains = np.reshape(strains, (-1, np.shape(strains)[-1]))
+        result = map_batches(
+            lambda s, e: self.failure.get_batch_failure(s, e, temperature),
+            stresses,
+            strains,
+            workers=self.workers,
+            chunk_size=self.chunk_size,
+        )
+        return {key: value.reshape(shape) for key, value in result.items()}
@@ -1,16 +1,29 @@
-from .material import Material, ndarray, np
+from .material import Material, ndarray, np, Optional
 
 
 class AnisotropicMaterial(Material):
-    def __init__(self, stiffness: ndarray, density: float, **kwargs):
+    def __init__(
+        self,
+        stiffness: ndarray,
+        density: float,
+        alpha: Optional[ndarray] = None,
+        beta: Optional[ndarray] = None,
+        **kwargs,
+    ):
         """
         Parameters
         ----------
         stiffness
         density
+        alpha
+            coefficients of thermal expansion in Voigt notation, default 0.0
+        beta
+            coefficients of moisture expansion in Voigt notation, default 0.0
         kwargs
         """
         self.stiffness = stiffness
+        self.alpha = np.zeros(6) if alpha is None else np.asarray(alpha, dtype=float)
+        self.beta = np.zeros(6) if beta is None else np.asarray(beta, dtype=float)
         super().__init__(dict(DENS=density), **kwargs)
 
     def get_stiffness(self) -> ndarray:
@@ -18,3 +31,9 @@ class AnisotropicMaterial(Material):
 
     def get_compliance(self) -> ndarray:
         return np.linalg.inv(self.get_stiffness())
+
+    def get_thermal_expansion(self) -> ndarray:
+        return self.alpha
+
+    def get_hygral_expansion(self) -> ndarray:
+        return self.beta
@@ -2,16 +2,30 @@ from .material import Material, np, ndarray
 
 
 class IsotropicMaterial(Material):
-    def __init__(self, Em: float, nu: float, density: float, **kwargs):
+    def __init__(
+        self,
+        Em: float,
+        nu: float,
+        density: float,
+        alpha: float = 0.0,
+        beta: float = 0.0,
+        **kwargs,
+    ):
         """
         Parameters
         ----------
         Em
         nu
         density
+        alpha
+            coefficient of thermal expansion
+        beta
+            coefficient of moisture expansion
         kwargs
         """
         attr = dict(EX=Em, PRXY=nu, DENS=density)
+        attr.update(ALPX=alpha, ALPY=alpha, ALPZ=alpha)
+        attr.update(BETX=beta, BETY=beta, BETZ=beta)
         self.Em = Em
         self.nu = nu
         super().__init__(attr, **kwargs)
@@ -1,4 +1,5 @@
 import numpy as np
+from pymaterial.concurrency import cached
 from pymaterial.failures import IFailure
 from typing import Optional, List, Union
 from numpy import ndarray
@@ -16,6 +17,8 @@ class Material(IFailure):
         if failures is None:
             failures = []
         self.failures = failures
+        self.plane_stress_stiffness = None
+        self.plane_strain_stiffness = None
 
     def get_compliance(self) -> ndarray:
         raise NotImplementedError
@@ -26,6 +29,30 @@ class Material(IFailure):
     def get_density(self) -> float:
         return self.attr.get("DENS")
 
+    def get_thermal_expansion(self) -> ndarray:
+        """
+        Returns
+        -------
+        array
+            coefficients of thermal expansion in Voigt notation, unset ones are 0.0
+        """
+        return np.array(
+            [self.attr.get(key, 0.0) for key in ["ALPX", "ALPY", "ALPZ"]]
+            + [0.0, 0.0, 0.0]
+        )
+
+    def get_hygral_expansion(self) -> ndarray:
+        """
+        Returns
+        -------
+        array
+            coefficients of moisture expansion in Voigt notation, unset ones are 0.0
+        """
+        return np.array(
+            [self.attr.get(key, 0.0) for key in ["BETX", "BETY", "BETZ"]]
+            + [0.0, 0.0, 0.0]
+        )
+
     def get_failures(self) -> List[IFailure]:
         """
         Returns
@@ -50,21 +77,66 @@ class Material(IFailure):
             result.update(failure.get_failure(stresses, strains, temperature))
         return result
 
+    def get_batch_failure(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        """
+        returns
+        {"max_stress": array([1.0, ...]), "cuntze": array([0.5, ...])}
+        """
+        result = dict()
+        for failure in self.failures:
+            result.update(failure.get_batch_failure(stresses, strains, temperature))
+        return result
+
+    def get_batch_failure_gradient(
+        self,
+        stresses: Optional[ndarray] = None,
+        strains: Optional[ndarray] = None,
+        temperature: Optional[float] = None,
+    ) -> dict:
+        """
+        returns
+        {"max_stress": (d_stresses, d_strains), "cuntze": (d_stresses, d_strains)}
+        """
+        result = dict()
+        for failure in self.failures:
+            result.update(
+                failure.get_batch_failure_gradient(stresses, strains, temperature)
+            )
+        return result
+
     def get_plane_stress_stiffness(self):
         """
         Get stiffness tensor for plane stress
+        Notes
+        -----
+        The tensor is calculated once and cached, a copy is returned.
         Returns
         -------
         """
         elems = [0, 1, 5]  # ignore the s_zz, s_xy and s_yz row and column
-        stiffness = self.get_stiffness()
-        return stiffness[elems][:, elems]
+        return cached(
+            self,
+            "plane_stress_stiffness",
+            lambda: self.get_stiffness()[elems][:, elems],
+        ).copy()
 
     def get_plane_strain_stiffness(self):
         """
         et stiffness tensor for plane strain
+        Notes
+        -----
+        The tensor is calculated once and cached, a copy is returned.
         Returns
         -------
         """
         elems = [0, 1, 5]  # ignore the s_zz, s_xy and s_yz row and column
-        return np.linalg.inv(self.get_compliance()[elems][:, elems])
+        return cached(
+            self,
+            "plane_strain_stiffness",
+            lambda: np.linalg.inv(self.get_compliance()[elems][:, elems]),
+        ).copy()
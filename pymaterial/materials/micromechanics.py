@@ -0,0 +1,196 @@
+from typing import Optional, Tuple, Union
+import numpy as np
+from numpy import ndarray
+
+ArrayLike = Union[float, ndarray]
+METHODS = ["rule-of-mixtures", "halpin-tsai", "chamis"]
+
+
+def get_constants(
+    E_f_l: ArrayLike,
+    E_f_t: ArrayLike,
+    nu_f_lt: ArrayLike,
+    G_f_lt: ArrayLike,
+    E_m: ArrayLike,
+    nu_m: ArrayLike,
+    fiber_volume: ArrayLike,
+    void_content: ArrayLike = 0.0,
+    density_f: Optional[ArrayLike] = None,
+    density_m: Optional[ArrayLike] = None,
+    method: str = "halpin-tsai",
+    xi: Tuple[float, float] = (2.0, 1.0),
+) -> dict:
+    """
+    Engineering constants of unidirectional plies from fiber and matrix properties.
+    Parameters
+    ----------
+    E_f_l, E_f_t : float or array
+        longitudinal and transverse Young's modulus of the fiber
+    nu_f_lt : float or array
+        major Poisson's ratio of the fiber
+    G_f_lt : float or array
+        longitudinal shear modulus of the fiber
+    E_m, nu_m : float or array
+        Young's modulus and Poisson's ratio of the isotropic matrix
+    fiber_volume : float or array
+        fiber volume fraction
+    void_content : float or array, optional
+        void volume fraction, default 0.0
+    density_f, density_m : float or array, optional
+        densities of fiber and matrix,
+        the ply density is only returned if both are given
+    method : str, optional
+        "rule-of-mixtures", "halpin-tsai" or "chamis", default "halpin-tsai"
+    xi : Tuple[float, float], optional
+        Halpin-Tsai reinforcing factors for E_t and G_lt, default (2.0, 1.0)
+    Notes
+    -----
+    All arguments broadcast against each other, so sweeps of e.g. fiber volume
+    fraction and void content are evaluated at once without material objects.
+    E_l and nu_lt follow the rule of mixtures for all methods, the methods differ
+    in the matrix dominated E_t and G_lt.
+    The voids are part of the matrix phase: the matrix moduli are reduced linearly
+    by the porosity :math:`p = V_v / (1 - V_f)`.
+    References
+    ----------
+    .. [1] J.C. Halpin and J.L. Kardos, "The Halpin-Tsai equations: a review",
+       Polymer Engineering and Science 16(5), pp. 344-352, 1976
+    .. [2] C.C. Chamis, "Simplified composite micromechanics equations for
+       hygral, thermal and mechanical properties", SAMPE Quarterly 15(3), 1984
+    Returns
+    -------
+    dict
+        "E_l", "E_t", "nu_lt", "G_lt" and "density" (if given) as arrays
+    Examples
+    --------
+    >>> constants = get_constants(230000.0, 15000.0, 0.2, 27000.0, 3500.0, 0.35,
+    ...     fiber_volume=np.linspace(0.5, 0.65, 1000))
+    >>> get_plane_stiffness(constants)  # (1000, 3, 3)
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}'! (Possible: {METHODS})")
+    v_f = np.asarray(fiber_volume, dtype=float)
+    v_v = np.asarray(void_content, dtype=float)
+    if np.any(v_f < 0) or np.any(v_v < 0) or np.any(v_f + v_v >= 1):
+        raise ValueError(
+            "Fiber volume fraction and void content have to be positive "
+            "and leave a matrix fraction."
+        )
+    v_m = 1.0 - v_f
+    porosity = v_v / v_m
+    E_m = np.asarray(E_m, dtype=float) * (1.0 - porosity)
+    G_m = E_m / (2.0 * (1.0 + np.asarray(nu_m, dtype=float)))
+
+    E_l = v_f * E_f_l + v_m * E_m
+    nu_lt = v_f * nu_f_lt + v_m * nu_m
+    if method == "rule-of-mixtures":
+        E_t = 1.0 / (v_f / E_f_t + v_m / E_m)
+        G_lt = 1.0 / (v_f / G_f_lt + v_m / G_m)
+    elif method == "halpin-tsai":
+        E_t = _get_halpin_tsai(E_f_t, E_m, v_f, xi[0])
+        G_lt = _get_halpin_tsai(G_f_lt, G_m, v_f, xi[1])
+    else:
+        root = np.sqrt(v_f)
+        E_t = E_m / (1.0 - root * (1.0 - E_m / E_f_t))
+        G_lt = G_m / (1.0 - root * (1.0 - G_m / G_f_lt))
+
+    constants = dict(E_l=E_l, E_t=E_t, nu_lt=nu_lt, G_lt=G_lt)
+    if density_f is not None and density_m is not None:
+        constants["density"] = v_f * density_f + (v_m - v_v) * density_m
+    shape = np.broadcast_shapes(*(np.shape(value) for value in constants.values()))
+    return {key: np.broadcast_to(value, shape) for key, value in constants.items()}
+
+
+def _get_halpin_tsai(fiber: ArrayLike, matrix: ndarray, v_f: ndarray, xi: float):
+    ratio = fiber / matrix
+    eta = (ratio - 1.0) / (ratio + xi)
+    return matrix * (1.0 + xi * eta * v_f) / (1.0 - eta * v_f)
+
+
+def get_compliance(constants: dict, dtype=np.float64) -> ndarray:
+    """
+    Compliance of transversely isotropic plies.
+    Parameters
+    ----------
+    constants : dict
+        "E_l", "E_t", "nu_lt", "G_lt" and optional "nu_tt" as arrays
+    dtype : numpy.dtype, optional
+        precision of the result, default float64
+    Notes
+    -----
+    The compliance equals **TransverselyIsotropicMaterial.get_compliance()**.
+    Returns
+    -------
+    array
+        compliance, dim=(..., 6, 6)
+    """
+    E_l = np.asarray(constants["E_l"], dtype=float)
+    E_t = np.asarray(constants["E_t"], dtype=float)
+    nu_lt = np.asarray(constants["nu_lt"], dtype=float)
+    G_lt = np.asarray(constants["G_lt"], dtype=float)
+    nu_tt = np.asarray(constants.get("nu_tt", nu_lt), dtype=float)
+    shape = np.broadcast_shapes(E_l.shape, E_t.shape, nu_lt.shape, G_lt.shape)
+
+    compliance = np.zeros(shape + (6, 6))
+    compliance[..., 0, 0] = 1 / E_l
+    compliance[..., 1, 1] = 1 / E_t
+    compliance[..., 2, 2] = 1 / E_t
+
+    compliance[..., 1, 0] = compliance[..., 0, 1] = -nu_lt / E_l
+    compliance[..., 2, 0] = compliance[..., 0, 2] = -nu_lt / E_l
+    compliance[..., 2, 1] = compliance[..., 1, 2] = -nu_tt / E_l
+
+    compliance[..., 3, 3] = 2 * (1.0 + nu_tt) / E_l
+    compliance[..., 4, 4] = 1 / G_lt
+    compliance[..., 5, 5] = 1 / G_lt
+    return compliance.astype(dtype, copy=False)
+
+
+def get_stiffness(constants: dict, dtype=np.float64) -> ndarray:
+    """
+    Stiffness of transversely isotropic plies.
+    Parameters
+    ----------
+    constants : dict
+        "E_l", "E_t", "nu_lt", "G_lt" and optional "nu_tt" as arrays
+    dtype : numpy.dtype, optional
+        precision of the result, the inversion always uses float64, default float64
+    Returns
+    -------
+    array
+        stiffness, dim=(..., 6, 6)
+    """
+    return np.linalg.inv(get_compliance(constants)).astype(dtype, copy=False)
+
+
+def get_plane_stiffness(constants: dict, dtype=np.float64) -> ndarray:
+    """
+    Plane stiffness (Q-Tensor) of transversely isotropic plies.
+    Parameters
+    ----------
+    constants : dict
+        "E_l", "E_t", "nu_lt" and "G_lt" as arrays
+    dtype : numpy.dtype, optional
+        precision of the result, default float64
+    Notes
+    -----
+    Equals **Material.get_plane_strain_stiffness()**, so the result can be used
+    as ply stiffness of **LaminationParameters** or rotated for batched ABD-Matrices.
+    Returns
+    -------
+    array
+        plane stiffness, dim=(..., 3, 3)
+    """
+    E_l = np.asarray(constants["E_l"], dtype=float)
+    E_t = np.asarray(constants["E_t"], dtype=float)
+    nu_lt = np.asarray(constants["nu_lt"], dtype=float)
+    G_lt = np.asarray(constants["G_lt"], dtype=float)
+    shape = np.broadcast_shapes(E_l.shape, E_t.shape, nu_lt.shape, G_lt.shape)
+
+    denominator = 1.0 - nu_lt**2 * E_t / E_l
+    stiffness = np.zeros(shape + (3, 3))
+    stiffness[..., 0, 0] = E_l / denominator
+    stiffness[..., 1, 1] = E_t / denominator
+    stiffness[..., 0, 1] = stiffness[..., 1, 0] = nu_lt * E_t / denominator
+    stiffness[..., 2, 2] = G_lt
+    return stiffness.astype(dtype, copy=False)
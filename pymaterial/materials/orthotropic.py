@@ -15,7 +15,17 @@ class OrthotropicMaterial(Material):
         G_yz: float,
         density: float,
         failures: Optional[List[IFailure]] = None,
+        alpha: Optional[List[float]] = None,
+        beta: Optional[List[float]] = None,
     ):
+        """
+        Parameters
+        ----------
+        alpha : List[float], optional
+            coefficients of thermal expansion in x, y and z, default 0.0
+        beta : List[float], optional
+            coefficients of moisture expansion in x, y and z, default 0.0
+        """
         self.E_x = E_x
         self.E_y = E_y
         self.E_z = E_z
@@ -37,6 +47,10 @@ class OrthotropicMaterial(Material):
             GYZ=G_yz,
             DENS=density,
         )
+        if alpha is not None:
+            attr.update(zip(["ALPX", "ALPY", "ALPZ"], alpha))
+        if beta is not None:
+            attr.update(zip(["BETX", "BETY", "BETZ"], beta))
         super().__init__(attr, failures=failures)
 
     def get_compliance(self) -> ndarray:
@@ -11,6 +11,10 @@ class TransverselyIsotropicMaterial(OrthotropicMaterial):
         density: float,
         nu_tt: Optional[float] = None,
         failures: Optional[List[IFailure]] = None,
+        alpha_l: float = 0.0,
+        alpha_t: float = 0.0,
+        beta_l: float = 0.0,
+        beta_t: float = 0.0,
     ):
         self.E_l = E_l
         self.E_t = E_t
@@ -31,6 +35,8 @@ class TransverselyIsotropicMaterial(OrthotropicMaterial):
             G_yz=0.0,
             density=density,
             failures=failures,
+            alpha=[alpha_l, alpha_t, alpha_t],
+            beta=[beta_l, beta_t, beta_t],
         )
 
     def get_E1(self) -> float:
@@ -0,0 +1,351 @@
+import atexit
+import functools
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from types import FunctionType
+from typing import Callable, Iterator, List, Optional
+import numpy as np
+
+ENVIRONMENT_VARIABLE = "PYMATERIAL_PROFILE"
+
+# module, base class and instrumented methods, only patched where defined,
+# methods of subclasses are patched once (Material is an IFailure)
+INSTRUMENTED = [
+    (
+        "pymaterial.materials",
+        "Material",
+        [
+            "get_failure",
+            "get_batch_failure",
+            "get_batch_failure_gradient",
+            "get_plane_stress_stiffness",
+            "get_plane_strain_stiffness",
+        ],
+    ),
+    (
+        "pymaterial.failures",
+        "IFailure",
+        [
+            "get_failure",
+            "get_batch_failure",
+            "get_batch_failure_gradient",
+            "get_stiffness",
+            "get_compliance",
+        ],
+    ),
+    (
+        "pymaterial.combis.clt",
+        "Ply",
+        [
+            "calc_stiffness",
+            "get_local_stress",
+            "get_local_strain",
+            "get_strain_transformation",
+        ],
+    ),
+    (
+        "pymaterial.combis.clt",
+        "Stackup",
+        [
+            "calc_abd",
+            "calc_abd_inv",
+            "calc_layers",
+            "calc_homogenized",
+            "_update_abd",
+            "apply_load",
+            "get_strains",
+            "get_stresses",
+            "get_failure",
+            "analyze",
+            "recover",
+            "analyze_stream",
+            "get_envelope",
+        ],
+    ),
+]
+LINALG = ["inv", "solve"]
+
+_lock = threading.Lock()
+_profilers: List["Profiler"] = []
+_patches: List[tuple] = []
+
+
+class Profiler:
+    def __init__(self):
+        """
+        Call counts, wall times and counters of the instrumented hot paths.
+        Notes
+        -----
+        Only collects while activated by **profile()** or the environment
+        variable PYMATERIAL_PROFILE, see **enable()**.
+        """
+        self.stages = dict()
+        self.counters = dict()
+
+    def add_stage(self, stage: str, duration: float, elements: int):
+        """
+        Record one call of a stage.
+        Parameters
+        ----------
+        stage : str
+            name of the stage, e.g. "Stackup.calc_abd"
+        duration : float
+            wall time of the call in [s]
+        elements : int
+            number of evaluated items (stress states, load cases, matrices)
+        """
+        values = self.stages.get(stage)
+        if values is None:
+            values = self.stages[stage] = [0, 0.0, 0]
+        values[0] += 1
+        values[1] += duration
+        values[2] += elements
+
+    def add_count(self, counter: str, value: int = 1):
+        """
+        Increase a counter, e.g. "cache.hits" or "linalg.inv".
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def get_report(self) -> dict:
+        """
+        Structured report of the collected values.
+        Notes
+        -----
+        Stage times are inclusive, e.g. the time of "Stackup.analyze" contains
+        the time of the failure criteria it calls.
+        Returns
+        -------
+        dict
+            - "stages": stage name and dict of "calls", "time" in [s] and
+              "elements", sorted by descending time
+            - "counters": counter name and value, e.g. "cache.hits",
+              "cache.misses", "cache.<attribute>.misses", "linalg.inv",
+              "linalg.inv.matrices"
+        """
+        with _lock:
+            stages = {
+                stage: dict(calls=calls, time=duration, elements=elements)
+                for stage, (calls, duration, elements) in self.stages.items()
+            }
+            counters = dict(sorted(self.counters.items()))
+        stages = dict(sorted(stages.items(), key=lambda item: -item[1]["time"]))
+        return dict(stages=stages, counters=counters)
+
+    def format_report(self) -> str:
+        """
+        Returns
+        -------
+        str
+            report as table
+        """
+        report = self.get_report()
+        header = f"{'stage':48} {'calls':>10} {'time [s]':>12} {'elements':>12}"
+        lines = [header, "-" * len(header)]
+        for stage, values in report["stages"].items():
+            lines.append(
+                f"{stage:48} {values['calls']:10d} {values['time']:12.4e} "
+                f"{values['elements']:12d}"
+            )
+        lines.append("")
+        lines.extend(
+            f"{counter:48} {value:10d}" for counter, value in report["counters"].items()
+        )
+        return "\n".join(lines)
+
+
+def _get_elements(args: tuple) -> int:
+    # leading dimensions of the first array argument, vectors count as one
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            return int(np.prod(arg.shape[:-1], dtype=np.int64)) if arg.ndim > 1 else 1
+    return 1
+
+
+def _record(stage: str, duration: float, elements: int):
+    with _lock:
+        for profiler in _profilers:
+            profiler.add_stage(stage, duration, elements)
+
+
+def _count(counter: str, value: int = 1):
+    with _lock:
+        for profiler in _profilers:
+            profiler.add_count(counter, value)
+
+
+def _timed(function: Callable, stage: str) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(stage, time.perf_counter() - start, _get_elements(args[1:]))
+
+    return wrapper
+
+
+def _counted_linalg(function: Callable, name: str) -> Callable:
+    @functools.wraps(function)
+    def wrapper(a, *args, **kwargs):
+        _count(f"linalg.{name}")
+        _count(
+            f"linalg.{name}.matrices", int(np.prod(np.shape(a)[:-2], dtype=np.int64))
+        )
+        return function(a, *args, **kwargs)
+
+    return wrapper
+
+
+def _counted_cache(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(obj: object, name: str, calc: Callable):
+        result = "hits" if getattr(obj, name) is not None else "misses"
+        _count(f"cache.{result}")
+        _count(f"cache.{name}.{result}")
+        return function(obj, name, calc)
+
+    return wrapper
+
+
+def _get_classes(base: type) -> Iterator[type]:
+    yield base
+    for subclass in base.__subclasses__():
+        yield from _get_classes(subclass)
+
+
+def _patch(owner: object, name: str, wrapper: Callable):
+    _patches.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, wrapper)
+
+
+def _install():
+    from pymaterial import concurrency
+
+    patched = set()
+    for module, base, methods in INSTRUMENTED:
+        base = getattr(importlib.import_module(module), base)
+        for cls in set(_get_classes(base)):
+            for method in methods:
+                function = cls.__dict__.get(method)
+                if isinstance(function, FunctionType) and (cls, method) not in patched:
+                    patched.add((cls, method))
+                    _patch(cls, method, _timed(function, f"{cls.__name__}.{method}"))
+
+    for name in LINALG:
+        _patch(np.linalg, name, _counted_linalg(getattr(np.linalg, name), name))
+    # modules bind the cache helper on import, so it is replaced per module
+    cached = concurrency.cached
+    for module in list(sys.modules.values()):
+        if getattr(module, "cached", None) is cached:
+            _patch(module, "cached", _counted_cache(cached))
+
+
+def _uninstall():
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+def enable(profiler: Optional[Profiler] = None) -> Profiler:
+    """
+    Start collecting into a profiler.
+    Parameters
+    ----------
+    profiler : Profiler, optional
+        profiler to collect into, default a new one
+    Notes
+    -----
+    The first enabled profiler replaces the instrumented methods of all loaded
+    **Material**, **IFailure**, **Ply** and **Stackup** classes, the cache
+    helper of their modules and **numpy.linalg.inv** / **solve** by timing and
+    counting wrappers. The last disabled profiler restores the originals, so
+    there is no overhead at all while profiling is disabled.
+    Nested profilers all collect, inversions are counted process wide.
+    Classes defined while profiling are not instrumented.
+    Returns
+    -------
+    Profiler
+        the collecting profiler
+    """
+    if profiler is None:
+        profiler = Profiler()
+    with _lock:
+        if not _profilers:
+            _install()
+        _profilers.append(profiler)
+    return profiler
+
+
+def disable(profiler: Profiler):
+    """
+    Stop collecting into a profiler.
+    Parameters
+    ----------
+    profiler : Profiler
+        profiler returned by **enable()**
+    """
+    with _lock:
+        _profilers.remove(profiler)
+        if not _profilers:
+            _uninstall()
+
+
+def is_enabled() -> bool:
+    return bool(_profilers)
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """
+    Profile the hot paths within a with-block.
+    Returns
+    -------
+    Profiler
+        profiler of the block
+    Examples
+    --------
+    >>> with profile() as profiler:
+    ...     stackup.analyze(loads)
+    >>> profiler.get_report()["stages"]["Stackup.calc_abd"]["time"]
+    >>> print(profiler.format_report())
+    """
+    profiler = enable()
+    try:
+        yield profiler
+    finally:
+        disable(profiler)
+
+
+def enable_from_environment() -> Optional[Profiler]:
+    """
+    Profile the whole process if PYMATERIAL_PROFILE is set.
+    Notes
+    -----
+    Called on import of **pymaterial**. With the value "1" the report is
+    printed to stderr at exit, any other value is used as path of a json report.
+    Returns
+    -------
+    Profiler
+        the process profiler or None if the variable is not set
+    """
+    value = os.environ.get(ENVIRONMENT_VARIABLE, "")
+    if value in ("", "0"):
+        return None
+    profiler = enable()
+    atexit.register(_write_report, profiler, value)
+    return profiler
+
+
+def _write_report(profiler: Profiler, target: str):
+    if target == "1":
+        print(profiler.format_report(), file=sys.stderr)
+    else:
+        with open(target, "w") as file:
+            json.dump(profiler.get_report(), file, indent=2)
@@ -0,0 +1,112 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure, VonMisesFailure
+from pymaterial.combis.clt import CriticalLocations, Ply, Stackup
+
+failing = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0]), VonMisesFailure(100.0)],
+)
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+stackup = Stackup(
+    [Ply(failing, 0.5, 0.0), Ply(material, 0.5, np.pi / 4), Ply(failing, 0.5, 0.3)]
+)
+loads = np.random.default_rng(1).normal(size=(200, 6))
+
+
+def get_expected(values: np.ndarray, k: int):
+    flat = np.where(np.isnan(values), -np.inf, values).reshape(-1)
+    order = np.argsort(-flat, kind="stable")[:k]
+    return order, np.unravel_index(order, values.shape)
+
+
+@pytest.mark.parametrize("chunk_size, k", [(1, 5), (7, 20), (200, 100), (64, 1000)])
+def test_critical(chunk_size, k):
+    full = stackup.analyze(loads)
+    result = stackup.get_critical(loads, k, chunk_size).get_result()
+    for key, values in full["failures"].items():
+        order, (case, ply, point) = get_expected(values, k)
+        n = min(k, values.size)
+        assert len(result[key]["value"]) == n
+        assert np.allclose(
+            result[key]["value"], values.reshape(-1)[order], equal_nan=True
+        )
+        finite = np.isfinite(result[key]["value"])
+        # locations give the reported values and stresses
+        found = values[result[key]["case"], result[key]["ply"], result[key]["point"]]
+        assert np.allclose(found[finite], result[key]["value"][finite])
+        stresses = full["stresses"][
+            result[key]["case"], result[key]["ply"], result[key]["point"]
+        ]
+        assert np.allclose(result[key]["stresses"], stresses)
+        assert np.all(result[key]["element"] == -1)
+        assert np.array_equal(result[key]["ply"][finite] % 2, np.zeros(finite.sum()))
+
+
+def test_merge_elements():
+    first = stackup.get_critical(loads[:120], k=10, element=3)
+    second = CriticalLocations(k=10)
+    chunk = stackup.analyze(loads[120:])
+    second.update(
+        chunk["failures"],
+        120,
+        7,
+        stresses=chunk["stresses"],
+        strains=chunk["strains"],
+        defined=stackup.get_criteria(),
+    )
+    first.merge(second)
+    assert first.count == len(loads)
+    result = first.get_result()["mises"]
+    values = stackup.analyze(loads)["failures"]["mises"]
+    order, (case, _, _) = get_expected(values, 10)
+    assert np.allclose(result["value"], values.reshape(-1)[order])
+    assert np.array_equal(result["element"], np.where(case < 120, 3, 7))
+
+
+def test_material():
+    stresses = np.random.default_rng(2).normal(0.0, 50.0, size=(1000, 3))
+    critical = CriticalLocations(k=3)
+    for start in range(0, 1000, 300):
+        chunk = stresses[start : start + 300]
+        failures = failing.get_batch_failure(chunk, np.zeros_like(chunk))
+        critical.update(failures, elements=np.arange(start, start + len(chunk)) + 1000)
+    result = critical.get_result()["mises"]
+    values = failing.get_batch_failure(stresses, np.zeros_like(stresses))["mises"]
+    expected = np.argsort(-values)[:3]
+    assert np.array_equal(result["case"], expected)
+    assert np.array_equal(result["element"], expected + 1000)
+    assert "ply" not in result
+
+
+def test_nan_is_critical():
+    critical = CriticalLocations(k=2)
+    values = np.array([[[0.5, np.nan]], [[np.inf, 0.2]], [[0.1, 0.3]]])
+    critical.update(dict(cuntze=values[:2]))
+    critical.update(dict(cuntze=values[2:]))
+    result = critical.get_result()["cuntze"]
+    assert np.isnan(result["value"][0]) and np.isinf(result["value"][1])
+    assert np.array_equal(result["case"], [0, 1])
+
+    critical = CriticalLocations(k=2)
+    critical.update(dict(cuntze=values), defined=dict(cuntze=[[True, False]]))
+    result = critical.get_result()["cuntze"]
+    assert np.array_equal(result["value"], [np.inf, 0.5])
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        CriticalLocations(k=0)
+    critical = CriticalLocations(k=2)
+    critical.update(dict(mises=np.ones((3, 2, 2))), stresses=np.ones((3, 2, 2, 3)))
+    with pytest.raises(ValueError):
+        critical.update(dict(mises=np.ones((3, 2, 2))))
+    with pytest.raises(ValueError):
+        critical.update(dict(mises=np.ones((3, 2, 2, 2))))
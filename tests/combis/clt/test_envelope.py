@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure, VonMisesFailure
+from pymaterial.combis.clt import Envelope, Ply, Stackup
+
+failing = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0]), VonMisesFailure(100.0)],
+)
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+stackup = Stackup(
+    [Ply(failing, 0.5, 0.0), Ply(material, 0.5, np.pi / 4), Ply(failing, 0.5, 0.0)]
+)
+loads = np.random.default_rng(1).normal(size=(50, 6))
+
+
+@pytest.mark.parametrize("chunk_size, top_k", [(1, None), (7, 3), (50, 5), (64, 60)])
+def test_envelope(chunk_size, top_k):
+    full = stackup.analyze(loads)["failures"]
+    result = stackup.get_envelope(loads, chunk_size, top_k).get_result()
+    for key, values in full.items():
+        assert np.allclose(result[key]["max"], np.max(values, axis=0), equal_nan=True)
+        assert np.array_equal(result[key]["case"][0], np.argmax(values, axis=0)[0])
+        if top_k is not None:
+            k = min(top_k, len(loads))
+            top = -np.sort(-values, axis=0)[:k]
+            assert np.allclose(result[key]["top"], top, equal_nan=True)
+            cases = result[key]["top_case"][:, 0]
+            assert np.allclose(np.take_along_axis(values[:, 0], cases, 0), top[:, 0])
+
+
+def test_merge():
+    full = stackup.analyze(loads)["failures"]
+    first = Envelope(top_k=4)
+    second = Envelope(top_k=4)
+    first.update(stackup.analyze(loads[:20])["failures"])
+    second.update(stackup.analyze(loads[20:])["failures"], 20)
+    first.merge(second)
+    result = first.get_result()
+    assert first.count == 50
+    assert np.array_equal(result["mises"]["case"][0], np.argmax(full["mises"][:, 0], 0))
+    assert np.allclose(
+        result["mises"]["top"][0], np.max(full["mises"], 0), equal_nan=True
+    )
+
+
+def test_nan_is_worst():
+    values = np.array([[[np.nan, 0.1]], [[0.5, np.nan]], [[np.inf, 0.2]]])
+    envelope = Envelope(top_k=2)
+    envelope.update(dict(cuntze=values[:2]))
+    envelope.update(dict(cuntze=values[2:]))
+    result = envelope.get_result()["cuntze"]
+    assert np.all(np.isnan(result["max"]))
+    assert np.array_equal(result["case"], [[0, 1]])
+    assert np.array_equal(result["top_case"][:, 0, 0], [0, 2])
+    assert np.array_equal(result["top"][:, 0, 1], [np.nan, 0.2], equal_nan=True)
+
+    envelope = Envelope()
+    envelope.update(dict(cuntze=values), defined=dict(cuntze=[False]))
+    assert np.all(np.isnan(envelope.get_result()["cuntze"]["max"]))
+
+
+def test_wrong_top_k():
+    with pytest.raises(ValueError):
+        Envelope(top_k=0)
@@ -0,0 +1,104 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.combis.clt import DesignIndex, LaminationParameters, Ply, Stackup
+from pymaterial.combis.clt.index import get_abd_vector, get_vector
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+
+
+def get_stackup(angles, thickness=0.125):
+    return Stackup([Ply(material, thickness, angle, degree=True) for angle in angles])
+
+
+def brute_force(vectors, target, k):
+    distances = np.linalg.norm(vectors - target, axis=-1)
+    order = np.argsort(distances, kind="stable")[:k]
+    return distances[order], order
+
+
+def test_vector():
+    stackup = get_stackup([0.0, 45.0, -45.0, 90.0, 30.0])
+    thick = get_stackup([0.0, 45.0, -45.0, 90.0, 30.0], thickness=0.5)
+    vector = get_vector(stackup)
+    assert vector.shape == (18,)
+    assert np.allclose(vector, get_vector(thick))
+    # equal to the normalized ABD of the lamination parameters
+    parameters = LaminationParameters.from_stackup(stackup)
+    assert np.allclose(get_abd_vector(parameters.get_abd(), 0.625), vector)
+    assert get_vector(stackup, "lamination").shape == (12,)
+    with pytest.raises(ValueError):
+        get_vector(stackup, "unknown")
+
+
+@pytest.mark.parametrize("leaf_size, buffer_size", [(1, 0), (8, 100), (32, 10**4)])
+def test_query(leaf_size, buffer_size):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(2000, 6))
+    index = DesignIndex(leaf_size=leaf_size, buffer_size=buffer_size)
+    index.add(vectors[:1500], ids=np.arange(1500) + 10)
+    for chunk in np.split(vectors[1500:], 5):
+        index.add(chunk, ids=np.arange(len(chunk)) + 10 + len(index))
+    assert len(index) == 2000
+
+    targets = rng.normal(size=(20, 6))
+    distances, ids = index.query(targets, k=7)
+    assert distances.shape == ids.shape == (20, 7)
+    for target, distance, id in zip(targets, distances, ids):
+        expected, order = brute_force(vectors, target, 7)
+        assert np.allclose(distance, expected)
+        assert np.array_equal(id, order + 10)
+
+    distances, ids = index.query_radius(targets[0], 1.5)
+    expected = np.linalg.norm(vectors - targets[0], axis=-1)
+    assert np.array_equal(np.sort(ids - 10), np.flatnonzero(expected <= 1.5))
+    assert np.all(np.diff(distances) >= 0)
+    assert len(index.query_radius(targets, 1.0)) == 20
+
+
+def test_stackups(tmp_path):
+    angles = [[0.0, a, -a, 90.0, 90.0, -a, a, 0.0] for a in np.arange(0.0, 90.0, 5.0)]
+    stackups = [get_stackup(a) for a in angles]
+    index = DesignIndex(kind="lamination", buffer_size=4)
+    index.add(stackups, ids=np.arange(len(stackups)) * 100)
+    distance, ids = index.query(get_stackup(angles[7]), k=2)
+    assert ids[0] == 700 and distance[0] == pytest.approx(0.0, abs=1e-12)
+    assert ids[1] in (600, 800)
+
+    distances, ids = index.query(stackups[2:5], k=2)
+    assert distances.shape == ids.shape == (3, 2)
+    assert np.array_equal(ids[:, 0], [200, 300, 400])
+    results = index.query_radius(stackups[2:5], 1e-9)
+    assert isinstance(results, list) and len(results) == 3
+    assert [result[1].tolist() for result in results] == [[200], [300], [400]]
+
+    path = str(tmp_path / "designs.npz")
+    index.save(path)
+    loaded = DesignIndex.load(path)
+    assert loaded.kind == "lamination" and len(loaded) == len(stackups)
+    assert np.array_equal(
+        loaded.query(stackups[3], k=3)[1], index.query(stackups[3], k=3)[1]
+    )
+    loaded.add([get_stackup([0.0, 42.0, -42.0, 90.0])], ids=[-1])
+    assert loaded.query(get_stackup([0.0, 42.0, -42.0, 90.0]))[1][0] == -1
+
+
+def test_weights_errors(tmp_path):
+    index = DesignIndex(weights=[1.0, 0.0])
+    with pytest.raises(ValueError):
+        index.query([0.0, 0.0])
+    index.add(np.array([[0.0, 0.0], [1.0, 10.0], [2.0, -5.0]]))
+    assert np.array_equal(index.query([0.9, 0.0], k=3)[1], [1, 0, 2])
+    path = str(tmp_path / "weights.npz")
+    index.save(path)
+    assert np.array_equal(DesignIndex.load(path).query([0.9, 0.0], k=3)[1], [1, 0, 2])
+    with pytest.raises(ValueError):
+        index.add(np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        index.add(np.zeros((2, 2)), ids=[1])
+    with pytest.raises(ValueError):
+        index.query([0.0, 0.0], k=0)
+    with pytest.raises(ValueError):
+        DesignIndex(kind="unknown")
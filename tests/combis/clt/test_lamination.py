@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from pymaterial.materials import IsotropicMaterial, TransverselyIsotropicMaterial
+from pymaterial.combis.clt import LaminationParameters, Ply, Stackup
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+rng = np.random.default_rng(0)
+stackup = Stackup(
+    [
+        Ply(material, t, r)
+        for t, r in zip(rng.uniform(0.1, 0.3, 7), rng.uniform(-2, 2, 7))
+    ]
+)
+
+
+def test_from_stackup():
+    parameters = LaminationParameters.from_stackup(stackup)
+    assert parameters.get_parameters().shape == (12,)
+    assert np.all(np.abs(parameters.get_parameters()) <= 1.0)
+    abd = stackup.calc_abd()
+    assert np.allclose(parameters.get_abd(), abd, atol=1e-9 * np.abs(abd).max())
+
+
+def test_batch():
+    parameters = LaminationParameters.from_stackup(stackup).get_parameters()
+    thickness = np.array([1.0, stackup.get_thickness(), 2.0])
+    batch = LaminationParameters(
+        np.stack([parameters] * 3), thickness, material.get_plane_strain_stiffness()
+    )
+    abd = batch.get_abd()
+    assert abd.shape == (3, 6, 6)
+    assert np.allclose(abd[1], stackup.calc_abd())
+    # A scales with h, D with h^3
+    assert np.allclose(abd[2, :3, :3], 2 * abd[0, :3, :3])
+    assert np.allclose(abd[2, 3:, 3:], 8 * abd[0, 3:, 3:])
+
+
+def test_mixed_materials():
+    other = IsotropicMaterial(70000.0, 0.3, 2.7e-9)
+    with pytest.raises(ValueError):
+        LaminationParameters.from_stackup(
+            Stackup([Ply(material, 1.0, 0.0), Ply(other, 1.0, 0.0)])
+        )
+
+
+def test_equal_materials():
+    copy = TransverselyIsotropicMaterial(
+        E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+    )
+    mixed = Stackup([Ply(material, 1.0, 0.3), Ply(copy, 1.0, -0.3)])
+    parameters = LaminationParameters.from_stackup(mixed)
+    assert np.allclose(parameters.get_abd(), mixed.calc_abd())
+
+
+def test_wrong_length():
+    with pytest.raises(ValueError):
+        LaminationParameters(np.zeros(11), 1.0, np.eye(3))
+
+
+def test_float32():
+    parameters = LaminationParameters.from_stackup(stackup)
+    abd = parameters.get_abd(dtype=np.float32)
+    assert abd.dtype == np.float32
+    assert np.allclose(
+        abd, parameters.get_abd(), rtol=1e-6, atol=1e-6 * np.abs(abd).max()
+    )
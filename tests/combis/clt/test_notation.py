@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.combis.clt import Ply, Stackup, StackingSequence
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+
+
+@pytest.mark.parametrize(
+    "notation, angles",
+    [
+        ("[0/90]", [0, 90]),
+        ("0/90/45", [0, 90, 45]),
+        ("[0/90]s", [0, 90, 90, 0]),
+        ("[0/90]2s", [0, 90, 0, 90, 90, 0, 90, 0]),
+        ("[0/90]s2", [0, 90, 90, 0, 0, 90, 90, 0]),
+        ("[±45]", [45, -45]),
+        ("[+-45/-+30]T", [45, -45, -30, 30]),
+        ("[∓45_2]", [-45, 45, -45, 45]),
+        ("[0₂/90]", [0, 0, 90]),
+        ("[(0/±45/90)2]", [0, 45, -45, 90, 0, 45, -45, 90]),
+        ("[0/(45/-45)_2/22.5]", [0, 45, -45, 45, -45, 22.5]),
+        ("[ 0 / [90/0]s ]", [0, 90, 0, 0, 90]),
+    ],
+)
+def test_angles(notation, angles):
+    assert StackingSequence(notation).get_angles() == angles
+    assert str(StackingSequence(notation)) == notation
+
+
+@pytest.mark.parametrize("notation", ["[0/90", "[0/]", "[0/90]x", "[0_0]", "[a]", ""])
+def test_invalid(notation):
+    with pytest.raises(ValueError):
+        StackingSequence(notation)
+
+
+@pytest.mark.parametrize(
+    "notation",
+    [
+        "[(0/±45/90)3]s",
+        "[0/30/(60/-15)_3/90]2",
+        "[(0/±45)2/90_3]s3",
+        "[15/(30/[45/60]s)_4/-70]",
+    ],
+)
+def test_stackup(notation):
+    sequence = StackingSequence(notation)
+    stackup = sequence.get_stackup(material, 0.125)
+    reference = Stackup(
+        [Ply(material, 0.125, angle, degree=True) for angle in sequence.get_angles()]
+    )
+    assert len(stackup.get_plies()) == len(reference.get_plies())
+    assert stackup.abd is not None
+    assert np.allclose(stackup.get_abd(), reference.get_abd(), atol=1e-6)
+    assert np.allclose(stackup.calc_abd(), reference.calc_abd(), atol=1e-6)
+    assert stackup.is_symmetric() == reference.is_symmetric()
+    assert stackup.is_balanced() == reference.is_balanced()
+    loads = np.random.default_rng(0).normal(size=(5, 6))
+    assert np.allclose(
+        stackup.analyze(loads)["strains"], reference.analyze(loads)["strains"]
+    )
+
+
+def test_shared_plies():
+    stackup = StackingSequence("[(0/±45/90)25]s").get_stackup(material, 0.1)
+    plies = stackup.get_plies()
+    assert len(plies) == 200
+    assert len({id(ply) for ply in plies}) == 4
+    assert stackup.get_thickness() == pytest.approx(20.0)
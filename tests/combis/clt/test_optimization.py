@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup, StackingOptimizer
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0])],
+)
+loads = np.array([[100.0, 20.0, 10.0, 0.0, 0.0, 0.0], [50.0, 0.0, 40.0, 1.0, 0.0, 0.0]])
+
+
+def test_failure_matches_stackup():
+    optimizer = StackingOptimizer(material, 0.125, 8, loads, seed=0)
+    sequences = optimizer.expand(np.array([[0, 1, 2, 3], [3, 3, 0, 1]]))
+    failure = optimizer.get_failure(sequences)
+    for sequence, value in zip(sequences, failure):
+        stackup = Stackup(
+            [Ply(material, 0.125, optimizer.angles[i], degree=True) for i in sequence]
+        )
+        result = stackup.analyze(loads, failures_only=True)
+        assert value == pytest.approx(np.max(result["failures"]["max-stress"]))
+
+
+def test_violations():
+    optimizer = StackingOptimizer(
+        material, 0.125, 8, loads, max_contiguous=2, symmetric=False
+    )
+    sequences = np.array(
+        [
+            [0, 1, 2, 3, 3, 2, 1, 0],  # feasible
+            [0, 1, 1, 3, 3, 2, 1, 0],  # unbalanced by 2
+            [0, 0, 0, 1, 2, 3, 3, 3],  # two runs of three
+        ]
+    )
+    assert optimizer.get_violations(sequences).tolist() == [0, 2, 2]
+
+
+def test_symmetric_plies():
+    with pytest.raises(ValueError):
+        StackingOptimizer(material, 0.125, 7, loads)
+
+
+def test_run():
+    kwargs = dict(population=20, seed=1)
+    result = StackingOptimizer(material, 0.125, 8, loads, **kwargs).run(20)
+    assert result["feasible"]
+    assert result["stackup"].is_symmetric() and result["stackup"].is_balanced()
+    assert np.all(np.diff(result["history"]) <= 0)
+    assert result["history"][-1] == pytest.approx(result["failure"])
+
+    # deterministic, also with parallel evaluation
+    other = StackingOptimizer(material, 0.125, 8, loads, workers=2, **kwargs).run(20)
+    assert other["angles"] == result["angles"]
+    assert other["history"] == pytest.approx(result["history"])
+
+
+def test_cache():
+    optimizer = StackingOptimizer(material, 0.125, 8, loads)
+    genes = np.array([[0, 1, 2, 3], [0, 1, 2, 3], [3, 2, 1, 0]])
+    fitness = optimizer.evaluate(genes)
+    assert len(optimizer.cache) == 2
+    assert fitness[0] == fitness[1]
+    optimizer.evaluate(genes.astype(np.int32))
+    optimizer.evaluate(np.asfortranarray(genes[::-1]))
+    assert len(optimizer.cache) == 2
+
+
+def test_all_workers():
+    genes = np.array([[0, 1, 2, 3], [3, 2, 1, 0], [1, 1, 0, 0]])
+    serial = StackingOptimizer(material, 0.125, 8, loads).evaluate(genes)
+    parallel = StackingOptimizer(material, 0.125, 8, loads, workers=None)
+    assert np.allclose(parallel.evaluate(genes), serial)
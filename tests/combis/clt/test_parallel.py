@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure, VonMisesFailure
+from pymaterial.combis.clt import ParallelExecutor, Ply, Stackup
+
+failing = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0]), VonMisesFailure(100.0)],
+)
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+stackups = [
+    Stackup([Ply(failing, 1.0, 0.0)]),
+    Stackup([Ply(failing, 0.5, 0.0), Ply(material, 0.5, 1.0), Ply(failing, 0.5, 2.0)]),
+]
+loads = np.random.default_rng(2).normal(size=(30, 6))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 4), (2, 4), (3, 30)])
+def test_analyze(workers, chunk_size):
+    executor = ParallelExecutor(workers, chunk_size, min_cases=0)
+    failures = executor.analyze(stackups, loads)
+    assert len(failures) == len(stackups)
+    for stackup, failure in zip(stackups, failures):
+        expected = stackup.analyze(loads, failures_only=True)["failures"]
+        assert failure.keys() == expected.keys()
+        for key in expected:
+            assert np.array_equal(failure[key], expected[key], equal_nan=True)
+
+
+def test_no_load_cases():
+    executor = ParallelExecutor(2, 4, min_cases=0)
+    failures = executor.analyze(stackups, np.zeros((0, 6)))
+    for stackup, failure in zip(stackups, failures):
+        assert failure["mises"].shape == (0, len(stackup.get_plies()), 2)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, 1), (1, 0)])
+def test_wrong_arguments(workers, chunk_size):
+    with pytest.raises(ValueError):
+        ParallelExecutor(workers, chunk_size)
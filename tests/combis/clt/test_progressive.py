@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.progressive import get_progressive_failure
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0])],
+)
+stackup = Stackup(
+    [
+        Ply(material, 0.125, angle, degree=True)
+        for angle in [0, 45, -45, 90, 90, -45, 45, 0]
+    ]
+)
+loads = np.array(
+    [[1000.0, 0, 0, 0, 0, 0], [0, 500.0, 200.0, 0, 0, 0], [0, 0, 0, 50.0, 0, 0]]
+)
+
+
+def test_without_degradation():
+    steps = 200
+    result = get_progressive_failure(stackup, loads, degradation=(1, 1, 1), steps=steps)
+    failures = stackup.analyze(loads, failures_only=True)["failures"]["max-stress"]
+    # max stress is linear in the load, ply p fails at the factor 1 / f_p
+    expected = np.ceil(steps / np.max(failures, axis=-1) - 1e-9) / steps
+    expected[expected > 1] = np.nan
+    assert np.allclose(result["failed"], expected, equal_nan=True)
+    assert np.allclose(result["first_ply"][:2], np.nanmin(expected[:2], axis=1))
+    assert np.isnan(result["first_ply"][2])
+    assert np.all(result["degradation"] == 1.0)
+
+
+def test_degradation():
+    intact = get_progressive_failure(stackup, 5 * loads, degradation=(1, 1, 1))
+    result = get_progressive_failure(stackup, 5 * loads)
+    assert np.allclose(result["first_ply"], intact["first_ply"])
+    # degraded plies shed their load to the remaining plies
+    assert np.all(result["last_ply"][:2] < intact["last_ply"][:2])
+    assert np.isnan(intact["last_ply"][2]) and result["last_ply"][2] < 1.0
+    failed = ~np.isnan(result["failed"])
+    assert np.allclose(result["degradation"][failed], 0.01)
+    assert np.allclose(result["degradation"][~failed], 1.0)
+
+
+def test_incremental_abd():
+    # uniformly scaled moduli scale the stiffness like a degradation
+    weak = TransverselyIsotropicMaterial(
+        E_l=141000.0e-9, E_t=9340.0e-9, nu_lt=0.35, G_lt=4500.0e-9, density=1.7e-9
+    )
+    cross_ply = Stackup([Ply(material, 0.125, a, degree=True) for a in [0, 90, 90, 0]])
+    load = np.array([[1500.0, 0, 0, 0, 0, 0]])
+    steps = 1000
+    result = get_progressive_failure(
+        cross_ply, load, degradation=(1e-9,) * 3, steps=steps
+    )
+
+    intact = cross_ply.analyze(load, failures_only=True)["failures"]["max-stress"]
+    assert result["first_ply"][0] == pytest.approx(
+        np.ceil(steps / np.max(intact[0, 1])) / steps
+    )
+    degraded = Stackup(
+        [
+            Ply(material, 0.125, 0.0),
+            Ply(weak, 0.125, 90, degree=True),
+            Ply(weak, 0.125, 90, degree=True),
+            Ply(material, 0.125, 0.0),
+        ]
+    ).analyze(load, failures_only=True)["failures"]["max-stress"]
+    assert result["last_ply"][0] == pytest.approx(
+        np.ceil(steps / np.max(degraded[0, 0])) / steps
+    )
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        get_progressive_failure(stackup, loads, degradation=(0.1, 0.1))
+    with pytest.raises(ValueError):
+        get_progressive_failure(stackup, loads, steps=0)
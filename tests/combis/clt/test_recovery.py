@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.recovery import recover_elements
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[MaxStressFailure([1500.0, 50.0, 70.0])],
+    alpha_t=30e-6,
+)
+properties = {
+    7: Stackup([Ply(material, 0.125, a, degree=True) for a in [0, 45, -45, 90]]),
+    3: Stackup([Ply(material, 0.25, a, degree=True) for a in [0, 90, 0]]),
+    12: Stackup([Ply(material, 0.2, 30, degree=True)]),
+}
+rng = np.random.default_rng(0)
+property_ids = rng.choice([3, 7, 12], size=50)
+deformations = rng.normal(0.0, 1e-3, size=(50, 6))
+
+
+def test_recover():
+    stackup = properties[7]
+    loads = deformations @ stackup.get_abd().T
+    expected = stackup.analyze(loads)
+    result = stackup.recover(deformations)
+    assert np.allclose(result["stresses"], expected["stresses"])
+    assert np.allclose(
+        result["failures"]["max-stress"], expected["failures"]["max-stress"]
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [None, 4])
+def test_recover_elements(chunk_size):
+    delta_t = rng.normal(0.0, 50.0, size=50)
+    result = recover_elements(
+        deformations,
+        property_ids,
+        properties,
+        failures_only=False,
+        chunk_size=chunk_size,
+        delta_t=delta_t,
+    )
+    assert result["stresses"].shape == (50, 4, 2, 3)
+    assert result["failures"]["max-stress"].shape == (50, 4, 2)
+    for e, pid in enumerate(property_ids):
+        stackup = properties[pid]
+        n_plies = len(stackup.get_plies())
+        expected = stackup.recover(deformations[e], delta_t=delta_t[e])
+        assert np.allclose(result["stresses"][e, :n_plies], expected["stresses"][0])
+        assert np.allclose(
+            result["failures"]["max-stress"][e, :n_plies],
+            expected["failures"]["max-stress"][0],
+        )
+        assert np.all(np.isnan(result["failures"]["max-stress"][e, n_plies:]))
+
+
+def test_missing():
+    with pytest.raises(ValueError):
+        recover_elements(deformations, property_ids, {3: properties[3]})
+    with pytest.raises(ValueError):
+        recover_elements(deformations, property_ids[:10], properties)
+
+
+def test_float32():
+    single = recover_elements(
+        deformations, property_ids, properties, failures_only=False, dtype=np.float32
+    )
+    double = recover_elements(
+        deformations, property_ids, properties, failures_only=False
+    )
+    for key in ["strains", "stresses"]:
+        assert single[key].dtype == np.float32
+        scale = np.nanmax(np.abs(double[key]))
+        assert np.allclose(single[key], double[key], atol=1e-6 * scale, equal_nan=True)
+    assert single["failures"]["max-stress"].dtype == np.float32
+    assert np.allclose(
+        single["failures"]["max-stress"],
+        double["failures"]["max-stress"],
+        rtol=1e-5,
+        equal_nan=True,
+    )
@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure, VonMisesFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.sensitivity import get_sensitivities
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[
+        VonMisesFailure(100.0),
+        MaxStressFailure([1500.0, 50.0, 70.0]),
+        CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+    ],
+)
+thickness = np.array([0.1, 0.2, 0.15, 0.3])
+rotation = np.array([0.1, 0.8, -0.5, 1.3])
+loads = np.array([[1.0, -2.0, 0.5, 0.1, 0.02, -0.05], [3.0, 1.0, -1.0, 0.2, 0.1, 0.1]])
+
+
+def create(thickness, rotation):
+    return Stackup([Ply(material, t, r) for t, r in zip(thickness, rotation)])
+
+
+@pytest.mark.parametrize("parameter", ["rotation", "thickness"])
+def test_finite_differences(parameter):
+    gradient = get_sensitivities(create(thickness, rotation), loads)
+    h = 1e-6
+    for k in range(len(thickness)):
+        values = []
+        for sign in (1.0, -1.0):
+            t = thickness.copy()
+            r = rotation.copy()
+            if parameter == "rotation":
+                r[k] += sign * h
+            else:
+                t[k] += sign * h
+            stackup = create(t, r)
+            values.append((stackup.calc_abd(), stackup.analyze(loads)))
+
+        d_abd = (values[0][0] - values[1][0]) / (2 * h)
+        assert np.allclose(gradient["abd"][parameter][k], d_abd, rtol=1e-6, atol=1e-3)
+        for key in ["deformations", "strains", "stresses"]:
+            fd = (values[0][1][key] - values[1][1][key]) / (2 * h)
+            scale = np.abs(fd).max()
+            assert np.allclose(gradient[key][parameter][..., k], fd, atol=1e-6 * scale)
+        for key, value in values[0][1]["failures"].items():
+            fd = (value - values[1][1]["failures"][key]) / (2 * h)
+            d_failure = gradient["failures"][key][parameter][..., k]
+            assert np.allclose(d_failure, fd, atol=1e-6 * np.abs(fd).max())
+
+
+def test_failures_only():
+    gradient = get_sensitivities(create(thickness, rotation), loads, True)
+    assert set(gradient.keys()) == {"abd", "failures"}
+    assert gradient["failures"]["cuntze"]["thickness"].shape == (2, 4, 2, 4)
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import sys
+import tempfile
+import numpy as np
+import pytest
+from pymaterial.combis.clt.server import (
+    EvaluationClient,
+    EvaluationServer,
+    build_material,
+    build_stackup,
+    get_hash,
+)
+
+MATERIAL = dict(
+    type="TransverselyIsotropicMaterial",
+    args=dict(E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9),
+    failures=[
+        dict(type="MaxStressFailure", args=dict(stress_strength=[1500.0, 50.0, 70.0]))
+    ],
+)
+STACKUP = dict(
+    materials=[MATERIAL],
+    plies=[
+        dict(material=0, thickness=0.125, rotation=angle)
+        for angle in (0.0, 45.0, -45.0, 90.0, 90.0, -45.0, 45.0, 0.0)
+    ],
+)
+
+
+def test_build():
+    stackup = build_stackup(STACKUP)
+    plies = stackup.get_plies()
+    assert len(plies) == 8
+    assert plies[1].get_rotation(degree=True) == pytest.approx(45.0)
+    assert plies[0].get_material() is plies[1].get_material()
+    assert get_hash(STACKUP) == get_hash(dict(reversed(list(STACKUP.items()))))
+    with pytest.raises(ValueError):
+        build_material(dict(type="Stackup"))
+    with pytest.raises(ValueError):
+        EvaluationServer(window=-1.0)
+
+
+async def _run_clients(server: EvaluationServer, address: dict, loads: np.ndarray):
+    clients = [await EvaluationClient.connect(**address) for _ in range(4)]
+    try:
+        requests = [
+            clients[i % len(clients)].analyze(STACKUP, loads[i : i + 1])
+            for i in range(len(loads))
+        ]
+        first = await asyncio.gather(*requests)
+        # warm: only the hash is sent
+        second = await clients[0].analyze(STACKUP, loads)
+        stresses = np.array([[100.0, 10.0, 5.0], [2000.0, 0.0, 0.0]])
+        material = await clients[1].get_batch_failure(
+            MATERIAL, stresses, np.zeros_like(stresses)
+        )
+        with pytest.raises(ValueError):
+            await clients[2].analyze(STACKUP, np.ones((2, 5)))
+    finally:
+        for client in clients:
+            await client.close()
+    return first, second, material
+
+
+def _serve(address: dict, loads: np.ndarray, **kwargs):
+    async def run():
+        server = EvaluationServer(**kwargs)
+        sockets = await server.start(**address)
+        if "path" not in address:
+            address["port"] = sockets.sockets[0].getsockname()[1]
+        try:
+            return server, await _run_clients(server, address, loads)
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_server():
+    loads = np.random.default_rng(0).normal(0.0, 50.0, size=(32, 6))
+    expected = build_stackup(STACKUP).analyze(loads, failures_only=True)["failures"]
+    server, (first, second, material) = _serve(dict(), loads, window=0.05)
+
+    result = np.concatenate([values["max-stress"] for values in first])
+    np.testing.assert_allclose(result, expected["max-stress"])
+    np.testing.assert_allclose(second["max-stress"], expected["max-stress"])
+    # the single load cases were coalesced
+    assert server.batches < len(loads)
+    assert len(server.cache) == 2
+
+    reference = build_material(MATERIAL).get_batch_failure(
+        np.array([[100.0, 10.0, 5.0], [2000.0, 0.0, 0.0]]), np.zeros((2, 3))
+    )
+    np.testing.assert_allclose(material["max-stress"], reference["max-stress"])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires Unix sockets")
+def test_unix_socket():
+    loads = np.ones((3, 6))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pymaterial.sock")
+        server, (first, _, _) = _serve(
+            dict(path=path), loads, max_batch=1, cache_size=1
+        )
+    # every request is evaluated on its own, the cache holds one entry
+    assert server.batches == len(loads) + 2
+    assert len(server.cache) == 1
+    expected = build_stackup(STACKUP).analyze(loads, failures_only=True)["failures"]
+    np.testing.assert_allclose(
+        np.concatenate([values["max-stress"] for values in first]),
+        expected["max-stress"],
+    )
+
+
+def test_invalid_shapes():
+    async def run():
+        server = EvaluationServer(window=0.01)
+        valid = server.evaluate(
+            dict(material=MATERIAL, stresses=[[1.0, 2.0, 3.0]], strains=[[0.0] * 3])
+        )
+        invalid = server.evaluate(
+            dict(material=MATERIAL, stresses=[[1.0] * 4], strains=[[0.0] * 4])
+        )
+        loads = server.evaluate(dict(stackup=STACKUP, loads=np.ones((2, 2, 6))))
+        return await asyncio.gather(valid, invalid, loads, return_exceptions=True)
+
+    valid, invalid, loads = asyncio.run(asyncio.wait_for(run(), 5.0))
+    assert valid["failures"]["max-stress"].shape == (1,)
+    assert isinstance(invalid, ValueError)
+    assert isinstance(loads, ValueError)
+
+
+def test_failing_batch():
+    async def run():
+        server = EvaluationServer(window=0.01)
+        key, material = server.get_cached("material", dict(material=MATERIAL))
+
+        def fail(*_):
+            raise RuntimeError("criterion failed")
+
+        material.get_batch_failure = fail
+        request = dict(hash=key, stresses=[[1.0, 2.0, 3.0]], strains=[[0.0] * 3])
+        return await asyncio.gather(
+            server.evaluate(request), server.evaluate(request), return_exceptions=True
+        )
+
+    results = asyncio.run(asyncio.wait_for(run(), 5.0))
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_optional_strains():
+    stresses = np.array([[100.0, 20.0, -30.0], [1600.0, 0.0, 0.0]])
+
+    async def run():
+        server = EvaluationServer(window=0.01)
+        answer = await server.evaluate(dict(material=MATERIAL, stresses=stresses))
+        return answer["failures"]
+
+    failures = asyncio.run(asyncio.wait_for(run(), 5.0))
+    material = build_material(MATERIAL)
+    strains = np.matmul(stresses, material.get_compliance()[[0, 1, 5]][:, [0, 1, 5]].T)
+    expected = material.get_batch_failure(stresses, strains)
+    np.testing.assert_allclose(failures["max-stress"], expected["max-stress"])
@@ -1,5 +1,6 @@
 import pytest
 from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure, VonMisesFailure
 from pymaterial.combis.clt import Ply, Stackup
 import numpy as np
 from math import ceil, log
@@ -183,3 +184,245 @@ def test_stresses(plies: list, loading, stresses):
         for j in range(len(stress)):
             significance = get_significance(stress[j])
             assert round(layer_stresses[i][1][j], significance + 1) == stress[j]
+
+
+def test_analyze():
+    failing = TransverselyIsotropicMaterial(
+        E_l=141000.0,
+        E_t=9340.0,
+        nu_lt=0.35,
+        G_lt=4500.0,
+        density=1.7e-9,
+        failures=[MaxStressFailure([1500.0, 50.0, 70.0]), VonMisesFailure(100.0)],
+    )
+    plies = [
+        Ply(failing, 0.25, 0.0),
+        Ply(material, 0.5, 45.0, degree=True),
+        Ply(failing, 0.25, 90.0, degree=True),
+    ]
+    stackup = Stackup(plies)
+    loads = np.array([[1.0, 0.5, 0.2, 0.1, -0.3, 0.05], [-2.0, 0.0, 1.0, 0.0, 0.4, 0]])
+    result = stackup.analyze(loads)
+    assert result["strains"].shape == (2, 3, 2, 3)
+    assert result["failures"]["mises"].shape == (2, 3, 2)
+    assert np.all(np.isnan(result["failures"]["mises"][:, 1]))
+
+    for n, load in enumerate(loads):
+        deform = stackup.apply_load(load)
+        strains = stackup.get_strains(deform)
+        stresses = stackup.get_stresses(strains)
+        failures = stackup.get_failure(stresses, strains)
+        assert np.allclose(result["deformations"][n], deform)
+        for i in range(len(plies)):
+            for j in range(2):
+                assert np.allclose(result["strains"][n, i, j], strains[i][j])
+                assert np.allclose(result["stresses"][n, i, j], stresses[i][j])
+                for key, value in failures[i][j].items():
+                    assert np.isclose(result["failures"][key][n, i, j], value)
+
+    only = stackup.analyze(loads, failures_only=True)
+    assert list(only.keys()) == ["failures"]
+    assert np.array_equal(
+        only["failures"]["max-stress"], result["failures"]["max-stress"], equal_nan=True
+    )
+
+
+def test_incremental():
+    other = TransverselyIsotropicMaterial(
+        E_l=121000.0, E_t=8600.0, nu_lt=0.27, G_lt=4700.0, density=1.49e-9
+    )
+    plies = [Ply(material, 0.1 + 0.05 * i, 0.3 * i) for i in range(6)]
+    stackup = Stackup(list(plies))
+    stackup.get_abd()
+    stackup.get_homogenized()
+
+    stackup.set_rotation(1, 30.0, degree=True)
+    plies[1] = Ply(material, plies[1].thickness, 30.0, degree=True)
+    stackup.set_thickness(2, 0.4)
+    plies[2] = Ply(material, 0.4, plies[2].rotation)
+    stackup.set_material(-1, other)
+    plies[-1] = Ply(other, plies[-1].thickness, plies[-1].rotation)
+    stackup.set_thickness(5, 0.05)
+    plies[5] = Ply(other, 0.05, plies[5].rotation)
+
+    rebuilt = Stackup(plies)
+    assert np.allclose(stackup.get_abd(False), rebuilt.calc_abd(), rtol=1e-10)
+    assert np.allclose(stackup.get_abd_inv(), rebuilt.get_abd_inv())
+    assert np.isclose(stackup.get_thickness(), rebuilt.get_thickness())
+    assert np.isclose(stackup.get_density(), rebuilt.get_density())
+    assert np.isclose(stackup.get_homogenized().E_l, rebuilt.get_homogenized().E_l)
+    loads = np.ones((2, 6))
+    assert np.allclose(
+        stackup.analyze(loads)["strains"], rebuilt.analyze(loads)["strains"]
+    )
+
+
+def test_abd_copy():
+    stackup = Stackup([Ply(material, 0.25, a, degree=True) for a in [0, 45, 90]])
+    expected = stackup.get_abd(False).copy()
+    for truncate in (True, False):
+        abd = stackup.get_abd(truncate)
+        abd[:] = 0.0
+    assert np.array_equal(stackup.get_abd(False), expected)
+    assert np.allclose(stackup.get_abd(), expected)
+    assert np.allclose(np.matmul(stackup.get_abd_inv(), expected), np.eye(6))
+
+
+@pytest.mark.parametrize(
+    "angles, symmetric, balanced",
+    [
+        ([0, 45, -45, 90, 90, -45, 45, 0], True, True),
+        ([45, -45, 0], False, True),
+        ([45, 0, 45], True, False),
+        ([30, -30, 90, -90], False, True),
+        ([45, 0], False, False),
+    ],
+)
+def test_structure(angles, symmetric, balanced):
+    stackup = Stackup([Ply(material, 0.25, a, degree=True) for a in angles])
+    assert stackup.is_symmetric() == symmetric
+    assert stackup.is_balanced() == balanced
+
+    abd = stackup.get_abd(truncate=False)
+    abd_inv = stackup.get_abd_inv()
+    if symmetric:
+        assert np.all(abd[:3, 3:] == 0.0) and np.all(abd[3:, :3] == 0.0)
+        assert np.all(abd_inv[:3, 3:] == 0.0) and np.all(abd_inv[3:, :3] == 0.0)
+    if balanced:
+        assert np.all(abd[[0, 1], 2] == 0.0) and np.all(abd[2, [0, 1]] == 0.0)
+    assert np.allclose(np.matmul(abd_inv, stackup.get_abd()), np.eye(6))
+
+    loads = np.array([[1.0, 2.0, -0.5, 0.1, -0.2, 0.3]])
+    deform = stackup.analyze(loads)["deformations"][0]
+    assert np.allclose(deform, np.linalg.solve(stackup.get_abd(), loads[0]))
+
+
+def test_structure_after_edit():
+    stackup = Stackup([Ply(material, 0.25, a, degree=True) for a in [45, -45, 0]])
+    stackup.get_abd()
+    stackup.set_rotation(2, 45.0, degree=True)
+    assert stackup.is_symmetric() and not stackup.is_balanced()
+    assert np.all(stackup.get_abd(truncate=False)[:3, 3:] == 0.0)
+
+
+def test_structure_equal_materials():
+    copy = TransverselyIsotropicMaterial(
+        E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+    )
+    stackup = Stackup(
+        [
+            Ply(material, 0.25, 45.0, degree=True),
+            Ply(copy, 0.25, -45.0, degree=True),
+            Ply(copy, 0.25, -45.0, degree=True),
+            Ply(material, 0.25, 45.0, degree=True),
+        ]
+    )
+    assert stackup.is_symmetric() and stackup.is_balanced()
+    stackup.get_abd()
+    truncated = stackup.abd_truncated
+    assert stackup.get_abd_inv() is stackup.get_abd_inv()
+    stackup.get_abd()
+    assert stackup.abd_truncated is truncated
+
+
+def test_structure_random_edits():
+    rng = np.random.default_rng(0)
+    angles = [0.0, 45.0, -45.0, 90.0, 30.0, -30.0]
+    stackup = Stackup([Ply(material, 0.25, 45.0, degree=True) for _ in range(7)])
+    for _ in range(200):
+        index = int(rng.integers(7))
+        if rng.random() < 0.8:
+            stackup.set_rotation(index, float(rng.choice(angles)), degree=True)
+        else:
+            stackup.set_thickness(index, float(rng.choice([0.25, 0.5])))
+        assert stackup.is_symmetric() == stackup.calc_symmetric()
+        assert stackup.is_balanced() == stackup.calc_balanced()
+    thickness = [ply.thickness for ply in stackup.get_plies()]
+    assert np.allclose(stackup.tracking["z_bot"], np.cumsum(thickness) - thickness)
+
+
+def test_expansion():
+    expanding = TransverselyIsotropicMaterial(
+        E_l=141000.0,
+        E_t=9340.0,
+        nu_lt=0.35,
+        G_lt=4500.0,
+        density=1.7e-9,
+        alpha_l=-0.5e-6,
+        alpha_t=30e-6,
+        beta_t=3e-3,
+    )
+    ply = Ply(expanding, 0.125, 45, degree=True)
+    assert np.allclose(ply.get_thermal_expansion(local=True), [-0.5e-6, 30e-6, 0.0])
+    assert np.allclose(ply.get_thermal_expansion(), [14.75e-6, 14.75e-6, -30.5e-6])
+
+    delta_t = np.array([-100.0, 0.0, 50.0])
+    delta_m = np.array([0.0, 0.01, 0.01])
+    loads = np.zeros((1, 6))
+
+    # unsymmetric cross ply warps, but stays free of resultants
+    stackup = Stackup([Ply(expanding, 0.125, a, degree=True) for a in [0, 90]])
+    result = stackup.analyze(loads, delta_t=delta_t, delta_m=delta_m)
+    assert result["deformations"].shape == (3, 6)
+    assert np.all(result["deformations"][[0, 2], 3] != 0.0)
+    expected = stackup.get_abd_inv() @ stackup.get_hygral_load(0.01)[0]
+    assert np.allclose(result["deformations"][1], expected)
+    stresses = np.einsum(
+        "pji,npkj->npki",
+        stackup.get_layers()["strain_transformation"],
+        result["stresses"],
+    )
+    # global stresses are linear over each ply, integrate with the trapezoidal rule
+    forces = np.sum(np.mean(stresses, axis=2), axis=1) * 0.125
+    assert np.allclose(forces, 0.0, atol=1e-9)
+
+    # resultants combine with mechanical loads
+    mechanical = np.array([[100.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+    combined = stackup.analyze(mechanical, delta_t=delta_t)
+    total = mechanical + stackup.get_thermal_load(delta_t)
+    assert np.allclose(combined["deformations"], stackup.analyze(total)["deformations"])
+    assert np.allclose(
+        combined["stresses"],
+        stackup.analyze(mechanical)["stresses"]
+        + stackup.analyze(loads, delta_t=delta_t)["stresses"],
+    )
+
+    # a single ply expands freely without stresses
+    single = Stackup([ply])
+    result = single.analyze(loads, delta_t=delta_t)
+    assert np.allclose(result["stresses"], 0.0)
+    assert np.allclose(
+        result["deformations"][:, :3], delta_t[:, None] * [14.75e-6, 14.75e-6, -30.5e-6]
+    )
+    assert np.allclose(
+        single.get_hygral_load(1.0)[0, :3] / 0.125,
+        ply.get_stiffness() @ ply.get_hygral_expansion(),
+    )
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_analyze_float32(symmetric):
+    failing = TransverselyIsotropicMaterial(
+        E_l=141000.0,
+        E_t=9340.0,
+        nu_lt=0.35,
+        G_lt=4500.0,
+        density=1.7e-9,
+        failures=[
+            MaxStressFailure([1500.0, 50.0, 70.0]),
+            CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+        ],
+    )
+    angles = [0, 45, -45, 90, 90, -45, 45, 0] if symmetric else [0, 45, 90, 30]
+    stackup = Stackup([Ply(failing, 0.125, a, degree=True) for a in angles])
+    loads = np.random.default_rng(0).normal(0.0, 3.0, size=(200, 6))
+    single = stackup.analyze(loads, dtype=np.float32)
+    double = stackup.analyze(loads)
+    assert single["deformations"].dtype == np.float64
+    for key in ["strains", "stresses"]:
+        assert single[key].dtype == np.float32
+        scale = np.abs(double[key]).max()
+        assert np.allclose(single[key], double[key], rtol=1e-5, atol=1e-6 * scale)
+    for key, value in double["failures"].items():
+        assert single["failures"][key].dtype == np.float32
+        assert np.allclose(single["failures"][key], value, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from pymaterial.materials import IsotropicMaterial, TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.stochastic import Statistics, get_monte_carlo
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[
+        MaxStressFailure([1500.0, 50.0, 70.0]),
+        CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+    ],
+)
+stackup = Stackup(
+    [Ply(material, 0.125, angle, degree=True) for angle in [0, 45, -45, 90, 30]]
+)
+loads = np.array([[100.0, 20.0, 10.0, 0.0, 0.0, 0.0], [50.0, 0.0, 40.0, 1.0, 0.0, 0.0]])
+scatter = dict(E_l=0.05, E_t=0.05, G_lt=0.08, thickness=0.03, rotation=0.02)
+
+
+def test_statistics():
+    values = np.random.default_rng(0).normal(2.0, 0.5, size=(1000, 3))
+    statistics = Statistics()
+    for chunk in np.array_split(values, 7):
+        statistics.update(chunk)
+    other = Statistics()
+    other.update(values[:400])
+    rest = Statistics()
+    rest.update(values[400:])
+    other.merge(rest)
+    for result in [statistics.get_result(), other.get_result()]:
+        assert result["count"] == 1000
+        assert np.allclose(result["mean"], np.mean(values, axis=0))
+        assert np.allclose(result["std"], np.std(values, axis=0, ddof=1))
+        assert np.allclose(result["min"], np.min(values, axis=0))
+        assert np.allclose(result["max"], np.max(values, axis=0))
+
+
+def test_b_basis_factor():
+    statistics = Statistics()
+    statistics.update(np.zeros(10))
+    # tabulated exact factor for 10 samples
+    assert statistics.get_b_basis_factor() == pytest.approx(2.355, rel=0.02)
+    statistics.update(np.zeros(990))
+    assert statistics.get_b_basis_factor() == pytest.approx(1.3528, rel=0.01)
+
+
+def test_without_scatter():
+    result = get_monte_carlo(stackup, loads, 10, dict(), chunk_size=4)
+    expected = stackup.analyze(loads)
+    assert np.allclose(result["deformations"]["mean"], expected["deformations"])
+    assert np.allclose(result["deformations"]["std"], 0.0, atol=1e-12)
+    for key in ["max-stress", "cuntze"]:
+        assert np.allclose(
+            result[key]["mean"], np.max(expected["failures"][key], axis=(1, 2))
+        )
+
+
+def test_scatter():
+    result = get_monte_carlo(stackup, loads, 2000, scatter, seed=1, chunk_size=300)
+    nominal = stackup.analyze(loads)
+    failure = result["max-stress"]
+    assert failure["count"] == 2000
+    assert np.all(failure["std"] > 0)
+    assert np.all(failure["min"] < failure["mean"])
+    assert np.all(failure["mean"] < failure["b_basis"])
+    assert np.all(failure["b_basis"] < failure["max"])
+    assert np.allclose(
+        result["deformations"]["mean"], nominal["deformations"], rtol=0.02, atol=1e-6
+    )
+
+
+def test_reproducible():
+    kwargs = dict(seed=3, chunk_size=50)
+    serial = get_monte_carlo(stackup, loads, 200, scatter, **kwargs)
+    again = get_monte_carlo(stackup, loads, 200, scatter, **kwargs)
+    parallel = get_monte_carlo(stackup, loads, 200, scatter, workers=2, **kwargs)
+    other = get_monte_carlo(stackup, loads, 200, scatter, seed=4, chunk_size=50)
+    for key in serial:
+        assert np.array_equal(serial[key]["mean"], again[key]["mean"])
+        assert np.allclose(serial[key]["mean"], parallel[key]["mean"])
+    assert not np.allclose(serial["cuntze"]["mean"], other["cuntze"]["mean"])
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        get_monte_carlo(stackup, loads, 10, dict(E_x=0.1))
+    with pytest.raises(ValueError):
+        get_monte_carlo(stackup, loads, 10, dict(thickness=-0.1))
+    isotropic = Stackup([Ply(IsotropicMaterial(70000.0, 0.3, 2.7e-9), 1.0, 0.0)])
+    with pytest.raises(ValueError):
+        get_monte_carlo(isotropic, loads, 10, dict(E_l=0.1))
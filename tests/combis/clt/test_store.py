@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.store import ResultStore
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[
+        MaxStressFailure([1500.0, 50.0, 70.0]),
+        CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+    ],
+)
+stackup = Stackup(
+    [Ply(material, 0.125, angle, degree=True) for angle in [0.0, 45.0, -45.0, 90.0]]
+)
+loads = np.random.default_rng(0).normal(0.0, 50.0, size=(1000, 6))
+
+
+def test_stream(tmp_path):
+    store = ResultStore(str(tmp_path / "store"))
+    for start, result in stackup.analyze_stream(loads, chunk_size=300):
+        store.append(result, start)
+    expected = stackup.analyze(loads)
+
+    assert len(store) == len(loads)
+    assert len(store.get_index()) == 4
+    assert store.get_columns()["strains"]["shape"] == [4, 2, 3]
+    np.testing.assert_allclose(store.read("deformations"), expected["deformations"])
+
+    elements = np.array([5, 299, 300, 999, 42])
+    np.testing.assert_allclose(
+        store.read("stresses", elements, plies=[1, 3]),
+        expected["stresses"][elements][:, [1, 3]],
+    )
+    np.testing.assert_allclose(
+        store.read("strains", 310, plies=2), expected["strains"][310, 2]
+    )
+    np.testing.assert_allclose(
+        store.read("strains", slice(-10, None)), expected["strains"][-10:]
+    )
+    failures = store.read_failures(["cuntze"], slice(250, 350), plies=0)
+    assert list(failures.keys()) == ["cuntze"]
+    np.testing.assert_allclose(
+        failures["cuntze"], expected["failures"]["cuntze"][250:350, 0]
+    )
+    assert set(store.read_failures().keys()) == {"max-stress", "cuntze"}
+    assert store.read("strains", []).shape == (0, 4, 2, 3)
+
+    # reopened store
+    store = ResultStore(str(tmp_path / "store"))
+    np.testing.assert_allclose(
+        store.read("failures.max-stress"), expected["failures"]["max-stress"]
+    )
+
+
+def test_parallel(tmp_path):
+    store = ResultStore(str(tmp_path))
+    starts = list(range(0, len(loads), 100))
+
+    def produce(start):
+        result = stackup.analyze(loads[start : start + 100], failures_only=True)
+        store.append(result, start)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(produce, starts[::-1]))
+    expected = stackup.analyze(loads, failures_only=True)["failures"]
+    np.testing.assert_allclose(store.read("failures.cuntze"), expected["cuntze"])
+    with pytest.raises(ValueError):
+        store.read("strains")
+
+
+def test_float32_unordered(tmp_path):
+    store = ResultStore(str(tmp_path))
+    for chunk in np.split(loads, 4):
+        store.append(stackup.analyze(chunk, dtype=np.float32))
+    result = store.read("stresses", [0, 999])
+    assert result.dtype == np.float32
+    expected = stackup.analyze(loads[[0, 999]])["stresses"]
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-3)
+
+
+def test_errors(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.append(stackup.analyze(loads[:10]), start=0)
+    with pytest.raises(ValueError):
+        store.read("deformations", plies=0)
+    with pytest.raises(ValueError):
+        store.read("unknown")
+    with pytest.raises(ValueError):
+        store.read("strains", [10])
+    with pytest.raises(ValueError):
+        store.append(dict(strains=np.zeros((2, 1, 2, 3)), stresses=np.zeros((3,))))
+    store.append(stackup.analyze(loads[:10]), start=5)
+    with pytest.raises(ValueError):
+        store.get_index()
@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import VonMisesFailure
+from pymaterial.combis.clt import Ply, Stackup
+from pymaterial.combis.clt.streaming import iter_loads
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0,
+    E_t=9340.0,
+    nu_lt=0.35,
+    G_lt=4500.0,
+    density=1.7e-9,
+    failures=[VonMisesFailure(100.0)],
+)
+stackup = Stackup(
+    [Ply(material, 0.5, 0.0), Ply(material, 0.5, np.pi / 4), Ply(material, 0.5, 0.0)]
+)
+loads = np.random.default_rng(0).normal(size=(25, 6))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 25, 100])
+def test_sources(tmp_path, chunk_size):
+    np.save(tmp_path / "loads.npy", loads)
+    np.savetxt(tmp_path / "loads.csv", loads, delimiter=",", header="loads")
+    for source in [
+        loads,
+        str(tmp_path / "loads.npy"),
+        str(tmp_path / "loads.csv"),
+        tmp_path / "loads.npy",
+        tmp_path / "loads.csv",
+    ]:
+        chunks = list(iter_loads(source, chunk_size))
+        assert max(len(chunk) for chunk in chunks) <= chunk_size
+        assert np.allclose(np.concatenate(chunks), loads)
+
+
+def test_analyze_stream():
+    full = stackup.analyze(loads)["failures"]["mises"]
+    streamed = np.empty_like(full)
+    for start, result in stackup.analyze_stream(loads, 10, failures_only=True):
+        mises = result["failures"]["mises"]
+        streamed[start : start + len(mises)] = mises
+    assert np.allclose(streamed, full)
+
+
+def test_wrong_chunk_size():
+    with pytest.raises(ValueError):
+        next(iter_loads(loads, 0))
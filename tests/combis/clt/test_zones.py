@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from pymaterial.materials import IsotropicMaterial, TransverselyIsotropicMaterial
+from pymaterial.combis.clt import Ply, Stackup, ZonedLaminate
+
+material = TransverselyIsotropicMaterial(
+    E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+)
+other = IsotropicMaterial(70000.0, 0.3, 2.7e-9)
+rng = np.random.default_rng(0)
+plies = [
+    Ply(material if i % 3 else other, t, r)
+    for i, (t, r) in enumerate(zip(rng.uniform(0.1, 0.3, 12), rng.uniform(-2, 2, 12)))
+]
+laminate = ZonedLaminate(plies)
+
+
+def test_zones():
+    masks = rng.uniform(size=(5, len(plies))) > 0.3
+    masks[0] = True
+    abd = laminate.get_abd(masks)
+    thickness = laminate.get_thickness(masks)
+    density = laminate.get_density(masks)
+    for i, mask in enumerate(masks):
+        stackup = laminate.get_stackup(mask)
+        assert np.allclose(abd[i], stackup.calc_abd(), atol=1e-8)
+        assert np.isclose(thickness[i], stackup.get_thickness())
+        assert np.isclose(density[i], stackup.get_density())
+
+
+def test_ranges():
+    start = np.array([0, 2, 5, 11])
+    stop = np.array([12, 9, 6, 12])
+    abd = laminate.get_range_abd(start, stop)
+    thickness = laminate.get_range_thickness(start, stop)
+    density = laminate.get_range_density(start, stop)
+    for i in range(len(start)):
+        stackup = Stackup(plies[start[i] : stop[i]])
+        assert np.allclose(abd[i], stackup.calc_abd(), atol=1e-8)
+        assert np.isclose(thickness[i], stackup.get_thickness())
+        assert np.isclose(density[i], stackup.get_density())
+    assert np.allclose(laminate.get_range_abd(2, 9), abd[1])
+
+
+def test_empty_zone():
+    masks = np.ones((3, len(plies)), dtype=bool)
+    masks[1] = False
+    with pytest.raises(ValueError):
+        laminate.get_abd(masks)
+    with pytest.raises(ValueError):
+        laminate.get_density(masks)
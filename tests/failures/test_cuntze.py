@@ -1,5 +1,6 @@
 import pytest
-from pymaterial.failures import CuntzeFailure
+import numpy as np
+from pymaterial.failures import CuntzeFailure, IFailure
 
 
 @pytest.mark.parametrize(
@@ -12,3 +13,50 @@ def test_values(Em, rs, stresses, strains, result, ndigits):
     failure = CuntzeFailure(Em, rs[0], rs[1], rs[2], rs[3], rs[4])
     res = failure.get_failure(stresses, strains)
     assert round(res["cuntze"], ndigits) == result
+
+
+def test_batch_values():
+    failure = CuntzeFailure(1.0e3, 2.0, 1.0, 1.0, 2.0, 0.5)
+    stresses = np.array([[0.0, 0.0, 0.0], [1.0, 0.5, 0.1], [-1.0, -0.4, -0.2]])
+    strains = np.array([[0.0, 0.0, 0.0], [1.0e-3, 0.0, 0.0], [-5.0e-4, 0.0, 0.0]])
+    res = failure.get_batch_failure(stresses, strains)
+    for i in range(len(stresses)):
+        value = failure.get_failure(stresses[i], strains[i])["cuntze"]
+        assert round(res["cuntze"][i], 10) == round(value, 10)
+
+
+def test_batch_gradient():
+    failure = CuntzeFailure(1.0e3, 2.0, 1.0, 1.0, 2.0, 0.5)
+    rng = np.random.default_rng(0)
+    stresses = 0.3 * rng.normal(size=(4, 5, 3))
+    strains = 1.0e-3 * rng.normal(size=(4, 5, 3))
+    analytic = failure.get_batch_failure_gradient(stresses, strains)["cuntze"]
+    numeric = IFailure.get_batch_failure_gradient(failure, stresses, strains)["cuntze"]
+    assert np.allclose(analytic[0], numeric[0], atol=1e-6)
+    assert np.allclose(analytic[1], numeric[1], rtol=1e-6, atol=1e-4)
+
+
+def test_batch_float32():
+    failure = CuntzeFailure(1.0e3, 2.0, 1.0, 1.0, 2.0, 0.5)
+    rng = np.random.default_rng(1)
+    stresses = rng.normal(0.0, 0.2, size=(100, 3))
+    strains = rng.normal(0.0, 1.0e-3, size=(100, 3))
+    single = failure.get_batch_failure(
+        stresses.astype(np.float32), strains.astype(np.float32)
+    )["cuntze"]
+    double = failure.get_batch_failure(stresses, strains)["cuntze"]
+    assert single.dtype == np.float32
+    assert np.allclose(single, double, rtol=1e-5)
+
+
+def test_transverse_overload():
+    failure = CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0)
+    stresses = np.array([[0.0, 300.0, 10.0], [0.0, 300.0, 0.0], [0.0, 10.0, 10.0]])
+    strains = np.zeros((3, 3))
+    res = failure.get_batch_failure(stresses, strains)["cuntze"]
+    assert np.isinf(res[0]) and np.all(np.isfinite(res[1:]))
+    for i in range(len(stresses)):
+        value = failure.get_failure(stresses[i], strains[i])["cuntze"]
+        assert np.isclose(res[i], value)
+    d_stress, d_strain = failure.get_batch_failure_gradient(stresses, strains)["cuntze"]
+    assert np.all(np.isfinite(d_stress)) and np.all(d_stress[0] == 0.0)
@@ -1,5 +1,6 @@
 import pytest
-from pymaterial.failures import MaxStressFailure
+import numpy as np
+from pymaterial.failures import IFailure, MaxStressFailure
 
 
 @pytest.mark.parametrize(
@@ -59,3 +60,34 @@ def test_incorrect_stress_lenght(strength, stresses):
     failure = MaxStressFailure(strength)
     with pytest.raises(ValueError):
         failure.get_failure(stresses)
+    with pytest.raises(ValueError):
+        failure.get_batch_failure_gradient(np.array([stresses]))
+
+
+def test_batch_values():
+    stresses = np.array([[0.0, 0.0, 0.0], [2.0, 1.5, 0.5], [0.5, -0.5, 0.25]])
+    failure = MaxStressFailure([1.0, (0.0, 1.0), 1.0])
+    res = failure.get_batch_failure(stresses)
+    for i in range(len(stresses)):
+        for key, value in failure.get_failure(stresses[i]).items():
+            assert round(res[key][i], 10) == round(value, 10)
+
+
+@pytest.mark.parametrize(
+    "strength", [[1.0, (0.0, 1.0), 1.0], [1.0, (-1.0, 2.0), 1.0, 0.5, 0.5, 0.5]]
+)
+def test_batch_gradient(strength):
+    failure = MaxStressFailure(strength)
+    stresses = np.random.default_rng(0).normal(size=(4, 5, len(strength)))
+    analytic = failure.get_batch_failure_gradient(stresses)["max-stress"]
+    numeric = IFailure.get_batch_failure_gradient(failure, stresses)["max-stress"]
+    assert np.allclose(analytic[0], numeric[0], atol=1e-6)
+
+
+def test_batch_float32():
+    stresses = np.random.default_rng(1).normal(size=(100, 3))
+    failure = MaxStressFailure([1.0, (-0.5, 1.0), 1.0])
+    single = failure.get_batch_failure(stresses.astype(np.float32))["max-stress"]
+    double = failure.get_batch_failure(stresses)["max-stress"]
+    assert single.dtype == np.float32
+    assert np.allclose(single, double, rtol=1e-6)
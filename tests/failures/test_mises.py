@@ -1,5 +1,6 @@
 import pytest
-from pymaterial.failures import VonMisesFailure
+import numpy as np
+from pymaterial.failures import IFailure, VonMisesFailure
 
 
 @pytest.mark.parametrize(
@@ -51,3 +52,31 @@ def test_incorrect_stress_lenght(stresses):
     failure = VonMisesFailure(1)
     with pytest.raises(ValueError):
         failure.get_failure(stresses)
+
+
+def test_batch_values():
+    stresses = np.array([[0.0, 0.0, 0.0], [2.0, 1.5, 0.5], [0.5, -0.5, 0.25]])
+    failure = VonMisesFailure(2.0)
+    res = failure.get_batch_failure(stresses)
+    for i in range(len(stresses)):
+        for key, value in failure.get_failure(stresses[i]).items():
+            assert round(res[key][i], 10) == round(value, 10)
+
+
+@pytest.mark.parametrize("length", [3, 6])
+def test_batch_gradient(length):
+    failure = VonMisesFailure(2.0)
+    stresses = np.random.default_rng(0).normal(size=(4, 5, length))
+    stresses[0, 0] = 0.0
+    analytic = failure.get_batch_failure_gradient(stresses)["mises"]
+    numeric = IFailure.get_batch_failure_gradient(failure, stresses[:, 1:])["mises"]
+    assert np.allclose(analytic[0][:, 1:], numeric[0], atol=1e-6)
+    assert np.all(analytic[0][0, 0] == 0.0)
+
+
+def test_batch_float32():
+    stresses = np.random.default_rng(1).normal(size=(100, 6))
+    failure = VonMisesFailure(2.0)
+    single = failure.get_batch_failure(stresses.astype(np.float32))["mises"]
+    assert single.dtype == np.float32
+    assert np.allclose(single, failure.get_batch_failure(stresses)["mises"], rtol=1e-6)
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from pymaterial.failures import SurrogateFailure, VonMisesFailure, CuntzeFailure
+from pymaterial.materials import TransverselyIsotropicMaterial
+
+
+def test_max_error():
+    surrogate = SurrogateFailure(VonMisesFailure(200.0), [200.0, 200.0, 200.0])
+    assert 0.0 < surrogate.max_error["mises"] < 1e-2
+
+    stresses = np.array([[100.0, 20.0, -30.0], [0.0, 0.0, 0.0]])
+    approx = surrogate.get_batch_failure(stresses)["mises"]
+    exact = surrogate.get_batch_failure(stresses, exact=True)["mises"]
+    assert np.all(np.abs(approx - exact) <= surrogate.max_error["mises"])
+
+
+def test_outside_is_exact():
+    failure = VonMisesFailure(200.0)
+    surrogate = SurrogateFailure(failure, [200.0, 200.0, 200.0], resolution=5)
+    stresses = [1000.0, 0.0, 0.0]
+    assert surrogate.get_failure(stresses) == failure.get_failure(stresses)
+
+
+def test_strain_based():
+    material = TransverselyIsotropicMaterial(
+        E_l=121000, E_t=8600, nu_lt=0.27, G_lt=4700, density=1.490e-9
+    )
+    material.failures.append(CuntzeFailure(121000, 2231.0, 1082, 29, 100, 60))
+    surrogate = SurrogateFailure.from_material(
+        material, [2231.0, 100.0, 60.0], resolution=17
+    )
+    assert surrogate.keys == ["cuntze"]
+    res = surrogate.get_failure([0.0, 0.0, 0.0])
+    assert round(res["cuntze"], 6) == 0.0
+
+
+def test_persistence(tmp_path):
+    path = str(tmp_path / "mises.npy")
+    first = SurrogateFailure(VonMisesFailure(1.0), [1.0, 1.0, 1.0], 1.0, 9, path=path)
+    second = SurrogateFailure(VonMisesFailure(1.0), [1.0, 1.0, 1.0], 1.0, 9, path=path)
+    assert isinstance(second.table, np.memmap)
+    assert second.max_error == first.max_error
+    assert np.array_equal(second.table, first.table)
+
+
+def test_persistence_mismatch(tmp_path):
+    path = str(tmp_path / "mises.npy")
+    SurrogateFailure(VonMisesFailure(1.0), [1.0, 1.0, 1.0], 1.0, 9, path=path)
+    other = SurrogateFailure(VonMisesFailure(2.0), [1.0, 1.0, 1.0], 1.0, 9, path=path)
+    assert not isinstance(other.table, np.memmap)
+    assert np.isclose(other.get_failure([1.0, 0.0, 0.0])["mises"], 0.5, atol=1e-2)
+
+    np.save(path, np.zeros((1, 3, 3, 3)))
+    rebuilt = SurrogateFailure(VonMisesFailure(2.0), [1.0, 1.0, 1.0], 1.0, 9, path=path)
+    assert not isinstance(rebuilt.table, np.memmap)
+    assert rebuilt.table.shape == (1, 9, 9, 9)
+
+
+@pytest.mark.parametrize(
+    "scale",
+    [
+        ([1.0, 1.0]),
+        ([1.0, 1.0, 0.0]),
+        ([1.0, -1.0, 1.0]),
+    ],
+)
+def test_wrong_scale_exception(scale):
+    with pytest.raises(ValueError):
+        SurrogateFailure(VonMisesFailure(1.0), scale)
+
+
+def test_none_stress():
+    surrogate = SurrogateFailure(VonMisesFailure(1.0), [1.0, 1.0, 1.0], resolution=3)
+    with pytest.raises(ValueError):
+        surrogate.get_failure()
@@ -0,0 +1,12 @@
+import numpy as np
+from pymaterial.failures import ThreadedFailure, VonMisesFailure
+
+
+def test_values():
+    failure = VonMisesFailure(2.0)
+    threaded = ThreadedFailure(failure, workers=3, chunk_size=7)
+    stresses = np.random.default_rng(3).normal(size=(5, 10, 3))
+    res = threaded.get_batch_failure(stresses)
+    assert res["mises"].shape == (5, 10)
+    assert np.allclose(res["mises"], failure.get_batch_failure(stresses)["mises"])
+    assert threaded.get_failure([2.0, 0.0, 0.0]) == failure.get_failure([2.0, 0, 0])
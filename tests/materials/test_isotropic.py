@@ -27,3 +27,10 @@ def test_plane_strain_stiffness():
     material = IsotropicMaterial(2.0e5, 0.3, 1000)
     stiff = material.get_plane_strain_stiffness()
     assert stiff.shape == (3, 3)
+
+
+def test_expansion():
+    material = IsotropicMaterial(2.0e5, 0.3, 1000, alpha=1.2e-5, beta=1e-3)
+    assert material.get_thermal_expansion().tolist() == [1.2e-5] * 3 + [0.0] * 3
+    assert material.get_hygral_expansion().tolist() == [1e-3] * 3 + [0.0] * 3
+    assert not IsotropicMaterial(2.0e5, 0.3, 1000).get_thermal_expansion().any()
@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.materials.micromechanics import (
+    METHODS,
+    get_compliance,
+    get_constants,
+    get_plane_stiffness,
+    get_stiffness,
+)
+from pymaterial.combis.clt import LaminationParameters
+
+fiber = dict(E_f_l=230000.0, E_f_t=15000.0, nu_f_lt=0.2, G_f_lt=27000.0)
+matrix = dict(E_m=3500.0, nu_m=0.35)
+densities = dict(density_f=1.8e-9, density_m=1.2e-9)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_limits(method):
+    constants = get_constants(**fiber, **matrix, fiber_volume=0.0, method=method)
+    assert constants["E_l"] == pytest.approx(3500.0)
+    assert constants["E_t"] == pytest.approx(3500.0)
+    assert constants["G_lt"] == pytest.approx(3500.0 / 2.7)
+    assert constants["nu_lt"] == pytest.approx(0.35)
+
+    # equal transverse moduli of fiber and matrix
+    kwargs = dict(fiber, E_f_t=3500.0)
+    constants = get_constants(**kwargs, **matrix, fiber_volume=0.6, method=method)
+    assert constants["E_t"] == pytest.approx(3500.0)
+    assert constants["E_l"] == pytest.approx(0.6 * 230000.0 + 0.4 * 3500.0)
+
+
+def test_bounds():
+    v_f = np.linspace(0.1, 0.7, 7)
+    reuss = get_constants(
+        **fiber, **matrix, fiber_volume=v_f, method="rule-of-mixtures"
+    )
+    for method in ["halpin-tsai", "chamis"]:
+        constants = get_constants(**fiber, **matrix, fiber_volume=v_f, method=method)
+        assert np.all(constants["E_t"] >= reuss["E_t"])
+        assert np.all(constants["G_lt"] >= reuss["G_lt"])
+        assert np.all(np.diff(constants["E_t"]) > 0)
+
+
+def test_voids():
+    v_f = np.linspace(0.5, 0.65, 4)[:, None]
+    v_v = np.array([0.0, 0.02, 0.05])
+    constants = get_constants(
+        **fiber, **matrix, **densities, fiber_volume=v_f, void_content=v_v
+    )
+    for value in constants.values():
+        assert value.shape == (4, 3)
+    assert np.all(np.diff(constants["E_t"], axis=1) < 0)
+    assert np.all(np.diff(constants["density"], axis=1) < 0)
+    assert constants["density"][0, 0] == pytest.approx(0.5 * 1.8e-9 + 0.5 * 1.2e-9)
+
+
+def test_stiffness():
+    constants = get_constants(
+        **fiber, **matrix, **densities, fiber_volume=np.linspace(0.4, 0.7, 5)
+    )
+    compliance = get_compliance(constants)
+    stiffness = get_stiffness(constants)
+    plane = get_plane_stiffness(constants)
+    assert compliance.shape == stiffness.shape == (5, 6, 6)
+    assert plane.shape == (5, 3, 3)
+    for i in range(5):
+        material = TransverselyIsotropicMaterial(
+            **{key: float(value[i]) for key, value in constants.items()}
+        )
+        assert np.allclose(compliance[i], material.get_compliance())
+        assert np.allclose(stiffness[i], material.get_stiffness())
+        assert np.allclose(plane[i], material.get_plane_strain_stiffness())
+
+
+def test_lamination_parameters():
+    constants = get_constants(**fiber, **matrix, fiber_volume=np.linspace(0.4, 0.7, 5))
+    plane = get_plane_stiffness(constants)
+    parameters = np.random.default_rng(0).uniform(-1, 1, 12)
+    abd = LaminationParameters(parameters, 2.0, plane).get_abd()
+    assert abd.shape == (5, 6, 6)
+    for i in range(5):
+        expected = LaminationParameters(parameters, 2.0, plane[i]).get_abd()
+        assert np.allclose(abd[i], expected)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        get_constants(**fiber, **matrix, fiber_volume=0.5, method="mori-tanaka")
+    with pytest.raises(ValueError):
+        get_constants(**fiber, **matrix, fiber_volume=0.7, void_content=0.3)
+
+
+def test_float32():
+    constants = get_constants(**fiber, **matrix, fiber_volume=np.linspace(0.4, 0.7, 5))
+    for function in [get_compliance, get_stiffness, get_plane_stiffness]:
+        single = function(constants, dtype=np.float32)
+        assert single.dtype == np.float32
+        assert np.allclose(single, function(constants), rtol=1e-6, atol=0.0)
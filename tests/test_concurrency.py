@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pymaterial.concurrency import cached, map_batches
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.combis.clt import Ply, Stackup
+
+
+class Counter:
+    def __init__(self):
+        self.value = None
+        self.calls = 0
+
+    def calc(self):
+        self.calls += 1
+        return [self.calls]
+
+
+def test_cached():
+    counter = Counter()
+    first = cached(counter, "value", counter.calc)
+    assert cached(counter, "value", counter.calc) is first
+    assert counter.calls == 1
+
+
+def test_cached_copies():
+    material = TransverselyIsotropicMaterial(
+        E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+    )
+    ply = Ply(material, 0.1, 0.3)
+    getters = [
+        material.get_plane_stress_stiffness,
+        material.get_plane_strain_stiffness,
+        ply.get_stiffness,
+        lambda: ply.get_stiffness(local=True),
+    ]
+    expected = [getter() for getter in getters]
+    for getter in getters:
+        getter()[:] = 0.0
+    for getter, values in zip(getters, expected):
+        assert np.array_equal(getter(), values)
+    assert np.array_equal(Ply(material, 0.1, 0.3).get_stiffness(), expected[2])
+
+
+def test_concurrent_stackup():
+    material = TransverselyIsotropicMaterial(
+        E_l=141000.0, E_t=9340.0, nu_lt=0.35, G_lt=4500.0, density=1.7e-9
+    )
+    stackup = Stackup([Ply(material, 0.1, 0.1 * i) for i in range(50)])
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        inverses = list(pool.map(lambda _: stackup.get_abd_inv(), range(32)))
+        layers = list(pool.map(lambda _: stackup.get_layers(), range(32)))
+    assert all(inverse is inverses[0] for inverse in inverses)
+    assert all(layer is layers[0] for layer in layers)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 3), (4, 3), (4, 100)])
+def test_map_batches(workers, chunk_size):
+    a = np.arange(20.0).reshape(10, 2)
+    b = np.ones((10, 2))
+    result = map_batches(
+        lambda x, y, z: {"sum": x + y, "none": np.full(len(x), z is None)},
+        a,
+        b,
+        None,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    assert np.array_equal(result["sum"], a + b)
+    assert np.all(result["none"])
+    assert np.array_equal(
+        map_batches(np.negative, a, workers=workers, chunk_size=chunk_size), -a
+    )
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, 1), (1, 0)])
+def test_wrong_arguments(workers, chunk_size):
+    with pytest.raises(ValueError):
+        map_batches(np.negative, np.ones(3), workers=workers, chunk_size=chunk_size)
@@ -0,0 +1,106 @@
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+from pymaterial import profiling
+from pymaterial.profiling import Profiler, profile, is_enabled
+from pymaterial.materials import TransverselyIsotropicMaterial
+from pymaterial.failures import CuntzeFailure, MaxStressFailure
+from pymaterial.combis.clt import Ply, Stackup
+
+
+def get_stackup():
+    material = TransverselyIsotropicMaterial(
+        E_l=141000.0,
+        E_t=9340.0,
+        nu_lt=0.35,
+        G_lt=4500.0,
+        density=1.7e-9,
+        failures=[
+            MaxStressFailure([1500.0, 50.0, 70.0]),
+            CuntzeFailure(141000.0, 1500.0, 1200.0, 50.0, 150.0, 70.0),
+        ],
+    )
+    return Stackup([Ply(material, 0.125, angle) for angle in (0.0, 0.7, -0.7, 1.5)])
+
+
+def test_profile():
+    stackup = get_stackup()
+    loads = np.ones((100, 6))
+    with profile() as profiler:
+        assert is_enabled()
+        stackup.analyze(loads)
+        stackup.analyze(loads[:10])
+        stackup.get_plies()[0].get_material().get_plane_stress_stiffness()
+    report = profiler.get_report()
+    stages = report["stages"]
+    assert stages["Stackup.analyze"]["calls"] == 2
+    assert stages["Stackup.analyze"]["elements"] == 110
+    assert stages["Stackup.calc_abd"]["calls"] == 1
+    assert stages["Ply.calc_stiffness"]["calls"] == 4
+    assert stages["CuntzeFailure.get_batch_failure"]["elements"] == 110 * 4 * 2
+    assert stages["Material.get_batch_failure"]["calls"] == 2
+    assert stages["Material.get_plane_stress_stiffness"]["calls"] == 1
+    assert stages["Stackup.analyze"]["time"] >= stages["Stackup.recover"]["time"]
+
+    counters = report["counters"]
+    assert counters["cache.abd_inv.misses"] == 1
+    assert counters["cache.abd_inv.hits"] == 1
+    assert counters["cache.hits"] + counters["cache.misses"] > 2
+    assert counters["linalg.inv"] >= 1
+    assert "Stackup.analyze" in profiler.format_report()
+    json.dumps(report)
+
+
+def test_disabled():
+    original = Stackup.analyze
+    cached = sys.modules["pymaterial.combis.clt.stackup"].cached
+    inv = np.linalg.inv
+    with profile() as profiler:
+        assert Stackup.analyze is not original
+        assert np.linalg.inv is not inv
+    assert not is_enabled()
+    assert Stackup.analyze is original
+    assert sys.modules["pymaterial.combis.clt.stackup"].cached is cached
+    assert np.linalg.inv is inv
+
+    get_stackup().get_abd()
+    assert profiler.get_report()["stages"] == dict()
+
+
+def test_nested():
+    stackup = get_stackup()
+    with profile() as outer:
+        stackup.get_abd()
+        with profile() as inner:
+            stackup.get_abd_inv()
+        assert is_enabled()
+    assert "Stackup.calc_abd_inv" in inner.get_report()["stages"]
+    assert "Stackup.calc_abd" not in inner.get_report()["stages"]
+    assert "Stackup.calc_abd_inv" in outer.get_report()["stages"]
+    assert "Stackup.calc_abd" in outer.get_report()["stages"]
+
+
+def test_enable_disable():
+    profiler = Profiler()
+    assert profiling.enable(profiler) is profiler
+    np.linalg.inv(np.ones((5, 2, 2)) + np.eye(2))
+    profiling.disable(profiler)
+    counters = profiler.get_report()["counters"]
+    assert counters["linalg.inv"] == 1
+    assert counters["linalg.inv.matrices"] == 5
+
+
+def test_environment(tmp_path):
+    path = tmp_path / "report.json"
+    code = (
+        "from pymaterial.combis.clt import Ply, Stackup\n"
+        "from pymaterial.materials import IsotropicMaterial\n"
+        "Stackup([Ply(IsotropicMaterial(210000.0, 0.3, 7.85e-9), 1.0)]).get_abd()\n"
+    )
+    environment = dict(os.environ, PYMATERIAL_PROFILE=str(path))
+    subprocess.run([sys.executable, "-c", code], env=environment, check=True)
+    with open(path) as file:
+        report = json.load(file)
+    assert report["stages"]["Stackup.calc_abd"]["calls"] == 1